@@ -0,0 +1,73 @@
+"""Benchmark Excel reader backends on real exports.
+
+Reads every sheet of each workbook with each installed engine and reports
+rows per second, so the automatic engine choice can be checked against
+the exports we actually receive.
+
+Usage:
+    python benchmarks/bench_excel_backends.py [FILES...] [--repeat N] [--engines E ...]
+"""
+import sys
+import time
+import argparse
+import statistics
+from pathlib import Path
+
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.data_ingestion.excel_backends import ENGINE_MODULES, available_engines, engine_candidates  # noqa: E402
+
+
+def read_all_sheets(file_path: Path, engine: str) -> int:
+    """Parse every sheet and return the total row count."""
+    with pd.ExcelFile(file_path, engine=engine) as workbook:
+        return sum(len(workbook.parse(sheet)) for sheet in workbook.sheet_names)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('files', nargs='*', type=Path,
+                        help='Workbooks to benchmark (default: raw_data/*.xlsx and *.xls)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per file and engine (median is reported)')
+    parser.add_argument('--engines', nargs='+', choices=list(ENGINE_MODULES),
+                        help='Engines to compare (default: every installed one)')
+    args = parser.parse_args()
+
+    files = args.files or sorted((REPO_ROOT / 'raw_data').glob('*.xls*'))
+    engines = args.engines or available_engines()
+    missing = [engine for engine in ENGINE_MODULES if engine not in available_engines()]
+    if missing:
+        print(f"Not installed: {', '.join(missing)}")
+
+    print(f"{'File':<36} {'Engine':<10} {'Rows':>8} {'Median (ms)':>12} {'Rows/s':>12}")
+    totals = {engine: [0, 0.0] for engine in engines}
+
+    for file_path in files:
+        for engine in engines:
+            if engine not in available_engines(file_path.suffix):
+                continue
+            times = []
+            rows = 0
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                rows = read_all_sheets(file_path, engine)
+                times.append(time.perf_counter() - start)
+            median = statistics.median(times)
+            totals[engine][0] += rows
+            totals[engine][1] += median
+            print(f"{file_path.name:<36} {engine:<10} {rows:>8,} {median * 1000:>12.1f} {rows / median:>12,.0f}")
+
+    print()
+    for engine, (rows, seconds) in totals.items():
+        if seconds:
+            print(f"{'All files':<36} {engine:<10} {rows:>8,} {seconds * 1000:>12.1f} {rows / seconds:>12,.0f}")
+    for suffix in sorted({file_path.suffix.lower() for file_path in files}):
+        chosen = engine_candidates(suffix)
+        print(f"Automatic choice for {suffix}: {chosen[0] if chosen else 'pandas default'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,351 @@
+"""Benchmark the audit pipeline phase by phase on a generated dataset.
+
+Generates a synthetic client directory with ``generate_dataset.py`` (or
+reuses one generated earlier with the same arguments, or reads --data-dir)
+and runs data loading, Phase 1, Phase 2 and Phase 3 the way the CLI does,
+with every cache off. For each phase it records the wall time, the peak
+resident memory of the process while the phase ran and how far memory rose
+above where the phase started; with --tracemalloc also the peak of
+Python-level allocations (which slows the run down noticeably).
+
+The report is JSON holding the environment, git commit, dataset and
+options next to the per-phase results, so reports from two releases can
+be compared: --compare prints the change per phase against an earlier
+report and exits non-zero when a phase got slower than --max-slowdown
+allows.
+
+Usage:
+    python benchmarks/bench_pipeline.py [--rows N | --data-dir DIR] [--repeat N] [--output FILE]
+        [--compare REPORT] [--max-slowdown F] [--jobs N] [--analysis-jobs N]
+        [--table-backend B] [--stream-memory-mb M] [--tracemalloc]
+"""
+import os
+import sys
+import json
+import time
+import logging
+import platform
+import resource
+import argparse
+import tempfile
+import threading
+import statistics
+import subprocess
+import tracemalloc
+import multiprocessing
+from datetime import datetime
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from benchmarks.generate_dataset import (  # noqa: E402
+    DatasetSpec, default_out, generate_dataset, read_spec, spec_matches
+)
+from src.analyzers.phase1_orchestrator import Phase1Orchestrator  # noqa: E402
+from src.analyzers.result_cache import code_version  # noqa: E402
+from src.data_ingestion.data_loader import DataLoader  # noqa: E402
+from src.data_ingestion.streaming import DEFAULT_STREAM_MEMORY_BYTES  # noqa: E402
+from src.data_ingestion.table_backends import AUTO_BACKEND, TABLE_BACKENDS  # noqa: E402
+from src.narrative.phase2_generator import Phase2Generator  # noqa: E402
+from src.ppt_generator.phase3_generator import Phase3Generator  # noqa: E402
+
+# Bump when the report layout changes
+REPORT_VERSION = 1
+PHASES = ('load', 'phase1', 'phase2', 'phase3')
+# Slowdown per phase tolerated by --compare before failing
+DEFAULT_MAX_SLOWDOWN = 0.2
+# Phases shorter than this are too noisy to fail a comparison on
+MIN_COMPARED_SECONDS = 0.05
+SAMPLE_INTERVAL = 0.01
+PACKAGES = ['pandas', 'numpy', 'openpyxl', 'pyarrow', 'python-calamine', 'duckdb', 'python-pptx', 'pydantic']
+
+
+class PhaseSample(NamedTuple):
+    """One phase of one run."""
+    seconds: float
+    peak_rss_mb: float
+    rss_growth_mb: float
+    python_peak_mb: Optional[float] = None
+
+
+def peak_rss_mb() -> float:
+    """Peak resident memory of this process so far (MB)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def rss_mb() -> Optional[float]:
+    """Current resident memory of this process (MB), where /proc is available."""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 ** 2
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class MemorySampler:
+    """Polls resident memory on a thread to find the peak within one phase.
+
+    ``ru_maxrss`` only ever grows, so it cannot tell a later phase's peak
+    from an earlier one's; sampling can. Without /proc the process peak so
+    far is reported instead.
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.start_mb = rss_mb()
+        self.peak_mb = self.start_mb
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._poll, daemon=True)
+
+    def _poll(self):
+        while not self._done.wait(self.interval):
+            current = rss_mb()
+            if current is not None and current > self.peak_mb:
+                self.peak_mb = current
+
+    def __enter__(self) -> 'MemorySampler':
+        if self.start_mb is not None:
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._done.set()
+        if self.start_mb is None:
+            self.peak_mb = peak_rss_mb()
+            return
+        self._thread.join()
+        self.peak_mb = max(self.peak_mb, rss_mb() or 0)
+
+
+def measure(step: Callable[[], Any], trace: bool) -> Tuple[Any, PhaseSample]:
+    """Run one phase, timing it and tracking its memory."""
+    if trace:
+        tracemalloc.reset_peak()
+    with MemorySampler() as sampler:
+        start = time.perf_counter()
+        result = step()
+        seconds = time.perf_counter() - start
+    python_peak = tracemalloc.get_traced_memory()[1] / 1024 ** 2 if trace else None
+    growth = sampler.peak_mb - sampler.start_mb if sampler.start_mb is not None else 0.0
+    return result, PhaseSample(seconds, sampler.peak_mb, growth, python_peak)
+
+
+def run_pipeline(data_dir: Path, brand_name: str, website_type: str, options: Dict[str, Any],
+                 trace: bool) -> Tuple[Dict[str, PhaseSample], Dict[str, int]]:
+    """Run every phase once on fresh objects.
+
+    Returns:
+        Tuple of (phase -> sample, loaded rows per frame or table)
+    """
+    samples = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        loader = DataLoader(data_dir, jobs=options['jobs'],
+                            stream_memory_bytes=options['stream_memory_mb'] * 1024 ** 2,
+                            stream_columns=Phase1Orchestrator.stream_columns(),
+                            table_backend=options['table_backend'], table_dir=Path(tmp) / 'tables')
+        try:
+            loaded, samples['load'] = measure(loader.load_all_files, trace)
+            rows = {key: len(df) for key, df in loaded.items()}
+            rows.update({key: len(table) for key, table in loader.tables.items()})
+
+            orchestrator = Phase1Orchestrator(loader, brand_name, website_type, jobs=options['analysis_jobs'])
+            phase1, samples['phase1'] = measure(orchestrator.execute, trace)
+            phase2, samples['phase2'] = measure(Phase2Generator(phase1).execute, trace)
+            output_path = Path(tmp) / 'SEO_Audit_benchmark.pptx'
+            _, samples['phase3'] = measure(lambda: Phase3Generator(phase1, phase2).execute(output_path), trace)
+        finally:
+            loader.close()
+    return samples, rows
+
+
+def summarize(runs: List[Dict[str, PhaseSample]]) -> Dict[str, Dict[str, Any]]:
+    """Per-phase results across runs: median and min time, worst-case memory."""
+    phases = {}
+    for phase in PHASES:
+        samples = [run[phase] for run in runs if phase in run]
+        if not samples:
+            continue
+        python_peaks = [s.python_peak_mb for s in samples if s.python_peak_mb is not None]
+        phases[phase] = {
+            'seconds': round(statistics.median(s.seconds for s in samples), 4),
+            'seconds_min': round(min(s.seconds for s in samples), 4),
+            'runs': [round(s.seconds, 4) for s in samples],
+            'peak_rss_mb': round(max(s.peak_rss_mb for s in samples), 1),
+            'rss_growth_mb': round(statistics.median(s.rss_growth_mb for s in samples), 1),
+            'python_peak_mb': round(max(python_peaks), 1) if python_peaks else None,
+        }
+    return phases
+
+
+def git_revision() -> Dict[str, Any]:
+    """Commit of the working tree and whether it has uncommitted changes."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                                cwd=REPO_ROOT, check=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                                capture_output=True, text=True, cwd=REPO_ROOT, check=True).stdout
+        return {'commit': commit, 'dirty': bool(status.strip())}
+    except (OSError, subprocess.CalledProcessError):
+        return {'commit': None, 'dirty': None}
+
+
+def environment() -> Dict[str, Any]:
+    """Interpreter, machine and library versions the numbers depend on."""
+    packages = {}
+    for package in PACKAGES:
+        try:
+            packages[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            continue
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'packages': packages,
+    }
+
+
+def prepare_dataset(args) -> Tuple[Path, Dict[str, Any]]:
+    """The data directory to benchmark and its description."""
+    if args.data_dir is not None:
+        stored = read_spec(args.data_dir)
+        return args.data_dir, stored or {'path': str(args.data_dir)}
+
+    out = default_out(args.rows)
+    spec = DatasetSpec(args.rows, args.brand, args.seed)
+    stored = read_spec(out)
+    if spec_matches(stored, spec):
+        print(f"Reusing {args.rows:,}-row dataset in {out}")
+        return out, stored
+
+    print(f"Generating {args.rows:,}-row dataset in {out}...")
+    # In a child process, so generation does not count towards peak memory
+    writer = multiprocessing.Process(target=generate_dataset, args=(out, spec, args.jobs))
+    writer.start()
+    writer.join()
+    stored = read_spec(out)
+    if writer.exitcode != 0 or stored is None:
+        sys.exit(f"Could not generate the dataset in {out}")
+    return out, stored
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], max_slowdown: float) -> List[str]:
+    """Print the change per phase against a baseline report; returns the regressions."""
+    if baseline.get('version') != REPORT_VERSION:
+        print(f"Baseline report version {baseline.get('version')} differs from {REPORT_VERSION}; "
+              f"comparing what matches")
+    old_rows = (baseline.get('dataset') or {}).get('rows')
+    new_rows = (report.get('dataset') or {}).get('rows')
+    if old_rows != new_rows:
+        print(f"WARNING: datasets differ ({old_rows} vs {new_rows} rows); times are not comparable")
+    if baseline.get('options') != report.get('options'):
+        print(f"WARNING: options differ ({baseline.get('options')} vs {report.get('options')})")
+
+    old_rev = (baseline.get('git') or {}).get('commit') or '?'
+    print(f"\nAgainst {old_rev[:12]} ({baseline.get('created_at', '?')}):")
+    print(f"{'Phase':<8} {'Before (s)':>11} {'After (s)':>10} {'Change':>8} {'Peak RSS before/after (MB)':>28}")
+    regressions = []
+    for phase, new in report['phases'].items():
+        old = (baseline.get('phases') or {}).get(phase)
+        if not old or not old.get('seconds'):
+            continue
+        change = new['seconds'] / old['seconds'] - 1
+        memory = f"{old.get('peak_rss_mb', 0):,.0f} / {new['peak_rss_mb']:,.0f}"
+        print(f"{phase:<8} {old['seconds']:>11.3f} {new['seconds']:>10.3f} {change:>+8.0%} {memory:>28}")
+        if change > max_slowdown and new['seconds'] >= MIN_COMPARED_SECONDS:
+            regressions.append(f"{phase} is {change:.0%} slower ({old['seconds']:.3f} s -> {new['seconds']:.3f} s)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--rows', type=int, default=100_000, help='Size of the generated dataset')
+    source.add_argument('--data-dir', type=Path, help='Benchmark an existing data directory instead')
+    parser.add_argument('--brand', default='Acme', help='Brand name')
+    parser.add_argument('--website-type', default='ecommerce', help='Website type')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed of the generated dataset')
+    parser.add_argument('--repeat', type=int, default=3, help='Pipeline runs (median times are reported)')
+    parser.add_argument('--jobs', type=int, default=1, help='Processes parsing files')
+    parser.add_argument('--analysis-jobs', type=int, default=1, help='Threads running Phase 1 analyses')
+    parser.add_argument('--table-backend', choices=[AUTO_BACKEND] + TABLE_BACKENDS,
+                        help='Load large CSVs into an on-disk table (default: keep in memory)')
+    parser.add_argument('--stream-memory-mb', type=int, default=DEFAULT_STREAM_MEMORY_BYTES // 1024 ** 2,
+                        help='Size above which CSVs are streamed or go to the table store')
+    parser.add_argument('--tracemalloc', action='store_true', help='Also record Python allocation peaks')
+    parser.add_argument('--output', type=Path,
+                        help='Report file (default: output/benchmarks/pipeline-<rows>-<timestamp>.json)')
+    parser.add_argument('--compare', type=Path, help='Earlier report to compare against')
+    parser.add_argument('--max-slowdown', type=float, default=DEFAULT_MAX_SLOWDOWN,
+                        help='With --compare, fail when a phase is slower by more than this fraction')
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    data_dir, dataset = prepare_dataset(args)
+    options = {
+        'jobs': args.jobs,
+        'analysis_jobs': args.analysis_jobs,
+        'table_backend': args.table_backend,
+        'stream_memory_mb': args.stream_memory_mb,
+        'tracemalloc': args.tracemalloc,
+        'website_type': args.website_type,
+    }
+
+    if args.tracemalloc:
+        tracemalloc.start()
+    runs, rows = [], {}
+    for i in range(args.repeat):
+        samples, rows = run_pipeline(data_dir, args.brand, args.website_type, options, args.tracemalloc)
+        runs.append(samples)
+        print(f"Run {i + 1}/{args.repeat}: " + ', '.join(f"{phase} {s.seconds:.2f} s" for phase, s in samples.items()))
+
+    created = datetime.now()
+    report = {
+        'version': REPORT_VERSION,
+        'created_at': created.isoformat(timespec='seconds'),
+        'git': git_revision(),
+        'code_version': code_version(),
+        'environment': environment(),
+        'dataset': {**dataset, 'path': str(data_dir), 'loaded_rows': rows},
+        'options': options,
+        'repeat': args.repeat,
+        'phases': summarize(runs),
+        'process_peak_rss_mb': round(peak_rss_mb(), 1),
+    }
+    report['total_seconds'] = round(sum(phase['seconds'] for phase in report['phases'].values()), 4)
+
+    print(f"\n{'Phase':<8} {'Median (s)':>11} {'Min (s)':>9} {'Peak RSS (MB)':>14} {'Growth (MB)':>12}"
+          + (f" {'Python peak (MB)':>17}" if args.tracemalloc else ''))
+    for phase, result in report['phases'].items():
+        print(f"{phase:<8} {result['seconds']:>11.3f} {result['seconds_min']:>9.3f} "
+              f"{result['peak_rss_mb']:>14,.0f} {result['rss_growth_mb']:>12,.0f}"
+              + (f" {result['python_peak_mb']:>17,.1f}" if args.tracemalloc else ''))
+    print(f"{'total':<8} {report['total_seconds']:>11.3f}")
+
+    output = args.output or REPO_ROOT / 'output' / 'benchmarks' / \
+        f"pipeline-{dataset.get('rows', 'custom')}-{created:%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, default=str)
+    print(f"\nReport: {output}")
+
+    if args.compare is None:
+        return
+    with open(args.compare, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare(report, baseline, args.max_slowdown)
+    print()
+    for regression in regressions:
+        print(f"FAIL: {regression}")
+    if not regressions:
+        print(f"OK: no phase slower by more than {args.max_slowdown:.0%}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
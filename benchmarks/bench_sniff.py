@@ -0,0 +1,100 @@
+"""Benchmark header sniffing against a full pandas workbook open.
+
+Compares, per workbook, the time to get the sheet list and header row via
+``pd.ExcelFile`` + ``parse(nrows=5)`` (the previous detection path) with
+``WorkbookSession`` header sniffing, and checks both detect the same tool.
+
+Usage:
+    python benchmarks/bench_sniff.py [FILES...] [--repeat N] [--synthetic-rows N]
+"""
+import sys
+import time
+import argparse
+import logging
+import statistics
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.data_ingestion.data_loader import DataLoader  # noqa: E402
+from src.data_ingestion.workbook_session import WorkbookSession  # noqa: E402
+
+
+def full_open(file_path: Path):
+    """Previous detection path: build the workbook, then read five rows."""
+    with pd.ExcelFile(file_path) as workbook:
+        sheet_names = workbook.sheet_names
+        columns = list(workbook.parse(0, nrows=5).columns)
+    return sheet_names, columns
+
+
+def sniff(file_path: Path):
+    """Header-only path used by ``DataLoader.detect_file_type``."""
+    with WorkbookSession(file_path) as session:
+        sheet_names = session.sheet_names
+        columns = list(session.read_header(0, nrows=0).columns)
+    return sheet_names, columns
+
+
+def median_seconds(func, file_path: Path, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(file_path)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def make_synthetic(directory: Path, rows: int) -> Path:
+    """Write a Screaming Frog-shaped workbook with many unique strings."""
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('internal_all')
+    sheet.append(['Address', 'Status Code', 'Title 1', 'Meta Description 1', 'Word Count'])
+    for i in range(rows):
+        sheet.append([f"https://example.com/page-{i}", 200, f"Page title {i}",
+                      f"Description of page {i}", i % 2000])
+    path = directory / f"synthetic_{rows}.xlsx"
+    workbook.save(path)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('files', nargs='*', type=Path,
+                        help='Workbooks to benchmark (default: raw_data/*.xlsx)')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per file (median is reported)')
+    parser.add_argument('--synthetic-rows', type=int, default=0,
+                        help='Also benchmark a generated workbook with this many rows')
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    files = args.files or sorted((REPO_ROOT / 'raw_data').glob('*.xlsx'))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.synthetic_rows:
+            print(f"Generating synthetic workbook with {args.synthetic_rows:,} rows...")
+            files.append(make_synthetic(Path(tmp), args.synthetic_rows))
+
+        loader = DataLoader(REPO_ROOT / 'raw_data')
+        print(f"{'File':<36} {'Size (MB)':>10} {'Full (ms)':>10} {'Sniff (ms)':>11} {'Speedup':>8}  Tool")
+
+        for file_path in files:
+            assert full_open(file_path) == sniff(file_path), f"Header mismatch for {file_path.name}"
+
+            full = median_seconds(full_open, file_path, args.repeat)
+            sniffed = median_seconds(sniff, file_path, args.repeat)
+            tool = loader.detect_file_type(file_path) or '-'
+            size_mb = file_path.stat().st_size / 1024 ** 2
+
+            print(f"{file_path.name:<36} {size_mb:>10.2f} {full * 1000:>10.1f} "
+                  f"{sniffed * 1000:>11.1f} {full / sniffed:>7.1f}x  {tool}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""Benchmark CLI startup time against a budget.
+
+Runs ``seo_audit_tool.py`` under ``python -X importtime`` (``--help`` by
+default) and reports the wall time, the time spent importing and the
+slowest top-level imports. It exits non-zero when the median import time
+exceeds the budget or a module that should load lazily (pandas, python-pptx,
+questionary, ...) is imported at startup, so it can gate CI.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat N] [--budget-ms MS] [--top N] [-- CLI ARGS...]
+"""
+import re
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+ENTRY_POINT = REPO_ROOT / 'seo_audit_tool.py'
+
+# Import time (ms) the CLI may spend before running a command
+DEFAULT_BUDGET_MS = 250.0
+# Modules only the phases that need them may import
+LAZY_MODULES = ['pandas', 'numpy', 'pptx', 'questionary', 'prompt_toolkit', 'openpyxl', 'pyarrow',
+                'pydantic', 'src.data_ingestion.data_loader', 'src.analyzers.phase1_orchestrator',
+                'src.narrative.phase2_generator', 'src.ppt_generator.phase3_generator',
+                'src.service.server']
+
+# "import time: self [us] | cumulative | imported package", indented per nesting level
+_IMPORT_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """Parse ``-X importtime`` output into (module, depth, cumulative microseconds)."""
+    imports = []
+    for line in stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match:
+            depth = (len(match.group(3)) - 1) // 2
+            imports.append((match.group(4), depth, int(match.group(2))))
+    return imports
+
+
+def run_once(cli_args: List[str]) -> Tuple[float, List[Tuple[str, int, int]]]:
+    """Start the CLI once; returns (wall seconds, parsed imports)."""
+    start = time.perf_counter()
+    completed = subprocess.run([sys.executable, '-X', 'importtime', str(ENTRY_POINT), *cli_args],
+                               capture_output=True, text=True, cwd=REPO_ROOT)
+    wall = time.perf_counter() - start
+    return wall, parse_importtime(completed.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='Runs (medians are reported)')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help='Fail when the median import time exceeds this')
+    parser.add_argument('--top', type=int, default=10, help='Slowest top-level imports to list')
+    parser.add_argument('cli_args', nargs='*', help='Arguments for seo_audit_tool.py (default: --help)')
+    args = parser.parse_args()
+    cli_args = args.cli_args or ['--help']
+
+    walls, import_totals = [], []
+    top_level: Dict[str, List[int]] = {}
+    loaded = set()
+    for _ in range(args.repeat):
+        wall, imports = run_once(cli_args)
+        walls.append(wall)
+        import_totals.append(sum(us for _, depth, us in imports if depth == 0) / 1000)
+        for module, depth, us in imports:
+            loaded.add(module)
+            if depth == 0:
+                top_level.setdefault(module, []).append(us)
+
+    import_ms = statistics.median(import_totals)
+    print(f"Command: seo_audit_tool.py {' '.join(cli_args)} ({args.repeat} runs)")
+    print(f"Wall time (median):   {statistics.median(walls) * 1000:8.1f} ms")
+    print(f"Import time (median): {import_ms:8.1f} ms (budget {args.budget_ms:.0f} ms)")
+    print()
+    print(f"{'Top-level import':<48} {'Median (ms)':>12}")
+    slowest = sorted(top_level.items(), key=lambda item: -statistics.median(item[1]))
+    for module, times in slowest[:args.top]:
+        print(f"{module:<48} {statistics.median(times) / 1000:>12.1f}")
+
+    failures = []
+    if import_ms > args.budget_ms:
+        failures.append(f"import time {import_ms:.1f} ms is over the {args.budget_ms:.0f} ms budget")
+    eager = [module for module in LAZY_MODULES if module in loaded]
+    if eager:
+        failures.append(f"imported at startup but should load lazily: {', '.join(eager)}")
+
+    print()
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if not failures:
+        print("OK: within the startup budget")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""Benchmark the on-disk table backend on a generated backlinks export.
+
+Writes an Ahrefs-shaped backlinks CSV of the requested size in chunks,
+loads it into each table backend and runs a referring-domain aggregation,
+reporting load and query time and the process's peak memory. Peak memory
+should stay near the memory budget whatever the row count.
+
+Usage:
+    python benchmarks/bench_table_store.py [--rows N] [--memory-mb M] [--backends B ...] [--pandas]
+"""
+import sys
+import time
+import argparse
+import logging
+import resource
+import tempfile
+import multiprocessing
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.data_ingestion.table_backends import TABLE_BACKENDS  # noqa: E402
+from src.data_ingestion.table_store import FrameTable, TableStore, resolve_backend  # noqa: E402
+
+WRITE_CHUNK_ROWS = 500_000
+AGGREGATION = {
+    'links': ('*', 'count'),
+    'pages': ('Referring page URL', 'nunique'),
+    'avg_dr': ('Domain rating', 'mean'),
+}
+
+
+def peak_rss_mb() -> float:
+    """Peak resident memory of this process so far (MB)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def make_backlinks(path: Path, rows: int):
+    """Write a backlinks CSV chunk by chunk."""
+    rng = np.random.default_rng(0)
+    for start in range(0, rows, WRITE_CHUNK_ROWS):
+        n = min(WRITE_CHUNK_ROWS, rows - start)
+        ids = np.arange(start, start + n)
+        pd.DataFrame({
+            'Referring page URL': [f"https://site{i % 50000}.com/post-{i}" for i in ids],
+            'Domain rating': rng.integers(0, 100, n),
+            'Target URL': rng.choice(['https://example.com/', 'https://example.com/shop',
+                                      'https://example.com/blog'], n),
+            'Anchor': rng.choice(['example', 'click here', 'best shop', ''], n),
+        }).to_csv(path, mode='w' if start == 0 else 'a', header=start == 0, index=False)
+
+
+def run_query(table):
+    return table.aggregate(['Target URL'], AGGREGATION, where={'Domain rating': ('>=', 30)},
+                           order_by='links')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=2_000_000, help='Rows in the generated export')
+    parser.add_argument('--memory-mb', type=int, default=64, help='Memory budget for loading and queries')
+    parser.add_argument('--backends', nargs='+', choices=TABLE_BACKENDS,
+                        help='Backends to compare (default: every installed one)')
+    parser.add_argument('--pandas', action='store_true',
+                        help='Also read the whole export into pandas (needs it to fit in memory)')
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    backends = args.backends or sorted({resolve_backend(backend) for backend in TABLE_BACKENDS})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / 'backlinks.csv'
+        print(f"Generating {args.rows:,} backlinks...")
+        # In a child process, so generation does not count towards peak memory
+        writer = multiprocessing.Process(target=make_backlinks, args=(csv_path, args.rows))
+        writer.start()
+        writer.join()
+        print(f"CSV size: {csv_path.stat().st_size / 1024 ** 2:,.0f} MB, "
+              f"memory budget: {args.memory_mb} MB\n")
+
+        print(f"{'Backend':<10} {'Load (s)':>10} {'Query (s)':>10} {'Peak RSS (MB)':>14}")
+        for backend in backends:
+            store = TableStore(Path(tmp) / backend, backend, args.memory_mb * 1024 ** 2)
+            start = time.perf_counter()
+            table = store.load_csv('backlinks', csv_path)
+            loaded = time.perf_counter() - start
+
+            start = time.perf_counter()
+            result = run_query(table)
+            queried = time.perf_counter() - start
+            store.close()
+            print(f"{store.backend:<10} {loaded:>10.2f} {queried:>10.2f} {peak_rss_mb():>14,.0f}")
+
+        if args.pandas:
+            start = time.perf_counter()
+            frame = FrameTable(pd.read_csv(csv_path))
+            loaded = time.perf_counter() - start
+            start = time.perf_counter()
+            run_query(frame)
+            queried = time.perf_counter() - start
+            print(f"{'pandas':<10} {loaded:>10.2f} {queried:>10.2f} {peak_rss_mb():>14,.0f}")
+
+        print()
+        print(result.to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,584 @@
+"""Generate a synthetic client data directory at a chosen scale.
+
+Writes GA4, GSC, SEMrush, Ahrefs and Screaming Frog exports laid out like
+the samples in ``raw_data/`` (see ``schema/*.md``). Sheet-based reports
+(GA4 multi-header reports, the GSC performance workbook, the Ahrefs
+competitor matrices, SEMrush domain overview, Screaming Frog issues) are
+workbooks of their usual size. The row-heavy exports (queries, pages,
+keywords, keyword gap, backlinks, crawled URLs) are CSVs sized from
+--rows and written in chunks, so 10M rows need no more memory than 10k.
+
+Values follow the shapes of real exports: a few queries and pages take
+most clicks, CTR falls with position, backlinks come from a long tail of
+referring domains. The same arguments always give the same files.
+
+Usage:
+    python benchmarks/generate_dataset.py [--rows N] [--out DIR] [--tools T ...] [--brand NAME]
+        [--seed S] [--jobs N]
+"""
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+TOOLS = ('ga4', 'gsc', 'semrush', 'ahrefs', 'screaming_frog')
+# Bump when the generated files change, so cached datasets are regenerated
+GENERATOR_VERSION = 1
+DATASET_FILE = 'dataset.json'
+WRITE_CHUNK_ROWS = 500_000
+# Exports end here (the samples cover Jan-Oct 2025), so runs are reproducible
+END_DATE = date(2025, 10, 31)
+MONTHS = 12
+# GSC's web UI exports at most 1,000 rows per table
+GSC_UI_ROWS = 1000
+
+COMPETITORS = ['northwind.com', 'globex.com', 'initech.com.sg', 'umbrella.co', 'hooli.io', 'vandelay.sg']
+CHANNELS = ['Direct', 'Organic Search', 'Referral', 'Organic Social', 'Unassigned', 'Email',
+            'Paid Search', 'Paid Social', 'Organic Shopping', 'Organic Video', 'Paid Other']
+CHANNEL_SHARES = [0.34, 0.30, 0.08, 0.07, 0.05, 0.04, 0.05, 0.03, 0.015, 0.01, 0.005]
+COUNTRIES = ['Singapore', 'United States', 'India', 'Philippines', 'Malaysia', 'Vietnam', 'Indonesia',
+             'United Kingdom', 'Canada', 'Australia', 'Thailand', 'Japan', 'Germany', 'Hong Kong',
+             'China', 'France', 'South Korea', 'Taiwan', 'Netherlands', 'Brazil']
+GA4_METRICS = ['Sessions', 'Active users', 'Engagement rate', 'Engaged sessions', 'Average session duration']
+AHREFS_BENCHMARKING_METRICS = ['Avg. organic traffic', 'Avg. Organic pages', 'Organic position',
+                               'Referring domains']
+AHREFS_POSITION_BUCKETS = ['Rank 1-3', 'Rank 4-10', 'Rank 11-20', 'Rank 21-50']
+SECTIONS = ['blog', 'products', 'services', 'guides', 'news', 'category', 'case-studies', 'resources']
+TLDS = ['com', 'net', 'org', 'io', 'co', 'sg', 'com.sg', 'co.uk', 'de', 'com.au']
+ANCHORS = ['click here', 'website', 'read more', 'source', 'here', 'learn more', 'this guide', '']
+# Keyword vocabulary; phrases encode the row id in base len(WORDS), so they never repeat
+WORDS = [
+    'best', 'cheap', 'buy', 'online', 'near', 'me', 'how', 'to', 'what', 'is', 'top', 'review',
+    'reviews', 'price', 'prices', 'cost', 'free', 'guide', 'tips', 'ideas', 'agency', 'service',
+    'services', 'company', 'singapore', 'digital', 'marketing', 'seo', 'web', 'design', 'website',
+    'app', 'software', 'tool', 'tools', 'strategy', 'social', 'media', 'content', 'brand', 'local',
+    'ecommerce', 'shop', 'store', 'sale', 'deals', 'discount', 'shoes', 'bags', 'watch', 'phone',
+    'laptop', 'camera', 'coffee', 'tea', 'skincare', 'fitness', 'yoga', 'travel', 'hotel', 'flights',
+    'insurance', 'loan', 'bank', 'course', 'training', 'jobs', 'salary', 'vs', 'alternative',
+    'comparison', 'examples', 'template', 'checklist', '2025', 'now', 'delivery', 'same', 'day',
+    'eco', 'friendly', 'organic', 'vegan', 'kids', 'women', 'men', 'gift', 'wedding', 'office',
+    'home', 'garden', 'kitchen', 'furniture', 'lighting', 'repair', 'rental', 'wholesale', 'custom',
+    'premium',
+]
+_WORDS = np.array(WORDS, dtype=object)
+
+
+class DatasetSpec(NamedTuple):
+    """What to generate; recorded in ``dataset.json``."""
+    rows: int
+    brand: str = 'Acme'
+    seed: int = 0
+    tools: Tuple[str, ...] = TOOLS
+
+    @property
+    def domain(self) -> str:
+        """The brand's site, listed first in competitor reports."""
+        return f"{''.join(ch for ch in self.brand.lower() if ch.isalnum()) or 'client'}.com"
+
+
+class Export(NamedTuple):
+    """One generated file."""
+    name: str
+    tool: str
+    # Rows as a share of --rows; 0 for reports of a fixed size
+    share: float
+    write: Callable[[Path, int, DatasetSpec, np.random.Generator], int]
+
+
+def phrases(ids: np.ndarray) -> pd.Series:
+    """Distinct keyword phrases for row ids (two words, more as ids grow)."""
+    base = len(_WORDS)
+    text = pd.Series(_WORDS[ids % base]) + ' ' + pd.Series(_WORDS[(ids // base) % base])
+    for power in (2, 3, 4):
+        more = ids >= base ** power
+        if not more.any():
+            break
+        words = pd.Series(_WORDS[(ids // base ** power) % base])
+        text = text.where(~more, text + ' ' + words)
+    return text
+
+
+def page_urls(domain: str, ids: np.ndarray) -> pd.Series:
+    """Page URLs of a site; id 0 is the home page."""
+    slugs = phrases(ids).str.replace(' ', '-', regex=False)
+    sections = pd.Series(np.array(SECTIONS, dtype=object)[ids % len(SECTIONS)])
+    urls = f"https://www.{domain}/" + sections + '/' + slugs
+    return urls.where(ids != 0, f"https://www.{domain}/")
+
+
+def expected_ctr(position: np.ndarray) -> np.ndarray:
+    """Click-through rate by average position (about 30% at 1, under 1% past page 2)."""
+    return 0.3 * np.exp(-0.28 * (position - 1))
+
+
+def trends(rng: np.random.Generator, n: int) -> np.ndarray:
+    """SEMrush 12-month trend strings, drawn from a small pool like real exports."""
+    pool = [','.join(f"{value:.2f}" for value in rng.random(MONTHS)) for _ in range(64)]
+    return rng.choice(np.array(pool, dtype=object), n)
+
+
+def month_starts() -> pd.DatetimeIndex:
+    """First days of the months covered, oldest first."""
+    return pd.date_range(end=pd.Timestamp(END_DATE), periods=MONTHS, freq='MS')
+
+
+def write_csv(path: Path, rows: int, make_chunk: Callable[[np.ndarray], pd.DataFrame]) -> int:
+    """Write a CSV chunk by chunk; returns the rows written."""
+    for start in range(0, rows, WRITE_CHUNK_ROWS):
+        ids = np.arange(start, min(start + WRITE_CHUNK_ROWS, rows))
+        make_chunk(ids).to_csv(path, mode='w' if start == 0 else 'a', header=start == 0, index=False)
+    return rows
+
+
+def write_workbook(path: Path, sheets: Dict[str, pd.DataFrame], header: bool = True) -> int:
+    """Write sheets to one workbook; returns the rows of the first sheet."""
+    with pd.ExcelWriter(path, engine='openpyxl') as writer:
+        for name, df in sheets.items():
+            df.to_excel(writer, sheet_name=name, index=False, header=header)
+    return len(next(iter(sheets.values())))
+
+
+def performance_frame(rng: np.random.Generator, ids: np.ndarray, label: str, values) -> pd.DataFrame:
+    """GSC performance rows (clicks, impressions, CTR, position), busiest first on average."""
+    n = len(ids)
+    position = np.clip(1 + rng.gamma(1.6, 9.0, n), 1, 100).round(2)
+    impressions = np.maximum(1, rng.lognormal(5.0, 1.4, n) * 20 / np.sqrt(1 + ids / 50)).astype(np.int64)
+    clicks = rng.binomial(impressions, expected_ctr(position))
+    return pd.DataFrame({
+        label: values,
+        'Clicks': clicks,
+        'Impressions': impressions,
+        'CTR': np.round(clicks / impressions, 4),
+        'Position': position,
+    })
+
+
+# --- GA4 (schema/ga4_schema.md) ---
+
+def _comment_block(spec: DatasetSpec, report: str) -> List[list]:
+    start = month_starts()[0]
+    return [
+        ['# ----------------------------------------'],
+        [f"# https://www.{spec.domain}/ - GA4"],
+        [f"# {MONTHS} Months-{report}"],
+        [f"# {start:%Y%m%d}-{END_DATE:%Y%m%d}"],
+        ['# ----------------------------------------'],
+        [],
+    ]
+
+
+def _ga4_cells(rng: np.random.Generator, sessions: np.ndarray) -> np.ndarray:
+    """Five GA4 metrics for an array of session counts (metrics on the last axis)."""
+    active = np.round(sessions * rng.uniform(0.7, 0.95, sessions.shape))
+    rate = rng.uniform(0.25, 0.75, sessions.shape)
+    engaged = np.round(sessions * rate)
+    duration = rng.uniform(20, 300, sessions.shape)
+    return np.stack([sessions, active, rate, engaged, duration], axis=-1)
+
+
+def _totals(cells: np.ndarray, axis: int) -> np.ndarray:
+    """Aggregate GA4 metrics over an axis: counts add up, rates are session-weighted."""
+    sessions = cells[..., 0].sum(axis=axis)
+    totals = cells.sum(axis=axis)
+    weights = np.where(sessions > 0, sessions, 1)
+    totals[..., 2] = totals[..., 3] / weights
+    totals[..., 4] = (cells[..., 4] * cells[..., 0]).sum(axis=axis) / weights
+    return totals
+
+
+def _ga4_sheet(spec: DatasetSpec, report: str, group_label: str, groups: List, row_label: str,
+               rows: List, cells: np.ndarray) -> pd.DataFrame:
+    """Lay a (row, group, metric) array out as a GA4 multi-header sheet."""
+    width = len(GA4_METRICS)
+    grand = _totals(_totals(cells, 0)[None], 1)[0]
+    by_row = _totals(cells, 1)
+    by_group = _totals(cells, 0)
+    lines = _comment_block(spec, report)
+    lines.append([group_label] + [group for group in groups for _ in range(width)] + ['Totals'] * width)
+    lines.append([row_label] + GA4_METRICS * (len(groups) + 1))
+    lines.append([None] + list(by_group.ravel()) + list(grand))
+    for i, row in enumerate(rows):
+        lines.append([row] + list(cells[i].ravel()) + list(by_row[i]))
+    return pd.DataFrame(lines)
+
+
+def write_ga4_channels(path: Path, rows: int, spec: DatasetSpec, rng: np.random.Generator) -> int:
+    months = list(month_starts().month)
+    monthly = max(rows, 1000) / 20 * rng.uniform(0.8, 1.2, len(months))
+    sessions = np.round(np.outer(CHANNEL_SHARES, monthly) * rng.uniform(0.7, 1.3, (len(CHANNELS), len(months))))
+    sheet = _ga4_sheet(spec, 'Session Default Channel Group', 'Month', months,
+                       'Session default channel group', CHANNELS, _ga4_cells(rng, sessions))
+    return write_workbook(path, {'Session Default Channel Group': sheet}, header=False)
+
+
+def write_ga4_countries(path: Path, rows: int, spec: DatasetSpec, rng: np.random.Generator) -> int:
+    months = list(month_starts().month)
+    shares = np.sort(rng.pareto(1.5, len(COUNTRIES)) + 0.01)[::-1]
+    shares /= shares.sum()
+    monthly = max(rows, 1000) / 20 * rng.uniform(0.8, 1.2, len(months))
+    # (month, country)
+    sessions = np.round(np.outer(monthly, shares) * rng.uniform(0.7, 1.3, (len(months), len(COUNTRIES))))
+    sheet = _ga4_sheet(spec, 'Country', 'Country', COUNTRIES, 'Month', months, _ga4_cells(rng, sessions))
+    return write_workbook(path, {'Country': sheet}, header=False)
+
+
+# --- GSC (schema/gsc_schema.md) ---
+
+def write_gsc_workbook(path: Path, rows: int, spec: DatasetSpec, rng: np.random.Generator) -> int:
+    ui_rows = np.arange(min(rows, GSC_UI_ROWS))
+    days = pd.date_range(end=pd.Timestamp(END_DATE), periods=365, freq='D')[::-1]
+    sheets = {
+        'Queries': performance_frame(rng, ui_rows, 'Top queries', phrases(ui_rows)),
+        'Pages': performance_frame(rng, ui_rows, 'Top pages', page_urls(spec.domain, ui_rows)),
+        'Countries': performance_frame(rng, np.arange(len(COUNTRIES)), 'Country', COUNTRIES),
+        'Devices': performance_frame(rng, np.arange(3), 'Device', ['Desktop', 'Mobile', 'Tablet']),
+        'Search appearance': performance_frame(rng, np.arange(2), 'Search Appearance',
+                                               ['AMP non-rich results', 'Translated results']),
+        'Dates': performance_frame(rng, np.full(len(days), 50), 'Date', days),
+        'Filters': pd.DataFrame({'Filter': ['Search type', 'Date'], 'Value': ['Web', 'Last 12 months']}),
+    }
+    return write_workbook(path, sheets)
+
+
+def write_gsc_queries(path: Path, rows: int, spec: DatasetSpec, rng: np.random.Generator) -> int:
+    return write_csv(path, rows, lambda ids: performance_frame(rng, ids, 'Top queries', phrases(ids)))
+
+
+def write_gsc_pages(path: Path, rows: int, spec: DatasetSpec, rng: np.random.Generator) -> int:
+    return write_csv(path, rows, lambda ids: performance_frame(rng, ids, 'Top pages', page_urls(spec.domain, ids)))
+
+
+# --- SEMrush (schema/semrush_schema.md) ---
+
+def write_semrush_overview(path: Path, rows: int, spec: DatasetSpec, rng: np.random.Generator) -> int:
+    domains = [spec.domain] + COMPETITORS
+    n = len(domains)
+    keywords = np.round(rng.lognormal(6.5, 0.8, n) * max(rows, 1000) / 100_000).astype(int) + 50
+    overview = pd.DataFrame({
+        'Domain': [f"https://{domain}/" for domain in domains],
+        'Authority score': rng.integers(15, 60, n),
+        'Org. Traffic': np.round(keywords * rng.uniform(2, 20, n)).astype(int),
+        'Org. Keywords': keywords,
+        'Backlinks': np.round(keywords * rng.uniform(5, 100, n)).astype(int),
+        'Ref. Domains': np.round(keywords * rng.uniform(0.5, 5, n)).astype(int),
+        'Traffic share': np.nan,
+        'Non-branded': np.nan,
+        'Branded': np.nan,
+    })
+    return write_workbook(path, {'Domain Overview': overview})
+
+
+def write_semrush_keywords(path: Path, rows: int, spec: DatasetSpec, rng: np.random.Generator) -> int:
+    def chunk(ids: np.ndarray) -> pd.DataFrame:
+        n = len(ids)
+        position = np.minimum(100, 1 + rng.gamma(1.5, 15, n).astype(int))
+        previous = np.clip(position + rng.integers(-5, 6, n), 1, 100)
+        volume = np.maximum(10, np.round(rng.lognormal(5.0, 1.5, n), -1)).astype(np.int64)
+        traffic = np.round(volume * expected_ctr(position), 2)
+        return pd.DataFrame({
+            'Url': page_urls(spec.domain, ids // 8),
+            'Keyword': phrases(ids),
+            'Position': position,
+            'Previous Position': previous,
+            'Position Diff': previous - position,
+            'Search Volume': volume,
+            'Traffic': traffic,
+            'Traffic Cost': np.round(traffic * rng.lognormal(0, 0.8, n), 2),
+            'Competition': np.round(rng.random(n), 2),
+            'Number of Results': rng.integers(10, 500_000_000, n),
+            'Trends': trends(rng, n),
+        })
+    return write_csv(path, rows, chunk)
+
+
+def write_semrush_keyword_gap(path: Path, rows: int, spec: DatasetSpec, rng: np.random.Generator) -> int:
+    competitors = np.array(COMPETITORS, dtype=object)
+
+    def chunk(ids: np.ndarray) -> pd.DataFrame:
+        n = len(ids)
+        # Offset so gap keywords differ from the brand's own
+        keywords = phrases(ids + len(WORDS) ** 3)
+        domains = rng.choice(competitors, n)
+        position = np.minimum(100, 1 + rng.gamma(1.5, 12, n).astype(int))
+        volume = np.maximum(10, np.round(rng.lognormal(5.0, 1.6, n), -1)).astype(np.int64)
+        traffic = np.round(volume * expected_ctr(position), 2)
+        return pd.DataFrame({
+            'Keyword': keywords,
+            'Search Volume': volume,
+            'Gap Type': rng.choice(['Missing', 'Weak', 'Untapped'], n, p=[0.6, 0.25, 0.15]),
+            'Best Competitor Domain': domains,
+            'Best Competitor Position': position,
+            'Best Competitor URL': 'https://www.' + pd.Series(domains) + '/' + keywords.str.replace(' ', '-', regex=False),
+            'Best Competitor Traffic': traffic,
+            'Best Competitor Traffic Cost': np.round(traffic * rng.lognormal(0, 0.8, n), 2),
+            'Competition': np.round(rng.random(n), 2),
+            'Number of Results': rng.integers(10, 500_000_000, n),
+            'Trends': trends(rng, n),
+        })
+    return write_csv(path, rows, chunk)
+
+
+# --- Ahrefs (schema/ahrefs_schema.md) ---
+
+def _competitor_matrix(spec: DatasetSpec, metrics: List[str], values: np.ndarray) -> pd.DataFrame:
+    """Transposed Ahrefs sheet from a (domain, metric, month) array."""
+    domains = [f"https://{domain}/" for domain in [spec.domain] + COMPETITORS]
+    lines = [
+        ['Domain'] + [domain for domain in domains for _ in metrics],
+        ['Metric'] + metrics * len(domains),
+    ]
+    for m, month in enumerate(month_starts()):
+        lines.append([month.to_pydatetime()] + list(values[:, :, m].ravel()))
+    return pd.DataFrame(lines)
+
+
+def write_ahrefs_matrices(path: Path, rows: int, spec: DatasetSpec, rng: np.random.Generator) -> int:
+    n = 1 + len(COMPETITORS)
+    scale = max(rows, 1000) / 1000
+    trend = np.cumprod(rng.uniform(0.9, 1.12, (n, MONTHS)), axis=1)
+    traffic = np.round(rng.lognormal(5.5, 1.0, (n, 1)) * scale * trend)
+    pages = np.round(traffic / rng.uniform(20, 80, (n, 1)))
+    position = np.round(rng.uniform(8, 40, (n, 1)) / trend)
+    referring = np.round(rng.lognormal(6, 0.8, (n, 1)) * np.sqrt(scale) * trend)
+    benchmarking = np.stack([traffic, pages, position, referring], axis=1).astype(int)
+
+    keywords = pages * rng.uniform(2, 6, (n, 1))
+    buckets = np.stack([keywords * share for share in (0.08, 0.17, 0.25, 0.5)], axis=1)
+    position_rank = np.round(buckets * rng.uniform(0.85, 1.15, buckets.shape)).astype(int)
+
+    return write_workbook(path, {
+        'Organic Benchmarking': _competitor_matrix(spec, AHREFS_BENCHMARKING_METRICS, benchmarking),
+        'Organic Position Rank': _competitor_matrix(spec, AHREFS_POSITION_BUCKETS, position_rank),
+    }, header=False)
+
+
+def write_ahrefs_backlinks(path: Path, rows: int, spec: DatasetSpec, rng: np.random.Generator) -> int:
+    referring_domains = max(50, rows // 20)
+    targets = page_urls(spec.domain, np.arange(50)).to_numpy()
+    target_weights = 1 / np.arange(1, 51) ** 1.2
+    target_weights /= target_weights.sum()
+    anchors = np.array(ANCHORS + [spec.brand, spec.domain, f"{spec.brand} reviews"], dtype=object)
+    end = np.datetime64(END_DATE)
+
+    def chunk(ids: np.ndarray) -> pd.DataFrame:
+        n = len(ids)
+        # Long tail: a few domains link many times, most link once or twice
+        domain_ids = (rng.pareto(1.1, n) * 50).astype(np.int64) % referring_domains
+        hosts = 'site' + pd.Series(domain_ids).astype(str) + '.' + \
+            pd.Series(np.array(TLDS, dtype=object)[domain_ids % len(TLDS)])
+        rating = (domain_ids * 2654435761 % 97).astype(int)
+        age = rng.integers(0, 1500, n)
+        first_seen = end - age.astype('timedelta64[D]')
+        last_seen = end - (rng.random(n) * age).astype('timedelta64[D]')
+        return pd.DataFrame({
+            'Referring page title': phrases(ids).str.title(),
+            'Referring page URL': 'https://' + hosts + '/' + phrases(ids).str.replace(' ', '-', regex=False),
+            'Referring page HTTP code': rng.choice([200, 200, 200, 200, 301, 404], n),
+            'Domain rating': rating,
+            'UR': np.floor(rng.random(n) * (rating + 1)).astype(int),
+            'External links': rng.integers(1, 200, n),
+            'Target URL': rng.choice(targets, n, p=target_weights),
+            'Anchor': rng.choice(anchors, n),
+            'Type': rng.choice(['text', 'image', 'redirect'], n, p=[0.85, 0.1, 0.05]),
+            'Nofollow': rng.random(n) < 0.25,
+            'First seen': np.datetime_as_string(first_seen, unit='D'),
+            'Last seen': np.datetime_as_string(last_seen, unit='D'),
+        })
+    return write_csv(path, rows, chunk)
+
+
+# --- Screaming Frog (schema/screaming_frog.md) ---
+
+ISSUES = [
+    ('Response Codes: Internal Client Error (4xx)', 'Issue', 'High', 0.02),
+    ('Response Codes: Internal Redirection (3xx)', 'Warning', 'Low', 0.04),
+    ('Canonicals: Missing', 'Warning', 'Medium', 0.05),
+    ('Canonicals: Canonicalised', 'Warning', 'High', 0.07),
+    ('Page Titles: Missing', 'Issue', 'High', 0.01),
+    ('Page Titles: Duplicate', 'Opportunity', 'Medium', 0.08),
+    ('Page Titles: Over 60 Characters', 'Opportunity', 'Medium', 0.2),
+    ('Page Titles: Below 30 Characters', 'Opportunity', 'Medium', 0.04),
+    ('Meta Description: Missing', 'Opportunity', 'Low', 0.12),
+    ('Meta Description: Over 155 Characters', 'Opportunity', 'Low', 0.35),
+    ('Meta Description: Below 70 Characters', 'Opportunity', 'Low', 0.06),
+    ('H1: Missing', 'Issue', 'Medium', 0.03),
+    ('H1: Duplicate', 'Opportunity', 'Low', 0.05),
+    ('H2: Multiple', 'Warning', 'Low', 0.6),
+    ('Images: Missing Alt Text', 'Issue', 'Low', 0.1),
+    ('Images: Over 100 KB', 'Opportunity', 'Medium', 0.15),
+    ('Content: Low Content Pages', 'Opportunity', 'Medium', 0.08),
+    ('Links: Pages Without Internal Outlinks', 'Warning', 'High', 0.01),
+    ('Security: Missing HSTS Header', 'Warning', 'Low', 0.9),
+    ('URL: Parameters', 'Warning', 'Low', 0.03),
+]
+
+
+def write_screaming_frog_issues(path: Path, rows: int, spec: DatasetSpec, rng: np.random.Generator) -> int:
+    crawled = max(1, rows)
+    share = np.array([issue[3] for issue in ISSUES]) * rng.uniform(0.5, 1.5, len(ISSUES))
+    urls = np.maximum(1, np.round(np.minimum(share, 1) * crawled)).astype(int)
+    issues = pd.DataFrame({
+        'Issue Name': [issue[0] for issue in ISSUES],
+        'Issue Type': [issue[1] for issue in ISSUES],
+        'Issue Priority': [issue[2] for issue in ISSUES],
+        'URLs': urls,
+        '% of Total': np.round(urls / crawled * 100, 2),
+    })
+    return write_workbook(path, {'Website Issue': issues, 'Issue Category': pd.DataFrame()})
+
+
+def write_screaming_frog_internal(path: Path, rows: int, spec: DatasetSpec, rng: np.random.Generator) -> int:
+    def chunk(ids: np.ndarray) -> pd.DataFrame:
+        n = len(ids)
+        status = rng.choice([200, 301, 302, 404, 500], n, p=[0.9, 0.05, 0.01, 0.035, 0.005])
+        html = rng.random(n) < 0.8
+        titles = phrases(ids).str.title() + f" | {spec.brand}"
+        descriptions = 'Discover ' + phrases(ids) + f" at {spec.brand}. " + phrases(ids + 7).str.capitalize() + '.'
+        indexable = (status == 200) & (rng.random(n) < 0.92)
+        return pd.DataFrame({
+            'Address': page_urls(spec.domain, ids),
+            'Content Type': np.where(html, 'text/html; charset=UTF-8', 'image/jpeg'),
+            'Status Code': status,
+            'Indexability': np.where(indexable, 'Indexable', 'Non-Indexable'),
+            'Indexability Status': np.where(indexable, '', np.where(status == 200, 'Canonicalised', 'Redirected')),
+            'Title 1': titles.where(rng.random(n) > 0.01, ''),
+            'Title 1 Length': titles.str.len(),
+            'Meta Description 1': descriptions.where(rng.random(n) > 0.12, ''),
+            'Meta Description 1 Length': descriptions.str.len(),
+            'H1-1': phrases(ids).str.capitalize().where(rng.random(n) > 0.03, ''),
+            'Canonical Link Element 1': page_urls(spec.domain, ids).where(rng.random(n) > 0.05, ''),
+            'Word Count': np.where(html, rng.lognormal(6.3, 0.7, n).astype(int), 0),
+            'Crawl Depth': np.where(ids == 0, 0, np.minimum(10, rng.geometric(0.45, n))),
+            'Inlinks': rng.pareto(1.3, n).astype(int) + 1,
+            'Response Time': np.round(rng.lognormal(-1.2, 0.6, n), 3),
+        })
+    return write_csv(path, rows, chunk)
+
+
+EXPORTS = [
+    Export('ga4_channels.xlsx', 'ga4', 0, write_ga4_channels),
+    Export('ga4_countries.xlsx', 'ga4', 0, write_ga4_countries),
+    Export('gsc_performance.xlsx', 'gsc', 0, write_gsc_workbook),
+    Export('gsc_queries.csv', 'gsc', 1.0, write_gsc_queries),
+    Export('gsc_pages.csv', 'gsc', 0.2, write_gsc_pages),
+    Export('semrush_domain_overview.xlsx', 'semrush', 0, write_semrush_overview),
+    Export('semrush_organic_keywords.csv', 'semrush', 0.5, write_semrush_keywords),
+    Export('semrush_keyword_gap.csv', 'semrush', 0.5, write_semrush_keyword_gap),
+    Export('ahrefs_organic_benchmarking.xlsx', 'ahrefs', 0, write_ahrefs_matrices),
+    Export('ahrefs_backlinks.csv', 'ahrefs', 1.0, write_ahrefs_backlinks),
+    Export('screaming_frog_issues.xlsx', 'screaming_frog', 0, write_screaming_frog_issues),
+    Export('screaming_frog_internal.csv', 'screaming_frog', 0.2, write_screaming_frog_internal),
+]
+
+
+def export_rows(export: Export, rows: int) -> int:
+    """Rows an export gets for --rows (its share, or --rows for sizing fixed reports)."""
+    return max(1, round(rows * export.share)) if export.share else rows
+
+
+def _write_export(index: int, out: Path, spec: DatasetSpec) -> Tuple[str, int, float]:
+    export = EXPORTS[index]
+    start = time.perf_counter()
+    # One stream per file, so a file's content does not depend on --jobs or --tools
+    rng = np.random.default_rng([spec.seed, index])
+    rows = export.write(out / export.name, export_rows(export, spec.rows), spec, rng)
+    return export.name, rows, time.perf_counter() - start
+
+
+def read_spec(out: Path) -> Optional[Dict]:
+    """The ``dataset.json`` of a generated directory, or None if there is none."""
+    try:
+        with open(Path(out) / DATASET_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def spec_matches(stored: Optional[Dict], spec: DatasetSpec) -> bool:
+    """Whether a generated directory already holds this dataset."""
+    return (stored is not None
+            and stored.get('generator_version') == GENERATOR_VERSION
+            and {key: stored.get(key) for key in DatasetSpec._fields} ==
+            {**spec._asdict(), 'tools': list(spec.tools)})
+
+
+def generate_dataset(out: Path, spec: DatasetSpec, jobs: int = 1, verbose: bool = False) -> Dict:
+    """Write a dataset and its ``dataset.json``.
+
+    Args:
+        out: Directory to write to (created if missing; files of the same
+             name are overwritten)
+        spec: What to generate
+        jobs: Files written concurrently
+        verbose: Print each file as it is written
+
+    Returns:
+        Contents of ``dataset.json``
+    """
+    out = Path(out)
+    out.mkdir(parents=True, exist_ok=True)
+    (out / DATASET_FILE).unlink(missing_ok=True)
+    indices = [i for i, export in enumerate(EXPORTS) if export.tool in spec.tools]
+
+    with ProcessPoolExecutor(max_workers=max(1, jobs)) as pool:
+        futures = [pool.submit(_write_export, i, out, spec) for i in indices]
+        written = []
+        for future in futures:
+            name, rows, seconds = future.result()
+            written.append((name, rows))
+            if verbose:
+                print(f"{name:<36} {rows:>12,} rows {seconds:>8.1f} s")
+
+    dataset = {
+        **spec._asdict(),
+        'tools': list(spec.tools),
+        'domain': spec.domain,
+        'generator_version': GENERATOR_VERSION,
+        'files': {
+            name: {'tool': EXPORTS[i].tool, 'rows': rows, 'bytes': (out / name).stat().st_size}
+            for i, (name, rows) in zip(indices, written)
+        },
+    }
+    with open(out / DATASET_FILE, 'w', encoding='utf-8') as f:
+        json.dump(dataset, f, indent=2)
+    return dataset
+
+
+def default_out(rows: int) -> Path:
+    """Where a dataset of a size is kept unless --out says otherwise."""
+    return REPO_ROOT / '.cache' / 'datasets' / f"rows-{rows}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100_000,
+                        help='Rows of the largest exports (GSC queries, Ahrefs backlinks); '
+                             'the other row-heavy exports get a share of it')
+    parser.add_argument('--out', type=Path, help='Output directory (default: .cache/datasets/rows-N)')
+    parser.add_argument('--tools', nargs='+', choices=TOOLS, default=list(TOOLS), help='Tools to generate')
+    parser.add_argument('--brand', default='Acme', help='Brand name (its site is <brand>.com)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    parser.add_argument('--jobs', type=int, default=1, help='Files written concurrently')
+    args = parser.parse_args()
+    if args.rows < 1:
+        parser.error('--rows must be positive')
+
+    out = args.out or default_out(args.rows)
+    spec = DatasetSpec(args.rows, args.brand, args.seed, tuple(tool for tool in TOOLS if tool in args.tools))
+    print(f"Generating {args.rows:,}-row dataset for {spec.brand} in {out}")
+    start = time.perf_counter()
+    dataset = generate_dataset(out, spec, args.jobs, verbose=True)
+    total = sum(entry['bytes'] for entry in dataset['files'].values())
+    print(f"\n{len(dataset['files'])} files, {total / 1024 ** 2:,.1f} MB in {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -9,50 +9,134 @@ This tool follows a 3-phase workflow:
 
 Each phase requires user approval before proceeding to the next.
 """
+import os
+import re
 import sys
+import time
 import logging
+from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 import click
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.markdown import Markdown
-import questionary
-import json
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.utils.logger import setup_logger
-from src.data_ingestion.data_loader import DataLoader
-from src.analyzers.phase1_orchestrator import Phase1Orchestrator
-from src.narrative.phase2_generator import Phase2Generator
-from src.ppt_generator.phase3_generator import Phase3Generator
+from src.utils.config import WEBSITE_TYPES, Thresholds, load_config, priority_thresholds
+from src.utils.batch import BatchJob, BatchResult, load_manifest
+from src.utils.headless import (
+    APPROVAL_POLICIES, DEFAULT_APPROVAL_POLICY, EXIT_FAILED, EXIT_NO_DATA, EXIT_NOT_APPROVED, EXIT_SUCCESS,
+    RUN_STATUS, RunArtifacts, apply_policy, section_priorities, to_jsonable
+)
+from src.data_ingestion.excel_backends import AUTO_ENGINE, ENGINE_CHOICES
+from src.data_ingestion.table_backends import AUTO_BACKEND, TABLE_BACKENDS
+from src.service.defaults import DEFAULT_PORT, DEFAULT_QUEUE_PATH, DEFAULT_SERVICE_ARTIFACTS_DIR
+
+# pandas, python-pptx, questionary and the phase modules are imported where
+# they are first needed, so --help, usage errors and the start of a run do
+# not wait for them (budgeted by benchmarks/bench_startup.py)
+if TYPE_CHECKING:
+    from src.analyzers.phase1_orchestrator import Phase1Orchestrator
+    from src.narrative.phase2_generator import Phase2Generator
 
 console = Console()
 logger = logging.getLogger(__name__)
 
+# Decks of interactive and single headless runs
+DEFAULT_OUTPUT_DIR = Path('output')
+
+# Choices offered when a phase is not approved
+REFINE_THRESHOLD = "Adjust a priority threshold"
+REFINE_FILES = "Exclude or include data files"
+REFINE_CONTINUE = "Continue anyway"
+REFINE_STOP = "Stop"
+
+
+def default_artifacts_dir(brand_name: str) -> Path:
+    """Per-run artifacts directory under output/runs/."""
+    slug = re.sub(r'[^A-Za-z0-9]+', '-', brand_name).strip('-') or 'audit'
+    return Path('output') / 'runs' / f"{slug}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+
 
 class SEOAuditTool:
     """Main SEO Audit Tool orchestrator."""
 
-    def __init__(self, data_dir: Path, brand_name: str, website_type: str):
+    def __init__(self, data_dir: Path, brand_name: str, website_type: str, jobs: int = 1,
+                 use_cache: bool = True, stream_memory_mb: int = 512,
+                 excel_engine: str = AUTO_ENGINE, watch_interval: Optional[float] = None,
+                 table_backend: Optional[str] = None, analysis_jobs: int = 1,
+                 thresholds: Optional[Thresholds] = None, headless: bool = False,
+                 approval_policy: str = DEFAULT_APPROVAL_POLICY,
+                 artifacts_dir: Optional[Path] = None, resume_from: Optional[int] = None,
+                 output_dir: Optional[Path] = None):
         """Initialize the tool.
 
         Args:
             data_dir: Directory containing SEO data files
             brand_name: Client brand name
             website_type: Type of website
+            jobs: Number of worker processes used to parse data files
+            use_cache: Reuse parsed frames and analysis results from the on-disk caches
+            stream_memory_mb: Memory budget for streaming large CSV exports
+            excel_engine: Excel reader engine ('auto' for the fastest installed one)
+            watch_interval: Seconds between data directory checks while
+                            watching for new exports after Phase 1 (no
+                            watching if None)
+            table_backend: On-disk table backend for CSVs over the memory
+                           budget ('auto', 'duckdb', 'sqlite'; None to keep
+                           every file in memory)
+            analysis_jobs: Worker threads running independent Phase 1 analyses
+            thresholds: Priority thresholds by section (defaults if None)
+            headless: Decide phase gates with ``approval_policy`` instead of asking
+            approval_policy: Name from ``APPROVAL_POLICIES`` used in headless mode
+            artifacts_dir: Directory for phase results, gate decisions and
+                           timings as JSON (none written if None)
+            resume_from: Phase (2 or 3) to start at from the checkpoints of
+                         an earlier run; phases whose checkpoint is missing
+                         or stale are run again
+            output_dir: Directory for the PowerPoint deck and its content
+                        JSON (``DEFAULT_OUTPUT_DIR`` if None)
         """
         self.data_dir = data_dir
         self.brand_name = brand_name
         self.website_type = website_type
+        self.jobs = jobs
+        self.use_cache = use_cache
+        self.stream_memory_mb = stream_memory_mb
+        self.excel_engine = excel_engine
+        self.watch_interval = watch_interval
+        self.table_backend = table_backend
+        self.analysis_jobs = analysis_jobs
+        self.thresholds = thresholds
+        self.resume_from = resume_from
+        self.output_dir = Path(output_dir) if output_dir is not None else DEFAULT_OUTPUT_DIR
+        self.data_loader = None
+        self.phase1_checkpoint: Optional[str] = None
+        self._checkpointed_phase1: Optional[Dict[str, Any]] = None
+        self.orchestrator: Optional['Phase1Orchestrator'] = None
+        self.phase2_generator: Optional['Phase2Generator'] = None
         self.phase1_results = None
         self.phase2_results = None
         self.phase3_results = None
+        self.headless = headless
+        self.approval_policy = approval_policy
+        self.artifacts = RunArtifacts(artifacts_dir) if artifacts_dir is not None else None
+        self.exit_code = EXIT_SUCCESS
+        self.timings: Dict[str, float] = {}
+        self.gates: Dict[str, Dict[str, Any]] = {}
+        self.outputs: Dict[str, str] = {}
+
+    def run(self) -> bool:
+        """Run the complete 3-phase workflow.
 
-    def run(self):
-        """Run the complete 3-phase workflow."""
+        Returns:
+            True if every phase completed and was approved; ``exit_code``
+            tells why not otherwise
+        """
         console.print(Panel.fit(
             "[bold blue]SEO Audit Automation Tool[/bold blue]\n"
             f"Client: {self.brand_name}\n"
@@ -60,37 +144,165 @@ class SEOAuditTool:
             title="Welcome"
         ))
 
-        # Load data
-        if not self._load_data():
-            console.print("[red]Failed to load data. Exiting.[/red]")
-            return False
-
-        # Phase 1: Data Analysis & Strategic Insights
-        if not self._run_phase1():
-            console.print("[red]Phase 1 failed. Exiting.[/red]")
-            return False
-
-        # Phase 2: Narrative & Storyline Architecture
-        if not self._run_phase2():
-            console.print("[red]Phase 2 failed. Exiting.[/red]")
-            return False
+        start = time.perf_counter()
+        success = False
+        try:
+            success = self._run_phases()
+        finally:
+            self.timings['total'] = time.perf_counter() - start
+            if not success and self.exit_code == EXIT_SUCCESS:
+                self.exit_code = EXIT_FAILED
+            self._write_run_summary()
+
+        if success:
+            console.print("\n[bold green]✓ SEO Audit Complete![/bold green]")
+        return success
+
+    def _run_phases(self) -> bool:
+        start_phase = self._resume() if self.resume_from is not None else 1
+
+        if start_phase <= 1:
+            # Load data
+            if not self._load_data():
+                self.exit_code = EXIT_NO_DATA
+                console.print("[red]Failed to load data. Exiting.[/red]")
+                return False
+
+            # Phase 1: Data Analysis & Strategic Insights
+            if not self._run_phase1():
+                self._print_stop(1)
+                return False
+
+        if start_phase <= 2:
+            # Phase 2: Narrative & Storyline Architecture
+            if not self._run_phase2():
+                self._print_stop(2)
+                return False
 
         # Phase 3: Final PowerPoint Output
         if not self._run_phase3():
-            console.print("[red]Phase 3 failed. Exiting.[/red]")
+            self._print_stop(3)
             return False
 
-        console.print("\n[bold green]✓ SEO Audit Complete![/bold green]")
         return True
 
+    def _checkpoints(self):
+        from src.utils.checkpoints import PhaseCheckpoints
+        return PhaseCheckpoints(self.data_dir, self.brand_name)
+
+    def _checkpoint_options(self) -> Dict[str, Any]:
+        """Options a checkpoint is only valid for (the configured, not refined, thresholds)."""
+        return {
+            'website_type': self.website_type,
+            'thresholds': self.thresholds or priority_thresholds(),
+        }
+
+    def _resume(self) -> int:
+        """Load the checkpoints ``resume_from`` asks for.
+
+        Returns:
+            Phase to start at (earlier than ``resume_from`` if a checkpoint
+            was missing or stale)
+        """
+        console.print(f"\n[bold]Resuming from Phase {self.resume_from}...[/bold]")
+        start = time.perf_counter()
+        checkpoints = self._checkpoints()
+        options = self._checkpoint_options()
+
+        phase1 = checkpoints.load(1, options)
+        if phase1 is None:
+            console.print("[yellow]No usable Phase 1 checkpoint; running from Phase 1.[/yellow]")
+            return 1
+        self.phase1_results = phase1.results
+        self.phase1_checkpoint = phase1.digest
+        start_phase, created_at = 2, phase1.created_at
+
+        if self.resume_from >= 3:
+            phase2 = checkpoints.load(2, options, parent=phase1.digest)
+            if phase2 is None:
+                console.print("[yellow]No usable Phase 2 checkpoint; running from Phase 2.[/yellow]")
+            else:
+                self.phase2_results = phase2.results
+                start_phase, created_at = 3, phase2.created_at
+
+        self.timings['resume'] = time.perf_counter() - start
+        console.print(f"[green]Loaded checkpoints saved {created_at}; starting at Phase {start_phase}.[/green]")
+        return start_phase
+
+    def _save_checkpoints(self, phase_num: int):
+        """Checkpoint approved results (Phase 1 again if a Phase 2 refinement recomputed it)."""
+        checkpoints = self._checkpoints()
+        options = self._checkpoint_options()
+        if self.data_loader is not None and self.phase1_results is not self._checkpointed_phase1:
+            self.phase1_checkpoint = checkpoints.save(
+                1, self.phase1_results, options,
+                inputs=dict(self.data_loader.manifest.entries),
+                excluded=self.data_loader.excluded
+            )
+            self._checkpointed_phase1 = self.phase1_results
+        if phase_num == 2 and self.phase1_checkpoint is not None:
+            checkpoints.save(2, self.phase2_results, options, parent=self.phase1_checkpoint)
+
+    def _print_stop(self, phase_num: int):
+        if self.exit_code == EXIT_NOT_APPROVED:
+            console.print(f"[yellow]Phase {phase_num} not approved. Exiting.[/yellow]")
+        else:
+            console.print(f"[red]Phase {phase_num} failed. Exiting.[/red]")
+
+    def _write_run_summary(self):
+        """Write run.json with the run's outcome, gate decisions and timings."""
+        if self.artifacts is None:
+            return
+
+        summary: Dict[str, Any] = {
+            'brand_name': self.brand_name,
+            'data_dir': str(self.data_dir),
+            'website_type': self.website_type,
+            'status': RUN_STATUS.get(self.exit_code, 'failed'),
+            'exit_code': self.exit_code,
+            'headless': self.headless,
+            'approval_policy': self.approval_policy if self.headless else None,
+            'gates': self.gates,
+            'timings_seconds': {phase: round(seconds, 3) for phase, seconds in self.timings.items()},
+            'outputs': self.outputs,
+            'finished_at': datetime.now().isoformat(timespec='seconds'),
+        }
+        report = self.orchestrator.last_report if self.orchestrator is not None else None
+        if report is not None:
+            summary['phase1_critical_path'] = {
+                'steps': report.critical_path,
+                'seconds': round(report.critical_seconds, 3),
+                'serial_seconds': round(report.serial_seconds, 3),
+            }
+        cache = self.orchestrator.result_cache if self.orchestrator is not None else None
+        if cache is not None:
+            summary['result_cache'] = {'hits': cache.hits, 'misses': cache.misses}
+
+        path = self.artifacts.write('run', summary)
+        if path is not None:
+            console.print(f"[blue]Run summary written to {path}[/blue]")
+
     def _load_data(self) -> bool:
         """Load and validate data files."""
         console.print(f"\n[bold]Loading data from {self.data_dir}...[/bold]")
-
-        self.data_loader = DataLoader(self.data_dir)
+        start = time.perf_counter()
+        from src.data_ingestion.data_loader import DataLoader
+        from src.data_ingestion.frame_cache import DEFAULT_CACHE_DIR
+        from src.analyzers.phase1_orchestrator import Phase1Orchestrator
+
+        self.data_loader = DataLoader(
+            self.data_dir,
+            jobs=self.jobs,
+            cache_dir=DEFAULT_CACHE_DIR if self.use_cache else None,
+            stream_memory_bytes=self.stream_memory_mb * 1024 ** 2,
+            stream_columns=Phase1Orchestrator.stream_columns(),
+            excel_engine=self.excel_engine,
+            table_backend=self.table_backend
+        )
         loaded_data = self.data_loader.load_all_files()
+        self.timings['load'] = time.perf_counter() - start
 
-        if not loaded_data:
+        if not loaded_data and not self.data_loader.tables:
             console.print("[red]No data files found or failed to load.[/red]")
             return False
 
@@ -98,9 +310,27 @@ class SEOAuditTool:
         table = Table(title="Loaded Data Summary")
         table.add_column("Tool", style="cyan")
         table.add_column("Rows", justify="right", style="green")
+        table.add_column("Parse (s)", justify="right", style="magenta")
+        table.add_column("Memory (KB)", justify="right", style="blue")
 
         for key, df in loaded_data.items():
-            table.add_row(key, str(len(df)))
+            timings = self.data_loader.parse_timings.get(key, {})
+            memory = self.data_loader.memory_usage.get(key, {})
+            table.add_row(
+                key,
+                str(len(df)),
+                f"{sum(timings.values()):.2f}",
+                f"{memory.get('typed', 0) / 1024:,.1f}"
+            )
+
+        for key, disk_table in self.data_loader.tables.items():
+            timings = self.data_loader.parse_timings.get(key, {})
+            table.add_row(
+                f"{key} (on disk)",
+                f"{len(disk_table):,}",
+                f"{sum(timings.values()):.2f}",
+                "-"
+            )
 
         console.print(table)
 
@@ -118,28 +348,81 @@ class SEOAuditTool:
         ))
 
         try:
-            orchestrator = Phase1Orchestrator(
+            from src.analyzers.phase1_orchestrator import Phase1Orchestrator
+            from src.analyzers.result_cache import DEFAULT_RESULT_CACHE_DIR, ResultCache
+
+            self.orchestrator = Phase1Orchestrator(
                 self.data_loader,
                 self.brand_name,
-                self.website_type
+                self.website_type,
+                jobs=self.analysis_jobs,
+                result_cache=ResultCache(DEFAULT_RESULT_CACHE_DIR) if self.use_cache else None,
+                thresholds=self.thresholds
             )
 
-            self.phase1_results = orchestrator.execute()
+            start = time.perf_counter()
+            self.phase1_results = self.orchestrator.execute()
+            self.timings['phase1'] = time.perf_counter() - start
+            self._display_phase1_timing()
 
             # Display insights summary
             self._display_phase1_insights()
 
+            if self.watch_interval is not None:
+                self._watch_data()
+
             # Ask for approval
-            return self._get_phase_approval(
+            approved = self._get_phase_approval(
                 phase_num=1,
                 question="Do these insights accurately reflect the data priorities?"
             )
+            self._write_artifact('phase1', self.phase1_results)
+            if approved:
+                self._save_checkpoints(1)
+            return approved
 
         except Exception as e:
             logger.error(f"Phase 1 error: {e}", exc_info=True)
+            self.exit_code = EXIT_FAILED
             console.print(f"[red]Error in Phase 1: {e}[/red]")
             return False
 
+    def _watch_data(self):
+        """Re-run affected Phase 1 analyses as exports are added, changed or removed.
+
+        Only changed files are re-parsed and only analyses reading their
+        tools run again. Stops on Ctrl+C.
+        """
+        console.print(f"[blue]Watching {self.data_dir} for new or changed exports every "
+                      f"{self.watch_interval:g}s. Press Ctrl+C to continue.[/blue]")
+        try:
+            while True:
+                time.sleep(self.watch_interval)
+                changed_tools = self.data_loader.refresh()
+                if not changed_tools:
+                    continue
+
+                console.print(f"\n[bold]Data changed for: {', '.join(sorted(changed_tools))}[/bold]")
+                self.phase1_results = self.orchestrator.execute(changed_tools)
+                self._display_phase1_timing()
+                self._display_phase1_insights()
+        except KeyboardInterrupt:
+            console.print("\n[blue]Stopped watching.[/blue]")
+
+    def _display_phase1_timing(self):
+        """Display how long Phase 1 took against its critical path."""
+        report = self.orchestrator.last_report
+        if report is None:
+            return
+        console.print(
+            f"[blue]Phase 1 ran in {report.wall_seconds:.2f}s on {self.analysis_jobs} thread(s); "
+            f"critical path {report.critical_seconds:.2f}s ({' → '.join(report.critical_path)}), "
+            f"{report.serial_seconds:.2f}s if run one after another[/blue]"
+        )
+        cache = self.orchestrator.result_cache
+        if cache is not None:
+            console.print(f"[blue]Result cache: {cache.hits} hits, {cache.misses} misses[/blue]")
+
     def _display_phase1_insights(self):
         """Display Phase 1 insights summary."""
         console.print("\n[bold]Strategic Insights:[/bold]\n")
@@ -179,20 +462,29 @@ class SEOAuditTool:
         ))
 
         try:
-            generator = Phase2Generator(self.phase1_results)
-            self.phase2_results = generator.execute()
+            from src.narrative.phase2_generator import Phase2Generator
+
+            start = time.perf_counter()
+            self.phase2_generator = Phase2Generator(self.phase1_results)
+            self.phase2_results = self.phase2_generator.execute()
+            self.timings['phase2'] = time.perf_counter() - start
 
             # Display narrative draft
             self._display_phase2_narrative()
 
             # Ask for approval
-            return self._get_phase_approval(
+            approved = self._get_phase_approval(
                 phase_num=2,
                 question="Is this storyline engaging and accurate?"
             )
+            self._write_artifact('phase2', self.phase2_results)
+            if approved:
+                self._save_checkpoints(2)
+            return approved
 
         except Exception as e:
             logger.error(f"Phase 2 error: {e}", exc_info=True)
+            self.exit_code = EXIT_FAILED
             console.print(f"[red]Error in Phase 2: {e}[/red]")
             return False
 
@@ -223,33 +515,43 @@ class SEOAuditTool:
         ))
 
         try:
-            output_dir = Path('output')
-            output_dir.mkdir(exist_ok=True)
+            from src.ppt_generator.phase3_generator import Phase3Generator
+
+            self.output_dir.mkdir(parents=True, exist_ok=True)
 
             timestamp = Path(self.data_dir).stem
             output_filename = f"SEO_Audit_{self.brand_name}_{timestamp}.pptx"
-            output_path = output_dir / output_filename
+            output_path = self.output_dir / output_filename
 
             generator = Phase3Generator(
                 self.phase1_results,
                 self.phase2_results
             )
 
+            start = time.perf_counter()
             result_path = generator.execute(output_path)
+            self.timings['phase3'] = time.perf_counter() - start
+            content_path = result_path.parent / f'{result_path.stem}_content.json'
+            self.outputs = {'pptx': str(result_path), 'content_json': str(content_path)}
 
             console.print(f"\n[bold green]✓ PowerPoint generated:[/bold green] {result_path}")
-            console.print(f"[bold green]✓ Content JSON generated:[/bold green] {result_path.parent / f'{result_path.stem}_content.json'}")
+            console.print(f"[bold green]✓ Content JSON generated:[/bold green] {content_path}")
 
             return True
 
         except Exception as e:
             logger.error(f"Phase 3 error: {e}", exc_info=True)
+            self.exit_code = EXIT_FAILED
             console.print(f"[red]Error in Phase 3: {e}[/red]")
             return False
 
     def _get_phase_approval(self, phase_num: int, question: str) -> bool:
         """Get user approval to proceed to next phase.
 
+        On rejection the user can adjust priority thresholds or exclude data
+        files; only the insights and narrative pieces affected are
+        recomputed before asking again.
+
         Args:
             phase_num: Current phase number
             question: Approval question
@@ -257,22 +559,284 @@ class SEOAuditTool:
         Returns:
             True if approved, False otherwise
         """
-        console.print()
-        response = questionary.confirm(
-            f"{question} Proceed to Phase {phase_num + 1}?",
-            default=True
+        if self.headless:
+            approved = self._apply_approval_policy(phase_num)
+        else:
+            approved = self._ask_approval(phase_num, question)
+        if not approved:
+            self.exit_code = EXIT_NOT_APPROVED
+        return approved
+
+    def _apply_approval_policy(self, phase_num: int) -> bool:
+        """Decide a phase gate with the approval policy (headless mode)."""
+        results = self.phase1_results if phase_num == 1 else self.phase2_results
+        approved, blocking = apply_policy(self.approval_policy, results)
+        priorities = section_priorities(results)
+        self.gates[f'phase{phase_num}'] = {
+            'approved': approved,
+            'blocking_sections': {key: priorities[key] for key in blocking},
+        }
+
+        if approved:
+            console.print(f"[green]Phase {phase_num} auto-approved (policy: {self.approval_policy}).[/green]")
+        else:
+            sections = ', '.join(f"{key} ({priorities[key]})" for key in blocking)
+            console.print(f"[yellow]Phase {phase_num} stopped by policy {self.approval_policy}: "
+                          f"{sections}[/yellow]")
+        return approved
+
+    def _ask_approval(self, phase_num: int, question: str) -> bool:
+        """Ask whether to proceed, offering refinements on rejection."""
+        import questionary
+
+        while True:
+            console.print()
+            response = questionary.confirm(
+                f"{question} Proceed to Phase {phase_num + 1}?",
+                default=True
+            ).ask()
+
+            if response is None:
+                return False
+            if response:
+                return True
+
+            if self.orchestrator is not None:
+                console.print("[yellow]You can refine the analysis by adjusting thresholds or excluding data files.[/yellow]")
+                choices = [REFINE_THRESHOLD, REFINE_FILES, REFINE_CONTINUE, REFINE_STOP]
+            else:
+                # Resumed from a checkpoint: there is no loaded data to refine
+                console.print("[yellow]Run without --resume-from to refine the analysis.[/yellow]")
+                choices = [REFINE_CONTINUE, REFINE_STOP]
+            choice = questionary.select("What would you like to do?", choices=choices).ask()
+
+            if choice is None or choice == REFINE_STOP:
+                return False
+            if choice == REFINE_CONTINUE:
+                return True
+
+            if choice == REFINE_THRESHOLD:
+                changed_tools, changed_options = set(), self._adjust_threshold()
+            else:
+                changed_tools, changed_options = self._choose_files(), set()
+
+            if changed_tools or changed_options:
+                self._recompute(phase_num, changed_tools, changed_options)
+
+    def _write_artifact(self, name: str, results: Optional[Dict[str, Any]]):
+        if self.artifacts is not None and results is not None:
+            self.artifacts.write(name, to_jsonable(results))
+
+    def _adjust_threshold(self) -> Set[str]:
+        """Ask for one priority threshold and its new value.
+
+        Returns:
+            Changed options (see ``Phase1Orchestrator.set_threshold``)
+        """
+        thresholds = self.orchestrator.thresholds
+        choices = {
+            f"{section} / {level} / {name} (now {value:g})": (section, level, name)
+            for section, levels in thresholds.items()
+            for level, values in levels.items()
+            for name, value in values.items()
+        }
+        import questionary
+
+        picked = questionary.select("Which threshold?", choices=list(choices)).ask()
+        if picked is None:
+            return set()
+
+        section, level, name = choices[picked]
+
+        def is_number(text: str) -> bool:
+            try:
+                float(text)
+                return True
+            except ValueError:
+                return False
+
+        answer = questionary.text(
+            f"New value for {name}:",
+            default=f"{thresholds[section][level][name]:g}",
+            validate=lambda text: is_number(text) or "Enter a number"
         ).ask()
+        if answer is None:
+            return set()
+        return self.orchestrator.set_threshold(section, level, name, float(answer))
 
-        if response is None:
-            return False
+    def _choose_files(self) -> Set[str]:
+        """Ask which data files to keep in the analysis.
 
-        if not response:
-            console.print("[yellow]You can refine the analysis by providing feedback.[/yellow]")
-            # In a full implementation, this would allow users to adjust parameters
-            retry = questionary.confirm("Would you like to continue anyway?").ask()
-            return retry if retry is not None else False
+        Returns:
+            Tools whose data changed
+        """
+        import questionary
+
+        loader = self.data_loader
+        files = {**loader.loaded_files, **{sid: None for sid in loader.excluded}}
+        choices = [
+            questionary.Choice(f"{sid} ({tool or 'unrecognized'})", value=sid,
+                               checked=sid not in loader.excluded)
+            for sid, tool in sorted(files.items())
+        ]
+        kept = questionary.checkbox("Files to include in the analysis:", choices=choices).ask()
+        if kept is None:
+            return set()
+        return loader.set_excluded(set(files) - set(kept))
+
+    def _recompute(self, phase_num: int, changed_tools: Set[str], changed_options: Set[str]):
+        """Recompute the insights (and narrative, from Phase 2 on) affected by a change."""
+        start = time.perf_counter()
+        self.phase1_results = self.orchestrator.execute(changed_tools, changed_options)
+        if phase_num >= 2:
+            self.phase2_results = self.phase2_generator.execute(self.phase1_results)
+        console.print(f"[blue]Recomputed affected insights in {time.perf_counter() - start:.2f}s[/blue]")
+
+        self._display_phase1_insights()
+        if phase_num >= 2:
+            self._display_phase2_narrative()
 
-        return True
+
+def _warm_up():
+    """Import every phase's modules and load the slide template up front.
+
+    Batch and service workers run many audits, so they take the imports
+    once before the first audit (with fork, already done in the parent)
+    rather than lazily inside it.
+    """
+    import src.data_ingestion.data_loader  # noqa: F401
+    import src.analyzers.phase1_orchestrator  # noqa: F401
+    import src.narrative.phase2_generator  # noqa: F401
+    from src.ppt_generator.phase3_generator import new_presentation
+
+    # A throwaway deck puts python-pptx's lazily loaded parts in place too
+    new_presentation()
+
+
+def _init_batch_worker(verbose: bool):
+    """Process pool initializer for batch and service workers.
+
+    Silences the per-phase console output (the batch prints one line per
+    client) and warms the worker up.
+    """
+    console.quiet = True
+    logging.getLogger().setLevel(logging.DEBUG if verbose else logging.WARNING)
+    _warm_up()
+
+
+def _run_batch_client(job: BatchJob, options: Dict[str, Any], batch_dir: Path) -> BatchResult:
+    """Audit one batch client headlessly, never raising."""
+    artifacts_dir = batch_dir / job.slug
+    try:
+        config = load_config(job.config_path) if job.config_path is not None else None
+        tool = SEOAuditTool(
+            job.data_dir, job.brand_name, job.website_type,
+            thresholds=priority_thresholds(config),
+            headless=True,
+            artifacts_dir=artifacts_dir,
+            # Clients of a batch may share a brand name or data directory name
+            output_dir=artifacts_dir,
+            **options
+        )
+        tool.run()
+    except Exception as e:
+        logger.error(f"Batch client {job.brand_name} failed: {e}", exc_info=True)
+        return BatchResult(job.brand_name, RUN_STATUS[EXIT_FAILED], EXIT_FAILED, {}, {},
+                           str(artifacts_dir), str(e))
+
+    return BatchResult(job.brand_name, RUN_STATUS.get(tool.exit_code, 'failed'), tool.exit_code,
+                       tool.timings, tool.outputs, str(artifacts_dir))
+
+
+def run_batch(batch_jobs: List[BatchJob], options: Dict[str, Any], batch_dir: Path,
+              workers: int, verbose: bool = False) -> List[BatchResult]:
+    """Audit many clients on a process pool.
+
+    Each worker process runs one client after another, so the pandas,
+    pydantic and python-pptx imports, the compiled detector and schema
+    tables and the parsed template are paid for once per worker rather
+    than once per client (with the fork start method the workers inherit
+    them already warm from this process). The parsed-frame and result
+    caches on disk are shared by every worker. A client that fails is
+    recorded and the batch carries on.
+
+    Args:
+        batch_jobs: Clients from ``load_manifest``
+        options: ``SEOAuditTool`` keyword arguments shared by every client
+        batch_dir: Directory for per-client artifacts and batch.json
+        workers: Worker processes
+        verbose: Keep INFO logging in the workers
+
+    Returns:
+        Results in manifest order
+    """
+    console.print(Panel.fit(
+        "[bold blue]SEO Audit Batch[/bold blue]\n"
+        f"Clients: {len(batch_jobs)}\n"
+        f"Workers: {workers}",
+        title="Batch"
+    ))
+
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    _warm_up()
+    start = time.perf_counter()
+    results: Dict[str, BatchResult] = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                             initargs=(verbose,)) as pool:
+        futures = {pool.submit(_run_batch_client, job, options, batch_dir): job for job in batch_jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # The worker process died (e.g. killed for memory)
+                logger.error(f"Batch client {job.brand_name} failed: {e}")
+                result = BatchResult(job.brand_name, RUN_STATUS[EXIT_FAILED], EXIT_FAILED, {}, {},
+                                     str(batch_dir / job.slug), str(e) or type(e).__name__)
+            results[job.slug] = result
+            color = 'green' if result.exit_code == EXIT_SUCCESS else 'red'
+            console.print(f"[{color}]{len(results)}/{len(batch_jobs)} {job.brand_name}: {result.status}[/{color}]")
+    wall = time.perf_counter() - start
+
+    ordered = [results[job.slug] for job in batch_jobs]
+    _display_batch_results(ordered, wall)
+
+    path = RunArtifacts(batch_dir).write('batch', {
+        'workers': workers,
+        'wall_seconds': round(wall, 3),
+        'completed': sum(result.exit_code == EXIT_SUCCESS for result in ordered),
+        'clients': [result._asdict() for result in ordered],
+    })
+    if path is not None:
+        console.print(f"[blue]Batch summary written to {path}[/blue]")
+    return ordered
+
+
+def _display_batch_results(results: List[BatchResult], wall: float):
+    """Per-client status and timing table."""
+    table = Table(title="Batch Results")
+    table.add_column("Client", style="cyan")
+    table.add_column("Status")
+    for column in ("Load (s)", "Phase 1 (s)", "Phase 2 (s)", "Phase 3 (s)", "Total (s)"):
+        table.add_column(column, justify="right", style="magenta")
+    table.add_column("Output / Error")
+
+    for result in results:
+        color = 'green' if result.exit_code == EXIT_SUCCESS else 'red'
+        seconds = [result.timings.get(phase) for phase in ('load', 'phase1', 'phase2', 'phase3', 'total')]
+        table.add_row(
+            result.brand_name,
+            f"[{color}]{result.status}[/{color}]",
+            *("-" if value is None else f"{value:.2f}" for value in seconds),
+            result.error or result.outputs.get('pptx') or result.artifacts_dir
+        )
+
+    console.print(table)
+    completed = sum(result.exit_code == EXIT_SUCCESS for result in results)
+    serial = sum(result.timings.get('total', 0.0) for result in results)
+    console.print(f"[blue]{completed}/{len(results)} clients completed in {wall:.2f}s "
+                  f"({serial:.2f}s of audits)[/blue]")
 
 
 @click.command()
@@ -280,29 +844,139 @@ class SEOAuditTool:
     '--data-dir',
     '-d',
     type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
-    required=True,
     help='Directory containing SEO data files (CSV/XLSX)'
 )
 @click.option(
     '--brand-name',
     '-b',
-    required=True,
     help='Client brand name'
 )
 @click.option(
     '--website-type',
     '-w',
-    type=click.Choice(['ecommerce', 'saas', 'content', 'local', 'marketplace']),
+    type=click.Choice(WEBSITE_TYPES),
     default='ecommerce',
     help='Type of website'
 )
+@click.option(
+    '--config',
+    '-c',
+    'config_path',
+    type=click.Path(exists=True, file_okay=True, dir_okay=False, path_type=Path),
+    help='JSON configuration with priority thresholds (see config/example_config.json)'
+)
+@click.option(
+    '--jobs',
+    '-j',
+    type=click.IntRange(min=1),
+    default=1,
+    help='Number of worker processes used to parse data files'
+)
+@click.option(
+    '--analysis-jobs',
+    type=click.IntRange(min=1),
+    default=4,
+    help='Number of threads running independent Phase 1 analyses concurrently'
+)
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    help='Re-parse every data file and re-run every analysis instead of reusing cached frames and results'
+)
+@click.option(
+    '--stream-memory-mb',
+    type=click.IntRange(min=16),
+    default=512,
+    help='CSV exports larger than this are streamed in chunks that fit within it'
+)
+@click.option(
+    '--excel-engine',
+    type=click.Choice(ENGINE_CHOICES),
+    default=AUTO_ENGINE,
+    help='Excel reader backend (auto picks the fastest installed one)'
+)
+@click.option(
+    '--table-backend',
+    type=click.Choice(['off', AUTO_BACKEND] + TABLE_BACKENDS),
+    default='off',
+    help='Load CSVs larger than --stream-memory-mb into an on-disk table (auto uses DuckDB when installed, else SQLite)'
+)
+@click.option(
+    '--watch',
+    is_flag=True,
+    help='After Phase 1, keep re-running affected analyses as exports are added or changed (Ctrl+C to continue)'
+)
+@click.option(
+    '--watch-interval',
+    type=click.FloatRange(min=0.5),
+    default=5.0,
+    help='Seconds between data directory checks in --watch mode'
+)
+@click.option(
+    '--headless',
+    is_flag=True,
+    help='Run all phases without prompts, deciding phase gates with --approval-policy'
+)
+@click.option(
+    '--approval-policy',
+    type=click.Choice(list(APPROVAL_POLICIES)),
+    default=DEFAULT_APPROVAL_POLICY,
+    show_default=True,
+    help='Headless gate policy: always approve, or stop on any critical (C) or high (H) section'
+)
+@click.option(
+    '--artifacts-dir',
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+    help='Write phase results, gate decisions and timings as JSON here '
+         '(headless default: output/runs/<brand>-<timestamp>)'
+)
+@click.option(
+    '--batch',
+    'manifest_path',
+    type=click.Path(exists=True, file_okay=True, dir_okay=False, path_type=Path),
+    help='Audit every client of a JSON manifest headlessly instead of one --data-dir/--brand-name'
+)
+@click.option(
+    '--batch-workers',
+    type=click.IntRange(min=1),
+    default=min(4, os.cpu_count() or 1),
+    show_default=True,
+    help='Worker processes auditing batch clients (or service jobs) concurrently'
+)
+@click.option(
+    '--serve',
+    is_flag=True,
+    help='Run as a long-lived service executing queued audit jobs headlessly'
+)
+@click.option(
+    '--service-db',
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=DEFAULT_QUEUE_PATH,
+    show_default=True,
+    help='SQLite job queue of --serve'
+)
+@click.option(
+    '--service-port',
+    type=click.IntRange(min=0, max=65535),
+    default=DEFAULT_PORT,
+    show_default=True,
+    help='Port of the local job status endpoint of --serve'
+)
+@click.option(
+    '--resume-from',
+    type=click.IntRange(min=2, max=3),
+    help='Start at Phase 2 or 3 from the checkpoints of an earlier run of the same data and brand '
+         '(phases whose checkpoint is missing or whose data changed are run again)'
+)
 @click.option(
     '--verbose',
     '-v',
     is_flag=True,
     help='Enable verbose logging'
 )
-def main(data_dir, brand_name, website_type, verbose):
+def main(data_dir, brand_name, website_type, config_path, jobs, analysis_jobs, no_cache, stream_memory_mb, excel_engine,
+         table_backend, watch, watch_interval, headless, approval_policy, artifacts_dir, manifest_path,
+         batch_workers, serve, service_db, service_port, resume_from, verbose):
     """SEO Audit Automation Tool
 
     Generates executive-ready SEO audits following a 3-phase workflow:
@@ -315,11 +989,76 @@ def main(data_dir, brand_name, website_type, verbose):
     log_level = logging.DEBUG if verbose else logging.INFO
     setup_logger(log_level)
 
-    # Run the tool
-    tool = SEOAuditTool(data_dir, brand_name, website_type)
-    success = tool.run()
+    tool_options = dict(
+        jobs=jobs,
+        use_cache=not no_cache,
+        stream_memory_mb=stream_memory_mb,
+        excel_engine=excel_engine,
+        table_backend=None if table_backend == 'off' else table_backend,
+        analysis_jobs=analysis_jobs,
+        approval_policy=approval_policy
+    )
 
-    sys.exit(0 if success else 1)
+    if serve:
+        from src.service.job_queue import JobQueue
+        from src.service.server import AuditService
+
+        try:
+            service = AuditService(
+                JobQueue(service_db), _run_batch_client, tool_options,
+                artifacts_root=artifacts_dir or DEFAULT_SERVICE_ARTIFACTS_DIR,
+                workers=batch_workers,
+                initializer=_init_batch_worker,
+                initargs=(verbose,),
+                port=service_port
+            )
+        except OSError as e:
+            raise click.ClickException(f"Cannot start the audit service: {e}")
+        _warm_up()
+        host, port = service.address
+        console.print(f"[bold blue]Audit service[/bold blue] queue {service_db}, "
+                      f"status on http://{host}:{port}/health. Press Ctrl+C to stop.")
+        service.serve_forever()
+        sys.exit(EXIT_SUCCESS)
+
+    if manifest_path is not None:
+        try:
+            batch_jobs = load_manifest(manifest_path)
+        except (OSError, ValueError) as e:
+            raise click.BadParameter(str(e), param_hint='--batch')
+        if watch:
+            console.print("[yellow]--watch is ignored in --batch mode.[/yellow]")
+        batch_dir = artifacts_dir or Path('output') / 'batches' / f"batch-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        results = run_batch(batch_jobs, tool_options, batch_dir, batch_workers, verbose)
+        sys.exit(EXIT_SUCCESS if all(result.exit_code == EXIT_SUCCESS for result in results) else EXIT_FAILED)
+
+    if data_dir is None or brand_name is None:
+        raise click.UsageError("--data-dir and --brand-name are required unless --batch is given")
+
+    try:
+        config = load_config(config_path) if config_path is not None else None
+    except (OSError, ValueError) as e:
+        raise click.BadParameter(str(e), param_hint='--config')
+
+    if headless and watch:
+        console.print("[yellow]--watch is ignored in --headless mode.[/yellow]")
+        watch = False
+    if headless and artifacts_dir is None:
+        artifacts_dir = default_artifacts_dir(brand_name)
+
+    # Run the tool
+    tool = SEOAuditTool(
+        data_dir, brand_name, website_type,
+        watch_interval=watch_interval if watch else None,
+        thresholds=priority_thresholds(config),
+        headless=headless,
+        artifacts_dir=artifacts_dir,
+        resume_from=resume_from,
+        **tool_options
+    )
+    tool.run()
+
+    sys.exit(tool.exit_code)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,196 @@
+"""Analyzer for competitive benchmarking and domain authority (Slides 8 and 20)."""
+import pandas as pd
+from typing import Dict, Optional
+import logging
+from src.data_ingestion.ahrefs_parser import (
+    TRAFFIC_METRIC, REFERRING_DOMAINS_METRIC, PAGE_1_BUCKETS,
+    parse_competitor_matrix, latest_values, metric_series, find_brand_domain, normalize_domain
+)
+from src.models.audit_data import (
+    CompetitiveData, CompetitiveMetrics, DomainAuthorityData, RDTrendPoint
+)
+
+logger = logging.getLogger(__name__)
+
+# Competitors shown next to the brand on Slide 8
+MAX_COMPETITORS = 5
+
+
+class CompetitiveAnalyzer:
+    """Builds competitive and authority insights from Ahrefs competitor matrices."""
+
+    def __init__(self, brand_name: str,
+                 benchmarking_sheet: Optional[pd.DataFrame] = None,
+                 position_rank_sheet: Optional[pd.DataFrame] = None,
+                 domain_overview: Optional[pd.DataFrame] = None):
+        """Initialize analyzer with data sources.
+
+        Args:
+            brand_name: Client brand name
+            benchmarking_sheet: Ahrefs 'Organic Benchmarking' sheet read with header=None
+            position_rank_sheet: Ahrefs 'Organic Position Rank' sheet read with header=None
+            domain_overview: SEMrush 'Domain Overview' sheet (for authority scores)
+        """
+        self.brand_name = brand_name
+        self.benchmarking = parse_competitor_matrix(benchmarking_sheet)
+        self.position_rank = parse_competitor_matrix(position_rank_sheet)
+        self.authority = self._authority_scores(domain_overview)
+
+        domains = list(self.benchmarking['domain'].unique()) if self.benchmarking is not None else []
+        self.brand_domain = find_brand_domain(domains, brand_name)
+        self.competitor_domains = [d for d in domains if d != self.brand_domain][:MAX_COMPETITORS]
+
+    @property
+    def has_data(self) -> bool:
+        """Whether the benchmarking matrix was available and parsed."""
+        return self.benchmarking is not None and self.brand_domain is not None
+
+    @staticmethod
+    def _authority_scores(domain_overview: Optional[pd.DataFrame]) -> Dict[str, int]:
+        """Authority score per domain from SEMrush Domain Overview."""
+        if domain_overview is None or domain_overview.empty:
+            return {}
+
+        columns = {str(col).strip().lower(): col for col in domain_overview.columns}
+        if 'domain' not in columns or 'authority score' not in columns:
+            return {}
+
+        scores = pd.to_numeric(domain_overview[columns['authority score']], errors='coerce')
+        domains = domain_overview[columns['domain']].map(normalize_domain)
+        return {domain: int(score) for domain, score in zip(domains, scores) if pd.notna(score)}
+
+    def _by_slot(self, values: Dict[str, float]) -> Dict[str, int]:
+        """Key values as brand / competitor_N, skipping domains without a value."""
+        slots = {}
+        if self.brand_domain in values:
+            slots['brand'] = int(values[self.brand_domain])
+        for i, domain in enumerate(self.competitor_domains, start=1):
+            if domain in values:
+                slots[f"competitor_{i}"] = int(values[domain])
+        return slots
+
+    def _competitor_avg_dr(self) -> Optional[int]:
+        scores = [self.authority[d] for d in self.competitor_domains if d in self.authority]
+        return round(sum(scores) / len(scores)) if scores else None
+
+    def analyze_competitive(self) -> Optional[CompetitiveData]:
+        """Benchmark the brand against its competitors for the latest month.
+
+        Returns:
+            CompetitiveData or None if no Ahrefs benchmarking data is loaded
+        """
+        if not self.has_data:
+            return None
+
+        traffic = latest_values(self.benchmarking, [TRAFFIC_METRIC]).to_dict()
+        referring = latest_values(self.benchmarking, [REFERRING_DOMAINS_METRIC]).to_dict()
+        total_keywords: Dict[str, float] = {}
+        page_1_keywords: Dict[str, float] = {}
+        if self.position_rank is not None:
+            buckets = list(self.position_rank['metric'].unique())
+            total_keywords = latest_values(self.position_rank, buckets).to_dict()
+            page_1_keywords = latest_values(self.position_rank, PAGE_1_BUCKETS).to_dict()
+
+        brand_traffic = traffic.get(self.brand_domain, 0)
+        competitor_traffic = [traffic[d] for d in self.competitor_domains if d in traffic]
+        avg_traffic = sum(competitor_traffic) / len(competitor_traffic) if competitor_traffic else 0
+        traffic_ratio = brand_traffic / avg_traffic if avg_traffic else 1.0
+
+        if traffic_ratio < 0.5:
+            priority = "H"
+        elif traffic_ratio < 1.0:
+            priority = "M"
+        else:
+            priority = "L"
+
+        brand_dr = self.authority.get(self.brand_domain)
+        avg_dr = self._competitor_avg_dr()
+        if brand_dr is not None and avg_dr is not None and avg_dr > brand_dr:
+            key_message = (f"{self.brand_name} trails competitors on domain authority by "
+                           f"{avg_dr - brand_dr} points, which restricts ranking potential for "
+                           f"high-volume commercial terms.")
+        elif traffic_ratio < 1.0:
+            key_message = (f"{self.brand_name} draws {brand_traffic:,.0f} monthly organic visits against "
+                           f"a competitor average of {avg_traffic:,.0f}, leaving most category demand "
+                           f"to competing sites.")
+        else:
+            key_message = (f"{self.brand_name} leads the competitive set with {brand_traffic:,.0f} monthly "
+                           f"organic visits, a position that needs defending as competitors invest.")
+
+        leader = max(traffic, key=traffic.get) if traffic else self.brand_domain
+        observation = (f"{leader} leads organic traffic in the latest month; {self.brand_domain} holds "
+                       f"{referring.get(self.brand_domain, 0):,.0f} referring domains across a set of "
+                       f"{len(self.competitor_domains)} competitors.")
+
+        return CompetitiveData(
+            key_message=key_message,
+            observation=observation,
+            priority=priority,
+            brand_name=self.brand_name,
+            competitors=self.competitor_domains,
+            metrics=CompetitiveMetrics(
+                domain_rating=self._by_slot(self.authority),
+                monthly_traffic=self._by_slot(traffic),
+                total_keywords=self._by_slot(total_keywords),
+                page_1_keywords=self._by_slot(page_1_keywords),
+                referring_domains=self._by_slot(referring)
+            )
+        )
+
+    def analyze_domain_authority(self, fallback: DomainAuthorityData) -> Optional[DomainAuthorityData]:
+        """Analyze the brand's referring-domain trend and authority gap.
+
+        Fields without a data source (authority history is not part of the
+        benchmarking export) are taken from ``fallback``.
+
+        Args:
+            fallback: Values used where the data has no answer
+
+        Returns:
+            DomainAuthorityData or None if no Ahrefs benchmarking data is loaded
+        """
+        if not self.has_data:
+            return None
+
+        trend = metric_series(self.benchmarking, self.brand_domain, REFERRING_DOMAINS_METRIC)
+        if trend.empty:
+            return None
+
+        first, last = trend.iloc[0], trend.iloc[-1]
+        new_rd_monthly_avg = max(0, round((last - first) / (len(trend) - 1))) if len(trend) > 1 else 0
+        growth_pct = (last - first) / first * 100 if first else 0.0
+
+        current_dr = self.authority.get(self.brand_domain, fallback.current_dr)
+        avg_dr = self._competitor_avg_dr()
+        competitor_avg_dr = avg_dr if avg_dr is not None else fallback.competitor_avg_dr
+        dr_gap = max(0, competitor_avg_dr - current_dr)
+        if self.brand_domain in self.authority:
+            # A single authority snapshot: no history to compare against
+            dr_6_months_ago, dr_change, dr_trend = current_dr, 0, "stable"
+        else:
+            dr_6_months_ago, dr_change, dr_trend = (fallback.dr_6_months_ago,
+                                                   fallback.dr_change, fallback.dr_trend)
+
+        priority = "H" if dr_gap >= 10 or growth_pct < 0 else "M" if dr_gap > 0 else "L"
+        direction = "grew" if last >= first else "fell"
+
+        return DomainAuthorityData(
+            key_message=(f"Referring domains {direction} {abs(growth_pct):.0f}% to {last:,.0f} over "
+                         f"{len(trend)} months while domain rating sits {dr_gap} points below the "
+                         f"competitor average, limiting SERP competitiveness for valuable terms."),
+            observation=(f"{self.brand_domain} adds about {new_rd_monthly_avg} referring domains a month "
+                         f"(from {first:,.0f} to {last:,.0f})."),
+            priority=priority,
+            current_dr=current_dr,
+            dr_6_months_ago=dr_6_months_ago,
+            dr_trend=dr_trend,
+            dr_change=dr_change,
+            referring_domains=int(last),
+            new_rd_monthly_avg=new_rd_monthly_avg,
+            competitor_avg_dr=competitor_avg_dr,
+            dr_gap=dr_gap,
+            rd_trend=[
+                RDTrendPoint(month=month.strftime('%b %Y'), referring_domains=int(value))
+                for month, value in trend.items()
+            ]
+        )
@@ -0,0 +1,182 @@
+"""Dependency graph of analysis steps, run concurrently where the graph allows."""
+import time
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class Step(NamedTuple):
+    """One node of an analysis graph.
+
+    ``run`` receives the results of the steps named in ``deps``, keyed by
+    step name, and returns the step's own result.
+    """
+    key: str
+    run: Callable[[Dict[str, Any]], Any]
+    deps: Tuple[str, ...] = ()
+
+
+class StepTiming(NamedTuple):
+    """When a step ran, in seconds from the start of the graph run."""
+    key: str
+    start: float
+    end: float
+
+    @property
+    def seconds(self) -> float:
+        return self.end - self.start
+
+
+class DagReport(NamedTuple):
+    """Timing of one graph run."""
+    timings: Dict[str, StepTiming]
+    wall_seconds: float
+    critical_path: List[str]
+    critical_seconds: float
+
+    @property
+    def serial_seconds(self) -> float:
+        """Time the steps would take one after another."""
+        return sum(timing.seconds for timing in self.timings.values())
+
+    def describe(self) -> str:
+        """One-line summary for logging."""
+        return (f"wall {self.wall_seconds:.2f}s, critical path {self.critical_seconds:.2f}s "
+                f"({' -> '.join(self.critical_path)}), serial {self.serial_seconds:.2f}s")
+
+
+class AnalysisDAG:
+    """Runs steps as soon as the steps they depend on have finished.
+
+    Independent steps run concurrently on a thread pool. Threads rather
+    than processes, because steps share the loader's parsed workbooks and
+    parsed reports, which would otherwise be pickled to every worker.
+    """
+
+    def __init__(self, steps: Sequence[Step]):
+        """Initialize graph.
+
+        Args:
+            steps: Steps in the order they are run when only one worker is used
+
+        Raises:
+            ValueError: If step names repeat, a dependency is unknown, or
+                        the steps depend on each other in a cycle
+        """
+        self.steps: Dict[str, Step] = {}
+        for step in steps:
+            if step.key in self.steps:
+                raise ValueError(f"Duplicate step {step.key}")
+            self.steps[step.key] = step
+        for step in self.steps.values():
+            unknown = [dep for dep in step.deps if dep not in self.steps]
+            if unknown:
+                raise ValueError(f"Step {step.key} depends on unknown steps {unknown}")
+        self.order = self._topological_order()
+
+    def _topological_order(self) -> List[str]:
+        order, done, visiting = [], set(), set()
+
+        def visit(key: str):
+            if key in done:
+                return
+            if key in visiting:
+                raise ValueError(f"Dependency cycle through step {key}")
+            visiting.add(key)
+            for dep in self.steps[key].deps:
+                visit(dep)
+            visiting.discard(key)
+            done.add(key)
+            order.append(key)
+
+        for key in self.steps:
+            visit(key)
+        return order
+
+    def run(self, jobs: int = 1) -> Tuple[Dict[str, Any], DagReport]:
+        """Run every step.
+
+        Args:
+            jobs: Worker threads (1 runs the steps inline, in declared order)
+
+        Returns:
+            Tuple of (results by step name, timing report)
+
+        Raises:
+            Exception: The first exception raised by a step; steps not yet
+                       started are cancelled
+        """
+        results: Dict[str, Any] = {}
+        timings: Dict[str, StepTiming] = {}
+        origin = time.perf_counter()
+
+        def execute(key: str) -> Any:
+            step = self.steps[key]
+            start = time.perf_counter() - origin
+            result = step.run({dep: results[dep] for dep in step.deps})
+            timings[key] = StepTiming(key, start, time.perf_counter() - origin)
+            return result
+
+        if jobs <= 1:
+            for key in self.order:
+                results[key] = execute(key)
+        else:
+            self._run_pool(execute, results, jobs)
+
+        wall = time.perf_counter() - origin
+        path, critical = self._critical_path(timings)
+        return results, DagReport(timings, wall, path, critical)
+
+    def _run_pool(self, execute: Callable[[str], Any], results: Dict[str, Any], jobs: int):
+        waiting = {key: set(step.deps) for key, step in self.steps.items()}
+        dependents: Dict[str, List[str]] = {key: [] for key in self.steps}
+        for key, step in self.steps.items():
+            for dep in step.deps:
+                dependents[dep].append(key)
+
+        with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix='analysis') as pool:
+            running = {}
+
+            def submit_ready():
+                for key in [key for key in self.order if key in waiting and not waiting[key]]:
+                    del waiting[key]
+                    running[pool.submit(execute, key)] = key
+
+            submit_ready()
+            while running:
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    key = running.pop(future)
+                    try:
+                        results[key] = future.result()
+                    except Exception:
+                        for pending in running:
+                            pending.cancel()
+                        raise
+                    for dependent in dependents[key]:
+                        waiting[dependent].discard(key)
+                submit_ready()
+
+    def _critical_path(self, timings: Dict[str, StepTiming]) -> Tuple[List[str], float]:
+        """Longest chain of dependent steps by measured time.
+
+        This is the least time the graph can take however many workers run it.
+        """
+        finish: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+        for key in self.order:
+            slowest = max(self.steps[key].deps, key=lambda dep: finish[dep], default=None)
+            previous[key] = slowest
+            finish[key] = timings[key].seconds + (finish[slowest] if slowest is not None else 0.0)
+
+        if not finish:
+            return [], 0.0
+        key = max(finish, key=finish.get)
+        total = finish[key]
+        path = []
+        while key is not None:
+            path.append(key)
+            key = previous[key]
+        return path[::-1], total
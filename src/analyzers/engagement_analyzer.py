@@ -0,0 +1,127 @@
+"""Analyzer for organic user engagement (Slide 9)."""
+import calendar
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+import logging
+from src.data_ingestion.ga4_parser import (
+    GA4Cube, SESSIONS, ENGAGEMENT_RATE, ENGAGED_SESSIONS, AVG_SESSION_DURATION, ORGANIC_SEARCH,
+    format_duration
+)
+from src.models.audit_data import EngagementData, PeriodEngagement
+from src.utils.config import threshold
+
+logger = logging.getLogger(__name__)
+
+# Engagement-rate change (%) treated as flat
+STABLE_TREND_PCT = 1.0
+
+
+class EngagementAnalyzer:
+    """Compares Organic Search engagement between the two halves of a GA4 channel report."""
+
+    def __init__(self, channels: Optional[GA4Cube] = None, channel: str = ORGANIC_SEARCH,
+                 thresholds: Optional[Dict[str, Dict[str, float]]] = None):
+        """Initialize analyzer with data sources.
+
+        Args:
+            channels: Parsed GA4 channel report
+            channel: Channel to analyze
+            thresholds: "engagement" priority thresholds (defaults if omitted)
+        """
+        self.channels = channels
+        self.channel = channel
+        self.thresholds = thresholds
+
+    def _month_name(self, month: int) -> str:
+        start = self.channels.month_start(month)
+        return start.strftime('%b %Y') if start is not None else calendar.month_abbr[month]
+
+    def _period(self, row: np.ndarray, months: List[int],
+                indices: np.ndarray) -> Tuple[PeriodEngagement, float, float, float]:
+        """Aggregate one period of the channel's monthly metrics.
+
+        Returns:
+            Tuple of (period model, engagement rate, sessions, average duration in seconds)
+        """
+        cube = self.channels
+        block = row[indices]
+        sessions = block[:, cube.metric(SESSIONS)]
+        # Monthly rates are averaged as in the GA4 schema; durations are session-weighted
+        rate = float(np.nanmean(block[:, cube.metric(ENGAGEMENT_RATE)]))
+        engaged = float(np.nansum(block[:, cube.metric(ENGAGED_SESSIONS)]))
+        weight = np.nansum(sessions)
+        duration = float(np.nansum(block[:, cube.metric(AVG_SESSION_DURATION)] * sessions) / weight) if weight else 0.0
+
+        period = PeriodEngagement(
+            range=f"{self._month_name(months[indices[0]])} - {self._month_name(months[indices[-1]])}",
+            engagement_rate=f"{rate * 100:.2f}%",
+            engaged_sessions=f"{engaged:,.0f}",
+            avg_engagement_time=format_duration(duration)
+        )
+        return period, rate, float(weight), duration
+
+    def analyze(self) -> Optional[EngagementData]:
+        """Compare the previous and current half of the report period.
+
+        Returns:
+            EngagementData or None if no channel report with the channel is loaded
+        """
+        if self.channels is None:
+            return None
+
+        cube = self.channels
+        index = cube.label(self.channel)
+        if index is None or len(cube.months) < 2:
+            logger.warning(f"GA4 channel report has no monthly '{self.channel}' data")
+            return None
+
+        row = cube.values[index]
+        split = len(cube.months) // 2
+        positions = np.arange(len(cube.months))
+        prev, prev_rate, prev_sessions, _ = self._period(row, cube.months, positions[:split])
+        curr, curr_rate, curr_sessions, curr_duration = self._period(row, cube.months, positions[split:])
+
+        trend_pct = round((curr_rate - prev_rate) / prev_rate * 100, 1) if prev_rate else 0.0
+        sessions_pct = (curr_sessions - prev_sessions) / prev_sessions * 100 if prev_sessions else 0.0
+
+        if trend_pct > STABLE_TREND_PCT:
+            direction = "up"
+        elif trend_pct < -STABLE_TREND_PCT:
+            direction = "down"
+        else:
+            direction = "stable"
+
+        rate_drop = threshold(self.thresholds, 'engagement', 'high', 'engagement_rate_drop_above')
+        min_seconds = threshold(self.thresholds, 'engagement', 'high', 'avg_engagement_time_below_seconds')
+        if trend_pct < -rate_drop or 0 < curr_duration < min_seconds:
+            priority = "H"
+        elif direction == "down":
+            priority = "M"
+        else:
+            priority = "L"
+
+        if direction == "down":
+            traffic = ("traffic growth" if sessions_pct > 5
+                       else "falling traffic" if sessions_pct < -5 else "stable traffic")
+            key_message = (f"Engagement rate declined {abs(trend_pct):.0f}% despite {traffic}, indicating "
+                           f"content-intent mismatch that may erode conversion potential.")
+        elif direction == "up":
+            key_message = (f"Engagement rate improved {trend_pct:.0f}% to {curr.engagement_rate}, showing "
+                           f"content increasingly matches search intent and supports conversions.")
+        else:
+            key_message = (f"Engagement rate held steady at {curr.engagement_rate}, a stable base that "
+                           f"content improvements can build on for conversions.")
+
+        observation = (f"{self.channel} visits averaged {curr.avg_engagement_time} in {curr.range} "
+                       f"with {curr.engaged_sessions} engaged sessions, against "
+                       f"{prev.engaged_sessions} in {prev.range}.")
+
+        return EngagementData(
+            key_message=key_message,
+            observation=observation,
+            priority=priority,
+            prev_period=prev,
+            curr_period=curr,
+            trend_pct=trend_pct,
+            trend_direction=direction
+        )
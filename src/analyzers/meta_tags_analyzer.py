@@ -0,0 +1,124 @@
+"""Analyzer for missing on-page tags from a Screaming Frog crawl (Slide 13)."""
+import logging
+from typing import List, Optional
+import pandas as pd
+from src.data_ingestion.streaming import StreamColumns, ROWS_COLUMN, project_columns
+from src.data_ingestion.table_store import Table
+from src.models.audit_data import MetaTagIssue, MetaTagsData
+
+logger = logging.getLogger(__name__)
+
+SCREAMING_FROG = 'Screaming Frog'
+
+# Tag column -> (tag name, priority when pages lack it)
+TAG_ISSUES = {
+    'Title 1': ("title tag", 'H'),
+    'Meta Description 1': ("meta description", 'M'),
+    'H1-1': ("H1 heading", 'M'),
+}
+
+PRIORITY_ORDER = ['C', 'H', 'M', 'L']
+
+
+class MetaTagsAnalyzer:
+    """Counts pages missing a title, meta description or H1 in a crawl.
+
+    Works from streamed crawl summaries (see ``DataLoader.stream_columns``)
+    and from crawls loaded whole alike, whether held in memory or in the
+    table store: a crawl table is counted into the same summary first.
+    """
+
+    # Columns read from streamed Screaming Frog crawls, and how each is folded
+    STREAM_COLUMNS: StreamColumns = {
+        SCREAMING_FROG: {column: 'presence' for column in TAG_ISSUES},
+    }
+
+    def __init__(self, crawl_summary: Optional[pd.DataFrame] = None,
+                 crawl: Optional[Table] = None):
+        """Initialize analyzer with data sources.
+
+        Args:
+            crawl_summary: Streamed Screaming Frog summary (tidy column,
+                           kind, key, value frame)
+            crawl: Screaming Frog internal crawl loaded whole (see
+                   ``DataLoader.get_table``)
+        """
+        self.crawl_summary = crawl_summary
+        self.crawl = crawl
+
+    def _summaries(self) -> List[pd.DataFrame]:
+        """Every crawl as a tidy summary frame."""
+        summaries = []
+        if self.crawl_summary is not None and not self.crawl_summary.empty:
+            summaries.append(self.crawl_summary)
+
+        if self.crawl is not None:
+            columns = project_columns(self.crawl.columns, self.STREAM_COLUMNS[SCREAMING_FROG])
+            if columns:
+                summaries.append(self._count_presence(self.crawl, list(columns)))
+        return summaries
+
+    @staticmethod
+    def _count_presence(table: Table, columns: List[str]) -> pd.DataFrame:
+        """Present / missing counts of columns, in the streamed summary's tidy layout.
+
+        Counting runs in the database for crawls in the table store.
+        """
+        rows = len(table)
+        records = [(ROWS_COLUMN, 'rows', 'count', float(rows))]
+        for col in columns:
+            missing = table.count({col: None})
+            try:
+                missing += table.count({col: ''})
+            except Exception:
+                # Typed (e.g. numeric) columns hold no empty strings to compare with
+                pass
+            records.append((col, 'presence', 'present', float(rows - missing)))
+            records.append((col, 'presence', 'missing', float(missing)))
+        return pd.DataFrame(records, columns=['column', 'kind', 'key', 'value'])
+
+    def analyze(self) -> Optional[MetaTagsData]:
+        """Count pages missing each tag across every loaded crawl.
+
+        Returns:
+            MetaTagsData or None if no crawl holds any of the tag columns
+        """
+        summaries = self._summaries()
+        if not summaries:
+            return None
+
+        # Summaries of several crawls add up; presence and row counts are sums
+        totals = pd.concat(summaries, ignore_index=True).groupby(['column', 'kind', 'key'])['value'].sum()
+        pages = int(totals.get((ROWS_COLUMN, 'rows', 'count'), 0))
+        wanted = {column.lower(): column for column in TAG_ISSUES}
+
+        missing = {}
+        for (column, kind, key), value in totals.items():
+            tag = wanted.get(str(column).strip().lower())
+            if tag is not None and kind == 'presence' and key == 'missing':
+                missing[tag] = missing.get(tag, 0) + int(value)
+        if not missing:
+            logger.warning("Screaming Frog crawl has none of the title, meta description or H1 columns")
+            return None
+
+        found = [(tag, count) for tag, count in sorted(missing.items(), key=lambda item: -item[1]) if count > 0]
+        issues = [
+            MetaTagIssue(issue_name=f"Missing {TAG_ISSUES[tag][0]}", url_count=count, priority=TAG_ISSUES[tag][1])
+            for tag, count in found
+        ]
+        if not issues:
+            return MetaTagsData(
+                key_message=f"All {pages:,} crawled pages have a title, meta description and H1.",
+                observation="On-page tags are in place across the crawl.",
+                priority='L',
+                issues=[]
+            )
+
+        tag, count = found[0]
+        return MetaTagsData(
+            key_message=f"{count:,} of {pages:,} crawled pages lack a {TAG_ISSUES[tag][0]}, which keeps "
+                        f"search engines from understanding and ranking those pages.",
+            observation=f"{len(issues)} on-page tag issue{'s' if len(issues) != 1 else ''} found across the crawl.",
+            priority=min((issue.priority for issue in issues), key=PRIORITY_ORDER.index),
+            issues=issues
+        )
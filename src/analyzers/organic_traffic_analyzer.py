@@ -1,7 +1,11 @@
 """Analyzer for organic traffic (Slide 7)."""
+import numpy as np
 import pandas as pd
-from typing import Optional, Literal
+from typing import Dict, Optional, Literal
 import logging
+from src.data_ingestion.ga4_parser import GA4Cube, SESSIONS
+from src.data_ingestion.table_store import Table
+from src.utils.config import threshold
 from src.models.audit_data import OrganicTrafficData, ChannelDistribution, CountryData, KeywordDistribution
 
 logger = logging.getLogger(__name__)
@@ -12,11 +16,27 @@ class OrganicTrafficAnalyzer:
 
     def __init__(self, ga4_data: Optional[pd.DataFrame] = None,
                  semrush_data: Optional[pd.DataFrame] = None,
-                 gsc_data: Optional[pd.DataFrame] = None):
-        """Initialize analyzer with data sources."""
+                 gsc_data: Optional[pd.DataFrame] = None,
+                 ga4_channels: Optional[GA4Cube] = None,
+                 ga4_countries: Optional[GA4Cube] = None,
+                 thresholds: Optional[Dict[str, Dict[str, float]]] = None,
+                 semrush_keywords: Optional[Table] = None):
+        """Initialize analyzer with data sources.
+
+        Parsed GA4 channel and countries reports take precedence over
+        column matching on the raw ``ga4_data`` frame. ``thresholds`` are
+        the "organic_traffic" priority thresholds (defaults if omitted).
+        ``semrush_keywords`` is the SEMrush organic keywords report as a
+        table (see ``DataLoader.get_table``); position counts are run as
+        queries on it, so an export held on disk is never read into memory.
+        """
         self.ga4_data = ga4_data
         self.semrush_data = semrush_data
         self.gsc_data = gsc_data
+        self.ga4_channels = ga4_channels
+        self.ga4_countries = ga4_countries
+        self.thresholds = thresholds
+        self.semrush_keywords = semrush_keywords
 
     def analyze(self) -> OrganicTrafficData:
         """Perform organic traffic analysis.
@@ -57,6 +77,9 @@ class OrganicTrafficAnalyzer:
 
     def _analyze_channels(self) -> ChannelDistribution:
         """Analyze channel distribution from GA4 data."""
+        if self.ga4_channels is not None:
+            return self._channels_from_report(self.ga4_channels)
+
         if self.ga4_data is None or self.ga4_data.empty:
             logger.warning("No GA4 data available for channel analysis")
             # Return default distribution
@@ -107,8 +130,34 @@ class OrganicTrafficAnalyzer:
             referral_pct=5.0
         )
 
+    @staticmethod
+    def _channels_from_report(report: GA4Cube) -> ChannelDistribution:
+        """Channel shares of whole-period sessions from a parsed channel report."""
+        sessions = report.totals[:, report.metric(SESSIONS)]
+        total = report.grand_total[report.metric(SESSIONS)]
+        if np.isnan(total):
+            total = np.nansum(sessions)
+
+        labels = pd.Series(report.labels).str.lower()
+        social = labels.str.contains('social').to_numpy()
+        paid = labels.str.startswith('paid').to_numpy() & ~social
+
+        def share(mask: np.ndarray) -> float:
+            return round(float(np.nansum(sessions[mask]) / total * 100), 2) if total else 0.0
+
+        return ChannelDistribution(
+            organic_pct=share((labels == 'organic search').to_numpy()),
+            direct_pct=share((labels == 'direct').to_numpy()),
+            paid_pct=share(paid),
+            social_pct=share(social),
+            referral_pct=share((labels == 'referral').to_numpy())
+        )
+
     def _analyze_countries(self) -> list[CountryData]:
         """Analyze top countries by sessions."""
+        if self.ga4_countries is not None:
+            return self._countries_from_report(self.ga4_countries)
+
         if self.ga4_data is None or self.ga4_data.empty:
             return [
                 CountryData(country="United States", sessions=10000, percentage=45.0),
@@ -147,8 +196,34 @@ class OrganicTrafficAnalyzer:
 
         return []
 
+    @staticmethod
+    def _countries_from_report(report: GA4Cube, top_n: int = 5) -> list[CountryData]:
+        """Top countries by whole-period sessions from a parsed countries report."""
+        sessions = np.nan_to_num(report.totals[:, report.metric(SESSIONS)])
+        total = report.grand_total[report.metric(SESSIONS)]
+        if np.isnan(total):
+            total = sessions.sum()
+
+        top = np.argsort(-sessions, kind='stable')[:top_n]
+        return [
+            CountryData(
+                country=report.labels[i],
+                sessions=int(sessions[i]),
+                percentage=round(float(sessions[i] / total * 100), 2) if total else 0.0
+            )
+            for i in top
+        ]
+
     def _analyze_keyword_positions(self) -> KeywordDistribution:
         """Analyze keyword position distribution from SEMrush data."""
+        if self.semrush_keywords is not None and len(self.semrush_keywords) > 0:
+            try:
+                distribution = self._positions_from_table(self.semrush_keywords)
+                if distribution is not None:
+                    return distribution
+            except Exception as e:
+                logger.error(f"Error analyzing keyword positions: {e}")
+
         if self.semrush_data is None or self.semrush_data.empty:
             return KeywordDistribution(
                 pos_1_3=15.0,
@@ -158,11 +233,7 @@ class OrganicTrafficAnalyzer:
             )
 
         try:
-            position_col = None
-            for col in self.semrush_data.columns:
-                if 'position' in str(col).lower():
-                    position_col = col
-                    break
+            position_col = self._position_column(self.semrush_data.columns)
 
             if position_col:
                 positions = self.semrush_data[position_col].dropna()
@@ -174,12 +245,7 @@ class OrganicTrafficAnalyzer:
                     pos_11_20 = len(positions[(positions >= 11) & (positions <= 20)])
                     pos_21_plus = len(positions[positions >= 21])
 
-                    return KeywordDistribution(
-                        pos_1_3=round((pos_1_3 / total) * 100, 2),
-                        pos_4_10=round((pos_4_10 / total) * 100, 2),
-                        pos_11_20=round((pos_11_20 / total) * 100, 2),
-                        pos_21_plus=round((pos_21_plus / total) * 100, 2)
-                    )
+                    return self._distribution(pos_1_3, pos_4_10, pos_11_20, pos_21_plus, total)
 
         except Exception as e:
             logger.error(f"Error analyzing keyword positions: {e}")
@@ -191,25 +257,63 @@ class OrganicTrafficAnalyzer:
             pos_21_plus=30.0
         )
 
+    @staticmethod
+    def _position_column(columns) -> Optional[str]:
+        """First column holding keyword positions."""
+        for col in columns:
+            if 'position' in str(col).lower():
+                return col
+        return None
+
+    @staticmethod
+    def _distribution(pos_1_3: int, pos_4_10: int, pos_11_20: int, pos_21_plus: int,
+                      total: int) -> KeywordDistribution:
+        return KeywordDistribution(
+            pos_1_3=round((pos_1_3 / total) * 100, 2),
+            pos_4_10=round((pos_4_10 / total) * 100, 2),
+            pos_11_20=round((pos_11_20 / total) * 100, 2),
+            pos_21_plus=round((pos_21_plus / total) * 100, 2)
+        )
+
+    def _positions_from_table(self, table: Table) -> Optional[KeywordDistribution]:
+        """Position distribution counted by filtered queries on a keywords table."""
+        position_col = self._position_column(table.columns)
+        if position_col is None:
+            return None
+
+        total = len(table) - table.count({position_col: None})
+        if total <= 0:
+            return None
+
+        def between(low: int, high: int) -> int:
+            # A filter holds one condition per column, so count a range as a difference
+            return table.count({position_col: ('<=', high)}) - table.count({position_col: ('<', low)})
+
+        return self._distribution(between(1, 3), between(4, 10), between(11, 20),
+                                  table.count({position_col: ('>=', 21)}), total)
+
     def _calculate_yoy_change(self) -> Optional[float]:
         """Calculate year-over-year traffic change."""
         # This would require time-series data - return None for now
         return None
 
+    def _threshold(self, level: str, name: str) -> float:
+        return threshold(self.thresholds, 'organic_traffic', level, name)
+
     def _determine_priority(self, channels: ChannelDistribution,
                           keyword_dist: KeywordDistribution,
                           yoy_change: Optional[float]) -> Literal["C", "H", "M", "L"]:
         """Determine priority based on analysis criteria."""
         # Organic < 30% of total traffic → Critical
-        if channels.organic_pct < 30:
+        if channels.organic_pct < self._threshold('critical', 'organic_pct_below'):
             return "C"
 
         # Organic declining >15% YoY → High
-        if yoy_change and yoy_change < -15:
+        if yoy_change and yoy_change < -self._threshold('high', 'yoy_decline_above'):
             return "H"
 
         # >50% keywords on page 2+ → High
-        if keyword_dist.pos_21_plus + keyword_dist.pos_11_20 > 50:
+        if keyword_dist.pos_21_plus + keyword_dist.pos_11_20 > self._threshold('high', 'page_2_plus_keywords_above'):
             return "H"
 
         # Organic dominant and growing → Low
@@ -225,20 +329,21 @@ class OrganicTrafficAnalyzer:
                              priority: Literal["C", "H", "M", "L"]) -> str:
         """Generate unified key message following the pattern."""
         # Pattern: "Organic search is [status] but [limitation], leaving [business consequence]."
+        organic_floor = self._threshold('critical', 'organic_pct_below')
 
         # Determine status
         if channels.organic_pct > 50:
             status = f"the dominant channel at {channels.organic_pct:.0f}% of traffic"
-        elif channels.organic_pct > 30:
+        elif channels.organic_pct > organic_floor:
             status = "stable"
         else:
             status = f"underperforming at only {channels.organic_pct:.0f}% of traffic"
 
         # Determine limitation
         page_2_plus = keyword_dist.pos_11_20 + keyword_dist.pos_21_plus
-        if page_2_plus > 50:
+        if page_2_plus > self._threshold('high', 'page_2_plus_keywords_above'):
             limitation = f"limited by {page_2_plus:.0f}% of keywords ranking beyond page 1"
-        elif channels.organic_pct < 30:
+        elif channels.organic_pct < organic_floor:
             limitation = "creating high dependency on paid channels"
         else:
             limitation = "constrained by mid-position keyword performance"
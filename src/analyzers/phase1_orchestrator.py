@@ -1,9 +1,23 @@
 """Phase 1 Orchestrator: Data Analysis & Strategic Insights."""
+import copy
 import logging
-from typing import Dict, Any
+import threading
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple
 from datetime import datetime
+import pandas as pd
 from src.data_ingestion.data_loader import DataLoader
+from src.analyzers.dag import AnalysisDAG, DagReport, Step
+from src.analyzers.result_cache import ResultCache, frame_fingerprint, table_fingerprint
+from src.utils.config import Thresholds, priority_thresholds, threshold
 from src.analyzers.organic_traffic_analyzer import OrganicTrafficAnalyzer
+from src.analyzers.competitive_analyzer import CompetitiveAnalyzer
+from src.analyzers.engagement_analyzer import EngagementAnalyzer
+from src.analyzers.meta_tags_analyzer import MetaTagsAnalyzer
+from src.data_ingestion.ahrefs_parser import BENCHMARKING_SHEET, POSITION_RANK_SHEET
+from src.data_ingestion.ga4_parser import GA4Cube, ORGANIC_SEARCH, SESSIONS, parse_ga4_report
+from src.data_ingestion.registry import SUMMARY_KIND
+from src.data_ingestion.streaming import StreamColumns, merge_stream_columns
+from src.data_ingestion.table_store import DiskTable, FrameTable
 from src.models.audit_data import (
     SEOAuditReport, AuditMetadata, SectionSummary,
     CompetitiveData, CompetitiveMetrics, EngagementData, PeriodEngagement,
@@ -16,96 +30,288 @@ from src.models.audit_data import (
 
 logger = logging.getLogger(__name__)
 
+# Analyzers reading streamed summaries of large exports (see ``stream_columns``)
+STREAM_CONSUMERS = (MetaTagsAnalyzer,)
+
+# Tools whose data each analysis reads. Analyses not listed use no loaded
+# data and are reused as they are when the data changes.
+ANALYSIS_TOOLS: Dict[str, FrozenSet[str]] = {
+    'organic_traffic': frozenset({'GA4', 'SEMrush', 'GSC'}),
+    'competitive': frozenset({'Ahrefs', 'SEMrush'}),
+    'engagement': frozenset({'GA4'}),
+    'meta_tags': frozenset({'Screaming Frog'}),
+    'domain_authority': frozenset({'Ahrefs', 'SEMrush'}),
+    'kpi': frozenset({'GA4'}),
+}
+
+# Orchestrator options each analysis's result depends on, besides its data.
+# Dotted names reach into dictionaries ('thresholds.engagement').
+ANALYSIS_CONFIG: Dict[str, Tuple[str, ...]] = {
+    'organic_traffic': ('thresholds.organic_traffic',),
+    'competitive': ('brand_name',),
+    'engagement': ('thresholds.engagement',),
+    'site_health': ('thresholds.site_health',),
+    'keyword_intent': ('brand_name',),
+    'domain_authority': ('brand_name',),
+}
+
+
+class Changes(NamedTuple):
+    """What changed since the last ``Phase1Orchestrator.execute``."""
+    tools: FrozenSet[str] = frozenset()
+    options: FrozenSet[str] = frozenset()
+
+    def affects(self, key: str) -> bool:
+        """Whether an analysis reads any of the changed data or options."""
+        return bool(ANALYSIS_TOOLS.get(key, frozenset()) & self.tools
+                    or self.options.intersection(ANALYSIS_CONFIG.get(key, ())))
+
 
 class Phase1Orchestrator:
     """Orchestrates Phase 1: Data Analysis & Strategic Insight generation."""
 
-    def __init__(self, data_loader: DataLoader, brand_name: str, website_type: str = "ecommerce"):
+    def __init__(self, data_loader: DataLoader, brand_name: str, website_type: str = "ecommerce",
+                 jobs: int = 1, result_cache: Optional[ResultCache] = None,
+                 thresholds: Optional[Thresholds] = None):
         """Initialize Phase 1 orchestrator.
 
         Args:
             data_loader: Loaded data from SEO tools
             brand_name: Client brand name
             website_type: Type of website (ecommerce, saas, content, local, marketplace)
+            jobs: Worker threads running independent analyses concurrently
+            result_cache: On-disk cache of analysis results; analyses whose
+                          inputs are unchanged since a cached run are skipped
+            thresholds: Priority thresholds by section (see ``src.utils.config``;
+                        defaults if omitted)
         """
         self.data_loader = data_loader
         self.brand_name = brand_name
         self.website_type = website_type
+        self.jobs = jobs
+        self.result_cache = result_cache
+        self.thresholds = copy.deepcopy(thresholds) if thresholds is not None else priority_thresholds()
+        # Input fingerprints by frame id, for frames read by several analyses
+        self._fingerprints: Dict[int, Tuple[pd.DataFrame, str]] = {}
+        self._competitive_analyzer: Optional[CompetitiveAnalyzer] = None
+        self._ga4_reports: Optional[Tuple[Optional[GA4Cube], Optional[GA4Cube]]] = None
+        # Shared parsed reports are built once even when analyses ask concurrently
+        self._competitive_lock = threading.Lock()
+        self._ga4_lock = threading.Lock()
+        self.insights: Dict[str, Any] = {}
+        self.last_report: Optional[DagReport] = None
+
+    @staticmethod
+    def stream_columns() -> StreamColumns:
+        """Columns the analyzers read from streamed exports, for ``DataLoader(stream_columns=...)``."""
+        return merge_stream_columns(*(consumer.STREAM_COLUMNS for consumer in STREAM_CONSUMERS))
+
+    def option(self, name: str) -> Any:
+        """Value of an option named in ``ANALYSIS_CONFIG``."""
+        value: Any = self
+        for part in name.split('.'):
+            value = value.get(part) if isinstance(value, dict) else getattr(value, part)
+        return value
+
+    def set_threshold(self, section: str, level: str, name: str, value: float) -> Set[str]:
+        """Change one priority threshold.
 
-    def execute(self) -> Dict[str, Any]:
-        """Execute Phase 1 analysis.
+        Args:
+            section: Section (e.g. 'engagement')
+            level: Priority level (e.g. 'high')
+            name: Threshold name (e.g. 'engagement_rate_drop_above')
+            value: New value
 
         Returns:
-            Dictionary containing all strategic insights organized by slide
+            Names of the changed options, to pass to ``execute`` (empty if
+            the value is unchanged)
         """
-        logger.info("=== Starting Phase 1: Data Analysis & Strategic Insights ===")
-
-        insights = {}
-
-        # Create metadata
-        insights['metadata'] = self._create_metadata()
-
-        # Slide 7: Organic Traffic Analysis
-        logger.info("Analyzing organic traffic...")
-        insights['organic_traffic'] = self._analyze_organic_traffic()
-
-        # Slide 8: Competitive Benchmarking
-        logger.info("Analyzing competitive landscape...")
-        insights['competitive'] = self._analyze_competitive()
-
-        # Slide 9: User Engagement
-        logger.info("Analyzing user engagement...")
-        insights['engagement'] = self._analyze_engagement()
-
-        # Slide 10: Site Health
-        logger.info("Analyzing site health...")
-        insights['site_health'] = self._analyze_site_health()
-
-        # Slide 11: Section Summary (General Overview)
-        logger.info("Generating section summary...")
-        insights['section_summary_organic'] = self._generate_section_summary(
-            [insights['organic_traffic'], insights['competitive'],
-             insights['engagement'], insights['site_health']]
-        )
-
-        # Slide 13: Meta Tags
-        logger.info("Analyzing meta tags...")
-        insights['meta_tags'] = self._analyze_meta_tags()
-
-        # Slide 14: Keyword Gap
-        logger.info("Analyzing keyword gaps...")
-        insights['keyword_gap'] = self._analyze_keyword_gap()
-
-        # Slide 15: Keyword Intent Distribution
-        logger.info("Analyzing keyword intent...")
-        insights['keyword_intent'] = self._analyze_keyword_intent()
-
-        # Slide 16: Content Summary
-        insights['section_summary_content'] = self._generate_content_summary(
-            [insights['meta_tags'], insights['keyword_gap'], insights['keyword_intent']]
-        )
+        levels = self.thresholds.setdefault(section, {}).setdefault(level, {})
+        if levels.get(name) == value:
+            return set()
+        levels[name] = value
+        return {f"thresholds.{section}"}
+
+    def _run(self, key: str, message: str, analyze: Callable[[], Any],
+             changes: Optional[Changes]) -> Any:
+        """Run one analysis, or reuse its last result if nothing it reads changed.
+
+        With a result cache, a result cached for the same inputs,
+        configuration and code is reused instead of running the analysis.
+        """
+        if changes is not None and key in self.insights and not changes.affects(key):
+            logger.debug(f"Reusing {key} insights; its data and options are unchanged")
+            return self.insights[key]
+
+        if self.result_cache is None:
+            logger.info(message)
+            return analyze()
+
+        cache_key = self.result_cache.make_key(
+            key, self._input_fingerprints(key),
+            {option: self.option(option) for option in ANALYSIS_CONFIG.get(key, ())})
+        cached = self.result_cache.get(key, cache_key)
+        if cached is not None:
+            logger.info(f"Reusing cached {key} insights; its inputs are unchanged")
+            return cached
+
+        logger.info(message)
+        result = analyze()
+        self.result_cache.put(key, cache_key, result)
+        return result
+
+    def _analysis_inputs(self, key: str) -> List[Tuple[str, Optional[pd.DataFrame]]]:
+        """Frames (or tables, see ``DataLoader.get_table``) an analysis reads, labelled."""
+        loader = self.data_loader
+        if key == 'organic_traffic':
+            return [
+                ('ga4', loader.get_ga4_data()),
+                ('semrush', loader.get_semrush_data()),
+                ('gsc', loader.get_gsc_data()),
+                ('ga4_channels', loader.get_sheet('GA4', header=None, kind='channels')),
+                ('ga4_countries', loader.get_sheet('GA4', header=None, kind='countries')),
+                ('semrush_keywords', loader.get_table('SEMrush', 'organic_keywords')),
+            ]
+        if key == 'meta_tags':
+            return [
+                ('screaming_frog_summary', loader.get_data('Screaming Frog', SUMMARY_KIND)),
+                ('screaming_frog', loader.get_table('Screaming Frog', 'internal')),
+            ]
+        if key in ('engagement', 'kpi'):
+            return [('ga4_channels', loader.get_sheet('GA4', header=None, kind='channels'))]
+        if key in ('competitive', 'domain_authority'):
+            return [
+                ('ahrefs_benchmarking', loader.get_sheet('Ahrefs', BENCHMARKING_SHEET, header=None)),
+                ('ahrefs_position_rank', loader.get_sheet('Ahrefs', POSITION_RANK_SHEET, header=None)),
+                ('semrush_domain_overview', loader.get_sheet('SEMrush', 'Domain Overview')),
+            ]
+        return []
+
+    def _input_fingerprints(self, key: str) -> List[Tuple[str, str]]:
+        """(label, fingerprint) of every frame an analysis reads."""
+        fingerprints = []
+        for label, df in self._analysis_inputs(key):
+            if isinstance(df, FrameTable):
+                df = df.df
+            elif isinstance(df, DiskTable):
+                fingerprints.append((label, table_fingerprint(df)))
+                continue
+            known = self._fingerprints.get(id(df))
+            if known is None or known[0] is not df:
+                known = (df, frame_fingerprint(df))
+                self._fingerprints[id(df)] = known
+            fingerprints.append((label, known[1]))
+        return fingerprints
+
+    def _analysis(self, key: str, message: str, analyze: Callable[[], Any],
+                  changes: Optional[Changes]) -> Step:
+        return Step(key, lambda inputs: self._run(key, message, analyze, changes))
+
+    def _summary(self, key: str, summarize: Callable[[List[Any]], Any], deps: Tuple[str, ...]) -> Step:
+        def run(inputs: Dict[str, Any]) -> Any:
+            # Unchanged when every summarized insight is the very object summarized last time
+            if key in self.insights and all(self.insights.get(dep) is inputs[dep] for dep in deps):
+                return self.insights[key]
+            return summarize([inputs[dep] for dep in deps])
+        return Step(key, run, deps)
+
+    def build_graph(self, changes: Optional[Changes] = None) -> AnalysisDAG:
+        """Declare the Phase 1 steps and what each depends on.
+
+        Steps are listed in slide order, which is also the order of the
+        insights dictionary. Only section summaries depend on other steps.
 
-        # Slide 18: Technical SEO
-        logger.info("Analyzing technical SEO...")
-        insights['technical_seo'] = self._analyze_technical_seo()
+        Args:
+            changes: What changed since the last run (None to run everything)
 
-        # Slide 19: Technical Summary
-        insights['section_summary_technical'] = self._generate_technical_summary(
-            [insights['technical_seo']]
-        )
+        Returns:
+            Analysis graph
+        """
+        return AnalysisDAG([
+            Step('metadata', lambda inputs: self._create_metadata()),
+            # Slides 7-10
+            self._analysis('organic_traffic', "Analyzing organic traffic...",
+                           self._analyze_organic_traffic, changes),
+            self._analysis('competitive', "Analyzing competitive landscape...",
+                           self._analyze_competitive, changes),
+            self._analysis('engagement', "Analyzing user engagement...",
+                           self._analyze_engagement, changes),
+            self._analysis('site_health', "Analyzing site health...",
+                           self._analyze_site_health, changes),
+            # Slide 11: Section Summary (General Overview)
+            self._summary('section_summary_organic', self._generate_section_summary,
+                          ('organic_traffic', 'competitive', 'engagement', 'site_health')),
+            # Slides 13-15
+            self._analysis('meta_tags', "Analyzing meta tags...",
+                           self._analyze_meta_tags, changes),
+            self._analysis('keyword_gap', "Analyzing keyword gaps...",
+                           self._analyze_keyword_gap, changes),
+            self._analysis('keyword_intent', "Analyzing keyword intent...",
+                           self._analyze_keyword_intent, changes),
+            # Slide 16: Content Summary
+            self._summary('section_summary_content', self._generate_content_summary,
+                          ('meta_tags', 'keyword_gap', 'keyword_intent')),
+            # Slide 18: Technical SEO
+            self._analysis('technical_seo', "Analyzing technical SEO...",
+                           self._analyze_technical_seo, changes),
+            # Slide 19: Technical Summary
+            self._summary('section_summary_technical', self._generate_technical_summary,
+                          ('technical_seo',)),
+            # Slide 21: Domain Authority
+            self._analysis('domain_authority', "Analyzing domain authority...",
+                           self._analyze_domain_authority, changes),
+            # Slide 22: Authority Summary
+            self._summary('section_summary_authority', self._generate_authority_summary,
+                          ('domain_authority',)),
+            # KPI Data
+            self._analysis('kpi', "Generating KPI data...", self._generate_kpi_data, changes),
+        ])
+
+    def execute(self, changed_tools: Optional[Set[str]] = None,
+                changed_options: Optional[Set[str]] = None) -> Dict[str, Any]:
+        """Execute Phase 1 analysis.
 
-        # Slide 21: Domain Authority
-        logger.info("Analyzing domain authority...")
-        insights['domain_authority'] = self._analyze_domain_authority()
+        Independent analyses run concurrently on ``jobs`` threads; each
+        section summary runs once the analyses it summarizes have finished.
+        When either change set is given, only the analyses reading changed
+        data or options run again, and only the summaries over them.
 
-        # Slide 22: Authority Summary
-        insights['section_summary_authority'] = self._generate_authority_summary(
-            [insights['domain_authority']]
-        )
+        Args:
+            changed_tools: Tools whose data changed since the last call (see
+                           ``DataLoader.refresh`` and ``DataLoader.set_excluded``)
+            changed_options: Options changed since the last call (see
+                             ``set_threshold``)
 
-        # KPI Data
-        insights['kpi'] = self._generate_kpi_data()
+        Returns:
+            Dictionary containing all strategic insights organized by slide
+        """
+        logger.info("=== Starting Phase 1: Data Analysis & Strategic Insights ===")
 
+        # Parsed reports shared between analyses are rebuilt from the new data
+        if changed_tools is not None:
+            if changed_tools & {'Ahrefs', 'SEMrush'}:
+                self._competitive_analyzer = None
+            if 'GA4' in changed_tools:
+                self._ga4_reports = None
+
+        if self.result_cache is not None:
+            self.result_cache.reset_stats()
+
+        changes = None
+        if changed_tools is not None or changed_options is not None:
+            changes = Changes(frozenset(changed_tools or ()), frozenset(changed_options or ()))
+
+        graph = self.build_graph(changes)
+        try:
+            results, self.last_report = graph.run(self.jobs)
+        finally:
+            self._fingerprints.clear()
+        insights = {key: results[key] for key in graph.steps}
+
+        self.insights = insights
+        logger.info(f"Phase 1 timing: {self.last_report.describe()}")
+        if self.result_cache is not None:
+            logger.info(f"Result cache: {self.result_cache.hits} hits, {self.result_cache.misses} misses")
         logger.info("=== Phase 1 Complete ===")
         return insights
 
@@ -122,20 +328,53 @@ class Phase1Orchestrator:
             website_type=self.website_type
         )
 
+    def _get_ga4_reports(self) -> Tuple[Optional[GA4Cube], Optional[GA4Cube]]:
+        """Parsed GA4 (channel, countries) reports, built on first use."""
+        with self._ga4_lock:
+            if self._ga4_reports is None:
+                self._ga4_reports = (
+                    parse_ga4_report(self.data_loader.get_sheet('GA4', header=None, kind='channels')),
+                    parse_ga4_report(self.data_loader.get_sheet('GA4', header=None, kind='countries'))
+                )
+            return self._ga4_reports
+
     def _analyze_organic_traffic(self):
         """Analyze organic traffic using OrganicTrafficAnalyzer."""
+        channels, countries = self._get_ga4_reports()
         analyzer = OrganicTrafficAnalyzer(
             ga4_data=self.data_loader.get_ga4_data(),
             semrush_data=self.data_loader.get_semrush_data(),
-            gsc_data=self.data_loader.get_gsc_data()
+            gsc_data=self.data_loader.get_gsc_data(),
+            ga4_channels=channels,
+            ga4_countries=countries,
+            thresholds=self.thresholds.get('organic_traffic'),
+            semrush_keywords=self.data_loader.get_table('SEMrush', 'organic_keywords')
         )
         return analyzer.analyze()
 
+    def _get_competitive_analyzer(self) -> CompetitiveAnalyzer:
+        """Competitive analyzer over the Ahrefs matrices, built on first use."""
+        with self._competitive_lock:
+            if self._competitive_analyzer is None:
+                self._competitive_analyzer = CompetitiveAnalyzer(
+                    brand_name=self.brand_name,
+                    benchmarking_sheet=self.data_loader.get_sheet('Ahrefs', BENCHMARKING_SHEET, header=None),
+                    position_rank_sheet=self.data_loader.get_sheet('Ahrefs', POSITION_RANK_SHEET, header=None),
+                    domain_overview=self.data_loader.get_sheet('SEMrush', 'Domain Overview')
+                )
+            return self._competitive_analyzer
+
     def _analyze_competitive(self):
         """Analyze competitive landscape."""
-        # Simplified competitive analysis
+        competitive = self._get_competitive_analyzer().analyze_competitive()
+        if competitive is not None:
+            return competitive
+
+        logger.warning("No Ahrefs benchmarking data available for competitive analysis")
+        # Simplified competitive analysis; the gap is the domain authority slide's
+        dr_gap = self._domain_authority_fallback().dr_gap
         return CompetitiveData(
-            key_message=f"{self.brand_name} trails competitors on domain authority by 15 points, which restricts ranking potential for high-volume commercial terms.",
+            key_message=f"{self.brand_name} trails competitors on domain authority by {dr_gap} points, which restricts ranking potential for high-volume commercial terms.",
             observation="Competitive analysis shows significant gaps in authority metrics compared to industry leaders.",
             priority="H",
             brand_name=self.brand_name,
@@ -151,6 +390,12 @@ class Phase1Orchestrator:
 
     def _analyze_engagement(self):
         """Analyze user engagement."""
+        engagement = EngagementAnalyzer(self._get_ga4_reports()[0],
+                                        thresholds=self.thresholds.get('engagement')).analyze()
+        if engagement is not None:
+            return engagement
+
+        logger.warning("No GA4 channel data available for engagement analysis")
         return EngagementData(
             key_message="Engagement rate declined 4% despite stable traffic, indicating content-intent mismatch that may erode conversion potential.",
             observation="Average engagement time remains below industry benchmarks, suggesting opportunities for content optimization.",
@@ -171,13 +416,22 @@ class Phase1Orchestrator:
             trend_direction="down"
         )
 
+    def _site_health_priority(self, score: int) -> str:
+        """Priority of a site health score under the "site_health" thresholds."""
+        section = self.thresholds.get('site_health')
+        for level, priority in (('critical', 'C'), ('high', 'H'), ('medium', 'M')):
+            if score < threshold(section, 'site_health', level, 'health_score_below'):
+                return priority
+        return 'L'
+
     def _analyze_site_health(self):
         """Analyze site health."""
+        score = 78
         return SiteHealthData(
             key_message="Site health score of 78% reflects moderate technical debt, causing crawl budget inefficiencies that limit indexing of new content.",
             observation="Technical foundation shows opportunities for optimization with concentrated issues in specific areas.",
-            priority="M",
-            score=78,
+            priority=self._site_health_priority(score),
+            score=score,
             pages_crawled="15,000",
             total_errors="1,500",
             critical_issues=[
@@ -220,6 +474,14 @@ class Phase1Orchestrator:
 
     def _analyze_meta_tags(self):
         """Analyze meta tags and on-page SEO."""
+        meta_tags = MetaTagsAnalyzer(
+            crawl_summary=self.data_loader.get_data('Screaming Frog', SUMMARY_KIND),
+            crawl=self.data_loader.get_table('Screaming Frog', 'internal')
+        ).analyze()
+        if meta_tags is not None:
+            return meta_tags
+
+        logger.warning("No Screaming Frog crawl data available for meta tag analysis")
         return MetaTagsData(
             key_message="420 pages have duplicate or missing titles, which prevents Google from properly indexing and ranking content.",
             observation="On-page optimization shows systematic issues across key landing pages.",
@@ -376,8 +638,9 @@ class Phase1Orchestrator:
             ]
         )
 
-    def _analyze_domain_authority(self):
-        """Analyze domain authority."""
+    @staticmethod
+    def _domain_authority_fallback() -> DomainAuthorityData:
+        """Domain authority figures used where the Ahrefs data has no answer."""
         return DomainAuthorityData(
             key_message="Domain rating stagnated at 45 while competitors grew 18%, widening the authority gap that limits SERP competitiveness for valuable terms.",
             observation="Backlink profile shows minimal growth with limited high-authority link acquisition.",
@@ -400,15 +663,26 @@ class Phase1Orchestrator:
             ]
         )
 
+    def _analyze_domain_authority(self):
+        """Analyze domain authority."""
+        fallback = self._domain_authority_fallback()
+        authority = self._get_competitive_analyzer().analyze_domain_authority(fallback)
+        if authority is not None:
+            return authority
+
+        logger.warning("No Ahrefs benchmarking data available for domain authority analysis")
+        return fallback
+
     def _generate_authority_summary(self, slide_data: list) -> SectionSummary:
         """Generate authority section summary."""
+        authority = slide_data[0]
         return SectionSummary(
             key_highlight="Authority Gap Limits Competitive Reach",
             observation="Stagnant domain authority prevents effective competition for high-difficulty keywords.",
             priority="H",
             issues=[
-                "Domain rating 15 points below competitor average",
-                "Minimal referring domain growth (12/month avg)",
+                f"Domain rating {authority.dr_gap} points below competitor average",
+                f"Referring domain growth of {authority.new_rd_monthly_avg}/month avg",
                 "Limited high-authority backlink acquisition"
             ],
             impacts=[
@@ -425,10 +699,16 @@ class Phase1Orchestrator:
 
     def _generate_kpi_data(self):
         """Generate KPI and benchmark data."""
+        organic_sessions = "25,000"
+        channels = self._get_ga4_reports()[0]
+        if channels is not None and channels.label(ORGANIC_SEARCH) is not None:
+            sessions = channels.totals[channels.label(ORGANIC_SEARCH), channels.metric(SESSIONS)]
+            organic_sessions = f"{sessions:,.0f}"
+
         return KPIData(
             current_ctr="2.8%",
             current_avg_position="18.5",
-            current_organic_sessions="25,000",
+            current_organic_sessions=organic_sessions,
             target_ctr="+1%",
             target_position_improvement="10-50%",
             target_traffic_improvement="+15%",
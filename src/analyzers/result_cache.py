@@ -0,0 +1,228 @@
+"""On-disk memoization of analysis results, keyed by what the analysis read."""
+import os
+import json
+import pickle
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+import pandas as pd
+from pydantic import BaseModel
+from src.data_ingestion.table_store import DiskTable, FrameTable, Table
+from src.models import audit_data
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESULT_CACHE_DIR = Path('.cache') / 'results'
+DEFAULT_RESULT_CACHE_MAX_BYTES = 256 * 1024 ** 2
+# Bump to invalidate every entry when the entry format changes
+RESULT_CACHE_VERSION = 1
+
+_SRC = Path(__file__).resolve().parent.parent
+# Source files whose edits can change an analysis result
+CODE_PATHS = [
+    _SRC / 'analyzers',
+    _SRC / 'models',
+    _SRC / 'data_ingestion' / 'ahrefs_parser.py',
+    _SRC / 'data_ingestion' / 'ga4_parser.py',
+]
+
+_code_version: Optional[str] = None
+
+
+def code_version() -> str:
+    """Digest of the analysis source code, computed once per process."""
+    global _code_version
+    if _code_version is None:
+        digest = hashlib.sha256()
+        for path in CODE_PATHS:
+            files = sorted(path.glob('*.py')) if path.is_dir() else [path]
+            for file in files:
+                digest.update(file.name.encode('utf-8'))
+                digest.update(file.read_bytes())
+        _code_version = digest.hexdigest()
+    return _code_version
+
+
+def _dtype_label(dtype) -> str:
+    """Dtype name, with object and string dtypes under one label."""
+    if pd.api.types.is_string_dtype(dtype) and not isinstance(dtype, pd.CategoricalDtype):
+        return 'string'
+    return str(dtype)
+
+
+def frame_fingerprint(df: Optional[pd.DataFrame], columns: Optional[Sequence[str]] = None) -> str:
+    """Digest of a frame's labels, dtypes and values.
+
+    Object and string dtypes holding the same values digest alike, so a
+    frame parsed from source and the same frame read back from the parsed
+    data cache share a fingerprint.
+
+    Args:
+        df: Frame (None for data that is not loaded)
+        columns: Only these columns (those present), if given
+
+    Returns:
+        Hex digest
+    """
+    if df is None:
+        return 'none'
+    if columns is not None:
+        df = df[[col for col in columns if col in df.columns]]
+
+    digest = hashlib.sha256()
+    digest.update(repr([(str(col), _dtype_label(dtype)) for col, dtype in df.dtypes.items()]).encode('utf-8'))
+    try:
+        digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    except TypeError:
+        # Unhashable cells (lists, dicts)
+        digest.update(pickle.dumps(df, protocol=5))
+    return digest.hexdigest()
+
+
+def table_fingerprint(table: Optional[Table]) -> str:
+    """Digest of a queryable table (see ``DataLoader.get_table``).
+
+    On-disk tables are named after the content digest of their source
+    files, so their names identify them without a scan.
+    """
+    if isinstance(table, DiskTable):
+        return 'tables:' + ','.join(sorted(table.names))
+    return frame_fingerprint(table.df if isinstance(table, FrameTable) else None)
+
+
+class ResultCache:
+    """Pydantic analysis results stored as JSON, one file per fingerprint.
+
+    A result is keyed by the step name, a fingerprint of every frame the
+    step reads, the configuration it depends on and ``code_version``, so
+    editing an export, changing a relevant option or changing the analysis
+    code all miss. Hits and misses are counted for the run summary.
+
+    Entries superseded that way are never read again, so the directory is
+    kept under ``max_bytes`` like ``FrameCache``: least recently used
+    entries go first, and a hit refreshes the entry's mtime.
+    """
+
+    def __init__(self, cache_dir: Path = DEFAULT_RESULT_CACHE_DIR,
+                 max_bytes: int = DEFAULT_RESULT_CACHE_MAX_BYTES):
+        """Initialize cache.
+
+        Args:
+            cache_dir: Directory holding entries (created if missing)
+            max_bytes: Size bound for the cache directory
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(step: str, inputs: Iterable[Tuple[str, str]], config: Dict[str, Any]) -> str:
+        """Build an entry key.
+
+        Args:
+            step: Step name
+            inputs: (label, fingerprint) of every input the step reads
+            config: Options the step's result depends on
+
+        Returns:
+            Hex digest
+        """
+        payload = json.dumps({
+            'version': RESULT_CACHE_VERSION,
+            'code': code_version(),
+            'step': step,
+            'inputs': sorted(inputs),
+            'config': config,
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, step: str, key: str) -> Path:
+        return self.cache_dir / f"{step}-{key[:32]}.json"
+
+    def reset_stats(self):
+        """Zero the hit and miss counts."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def get(self, step: str, key: str) -> Optional[BaseModel]:
+        """Read a result, counting the hit or miss.
+
+        Args:
+            step: Step name
+            key: Key from ``make_key``
+
+        Returns:
+            The stored model, or None on a miss
+        """
+        result = None
+        path = self._entry_path(step, key)
+        if path.exists():
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+                if entry.get('key') == key:
+                    model = getattr(audit_data, entry['model'])
+                    result = model.model_validate(entry['data'])
+                    # Refresh last-access time for LRU eviction
+                    os.utime(path)
+            except FileNotFoundError:
+                # Evicted by a concurrent put
+                pass
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable result cache entry {path.name}: {e}")
+
+        with self._lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return result
+
+    def put(self, step: str, key: str, result: Any):
+        """Store a result (only pydantic models from ``src.models.audit_data`` are cached)."""
+        if not isinstance(result, BaseModel) or getattr(audit_data, type(result).__name__, None) is not type(result):
+            return
+
+        path = self._entry_path(step, key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'key': key,
+                    'model': type(result).__name__,
+                    'data': result.model_dump(mode='json'),
+                }, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write result cache entry {path.name}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        self._evict()
+
+    def _evict(self):
+        """Remove least recently used entries until the cache fits its bound."""
+        entries = []
+        for path in self.cache_dir.glob('*.json'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+
+        for _, size, path in sorted(entries):
+            path.unlink(missing_ok=True)
+            total -= size
+            logger.debug(f"Evicted result cache entry {path.name}")
+            if total <= self.max_bytes:
+                break
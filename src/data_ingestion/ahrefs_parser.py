@@ -0,0 +1,111 @@
+"""Parser for the transposed Ahrefs competitor matrix sheets.
+
+``Organic Benchmarking`` and ``Organic Position Rank`` share one layout
+(see ``schema/ahrefs_schema.md``)::
+
+    Row 0: Domain | domain A | domain A | ... | domain B | ...
+    Row 1: Metric | metric 1 | metric 2 | ... | metric 1 | ...
+    Row 2+: month | value    | value    | ... | value    | ...
+"""
+import logging
+from typing import List, Optional
+from urllib.parse import urlparse
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+BENCHMARKING_SHEET = 'Organic Benchmarking'
+POSITION_RANK_SHEET = 'Organic Position Rank'
+
+TRAFFIC_METRIC = 'Avg. organic traffic'
+REFERRING_DOMAINS_METRIC = 'Referring domains'
+PAGE_1_BUCKETS = ['Rank 1-3', 'Rank 4-10']
+
+
+def normalize_domain(value) -> str:
+    """Reduce a URL or host to a bare domain ('https://www.a.com/' -> 'a.com')."""
+    text = str(value).strip()
+    host = urlparse(text if '//' in text else f"//{text}").netloc or text
+    host = host.lower().rstrip('/')
+    return host[4:] if host.startswith('www.') else host
+
+
+def parse_competitor_matrix(raw: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+    """Reshape a transposed competitor sheet into tidy long form.
+
+    The whole value block is converted in one pass: values are flattened
+    row-major, and the domain/metric labels are tiled and the months
+    repeated to line up with them.
+
+    Args:
+        raw: Sheet read with ``header=None``
+
+    Returns:
+        Frame with columns domain, metric, month, value (one row per cell
+        with a value), or None if the sheet does not have the expected layout
+    """
+    if raw is None or raw.shape[0] < 3 or raw.shape[1] < 2:
+        return None
+
+    # Blank domain cells continue the domain to their left
+    domains = raw.iloc[0, 1:].ffill()
+    metrics = raw.iloc[1, 1:]
+    months = pd.to_datetime(raw.iloc[2:, 0], errors='coerce')
+
+    valid_columns = (domains.notna() & metrics.notna()).to_numpy()
+    valid_rows = months.notna().to_numpy()
+    if not valid_columns.any() or not valid_rows.any():
+        logger.warning("Ahrefs sheet does not match the transposed matrix layout")
+        return None
+
+    block = raw.iloc[2:, 1:].to_numpy()[valid_rows][:, valid_columns]
+    n_rows, n_cols = block.shape
+
+    long = pd.DataFrame({
+        'domain': np.tile(domains[valid_columns].map(normalize_domain).to_numpy(), n_rows),
+        'metric': np.tile(metrics[valid_columns].astype(str).str.strip().to_numpy(), n_rows),
+        'month': np.repeat(months[valid_rows].to_numpy(), n_cols),
+        'value': pd.to_numeric(pd.Series(block.ravel()), errors='coerce').to_numpy(),
+    })
+    return long.dropna(subset=['value']).reset_index(drop=True)
+
+
+def latest_values(long: pd.DataFrame, metrics: List[str]) -> pd.Series:
+    """Sum of the given metrics per domain in the most recent month.
+
+    Args:
+        long: Output of ``parse_competitor_matrix``
+        metrics: Metric names to add up (case-insensitive)
+
+    Returns:
+        Series indexed by domain, in sheet order
+    """
+    wanted = {metric.lower() for metric in metrics}
+    rows = long[long['metric'].str.lower().isin(wanted)]
+    rows = rows[rows['month'] == rows['month'].max()]
+    return rows.groupby('domain', sort=False)['value'].sum()
+
+
+def metric_series(long: pd.DataFrame, domain: str, metric: str) -> pd.Series:
+    """Monthly values of one metric for one domain, oldest first."""
+    rows = long[(long['domain'] == domain) & (long['metric'].str.lower() == metric.lower())]
+    return rows.set_index('month')['value'].sort_index()
+
+
+def find_brand_domain(domains: List[str], brand_name: str) -> Optional[str]:
+    """Pick the audited brand's domain out of a competitor set.
+
+    The domain containing the brand name (ignoring case, spaces and
+    punctuation) wins; otherwise the first domain, which Ahrefs lists as
+    the target site.
+    """
+    if not domains:
+        return None
+
+    compact = ''.join(ch for ch in brand_name.lower() if ch.isalnum())
+    if compact:
+        for domain in domains:
+            if compact in ''.join(ch for ch in domain if ch.isalnum()):
+                return domain
+    return domains[0]
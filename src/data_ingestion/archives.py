@@ -0,0 +1,188 @@
+"""Data files read straight out of compressed export bundles."""
+import io
+import gzip
+import hashlib
+import logging
+import zipfile
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+from typing import IO, Iterator, List, Optional, Union
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+from src.data_ingestion.frame_cache import FrameCache
+
+logger = logging.getLogger(__name__)
+
+# Formats the loader parses, on their own or inside a bundle
+DATA_SUFFIXES = ['.csv', '.xlsx', '.xls']
+# Single-file CSV wrappers, by outer suffix
+CSV_COMPRESSION = {'.gz': 'gzip', '.zst': 'zstd'}
+# Assumed when a container does not record the uncompressed size
+ESTIMATED_COMPRESSION_RATIO = 10
+# CSV text deflates at least this well; a gzip ISIZE trailer implying less
+# has wrapped past 2**32 (or is only the last member's) and is not trusted
+GZIP_MIN_RATIO = 2
+
+
+class ArchiveMember:
+    """A data file inside a .zip bundle or a .csv.gz / .csv.zst wrapper.
+
+    Stands in for the ``Path`` of a plain data file: ``name``, ``stem`` and
+    ``suffix`` describe the member itself, so detection and frame keys are
+    the same as for the unpacked file. Contents are decompressed while
+    they are read (see ``open_source``); nothing is extracted to disk. No
+    handle is held open, so members can be sent to worker processes.
+    """
+
+    def __init__(self, archive: Path, compression: str, member: Optional[str] = None):
+        """Initialize member.
+
+        Args:
+            archive: Path of the archive on disk
+            compression: 'zip', 'gzip' or 'zstd'
+            member: Member name inside a zip bundle (None for single-file wrappers)
+        """
+        self.archive = Path(archive)
+        self.compression = compression
+        self.member = member
+        inner = PurePosixPath(member) if member is not None else PurePosixPath(self.archive.stem)
+        self.name = inner.name
+        self.stem = inner.stem
+        self.suffix = inner.suffix
+
+    def __repr__(self) -> str:
+        return f"ArchiveMember({str(self)!r})"
+
+    def __str__(self) -> str:
+        return f"{self.archive}/{self.member}" if self.member is not None else str(self.archive)
+
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, ArchiveMember)
+                and (self.archive, self.member) == (other.archive, other.member))
+
+    def __hash__(self) -> int:
+        return hash((self.archive, self.member))
+
+    @property
+    def size(self) -> int:
+        """Uncompressed size in bytes (estimated if the container does not record it)."""
+        if self.compression == 'zip':
+            with zipfile.ZipFile(self.archive) as zf:
+                return zf.getinfo(self.member).file_size
+
+        compressed = self.archive.stat().st_size
+        with open(self.archive, 'rb') as f:
+            if self.compression == 'gzip':
+                # ISIZE trailer: uncompressed length modulo 2**32
+                f.seek(-4, io.SEEK_END)
+                isize = int.from_bytes(f.read(4), 'little')
+                if isize >= compressed * GZIP_MIN_RATIO:
+                    return isize
+            if zstandard is not None:
+                content_size = zstandard.frame_content_size(f.read(18))
+                if content_size >= 0:
+                    return content_size
+        return compressed * ESTIMATED_COMPRESSION_RATIO
+
+    def read_bytes(self) -> bytes:
+        """Return the decompressed contents."""
+        with open_source(self) as source:
+            if isinstance(source, Path):
+                opener = gzip.open if self.compression == 'gzip' else zstandard.open
+                with opener(source, 'rb') as f:
+                    return f.read()
+            return source.read()
+
+
+DataSource = Union[Path, ArchiveMember]
+
+
+@contextmanager
+def open_source(source: DataSource) -> Iterator[Union[Path, IO[bytes]]]:
+    """Open a data file for pandas.
+
+    Plain files and single-file wrappers are passed on as paths (pandas
+    decompresses .gz / .zst by extension as it reads); zip members are
+    opened as a decompressing stream.
+
+    Args:
+        source: Data file path or archive member
+
+    Yields:
+        Path or binary file object
+    """
+    if not isinstance(source, ArchiveMember):
+        yield source
+    elif source.member is None:
+        yield source.archive
+    else:
+        with zipfile.ZipFile(source.archive) as zf, zf.open(source.member) as stream:
+            yield stream
+
+
+def source_size(source: DataSource) -> int:
+    """Size of a data file's contents in bytes (uncompressed for archive members)."""
+    return source.size if isinstance(source, ArchiveMember) else source.stat().st_size
+
+
+@lru_cache(maxsize=64)
+def _archive_digest(archive: Path, mtime_ns: int, size: int) -> str:
+    return FrameCache.file_digest(archive)
+
+
+def source_digest(source: DataSource) -> str:
+    """Content digest of a data file.
+
+    Archives are hashed compressed and once per run, however many members
+    are loaded from them.
+    """
+    if not isinstance(source, ArchiveMember):
+        return FrameCache.file_digest(source)
+
+    stat = source.archive.stat()
+    digest = _archive_digest(source.archive, stat.st_mtime_ns, stat.st_size)
+    if source.member is None:
+        return digest
+    return hashlib.sha256(f"{digest}:{source.member}".encode('utf-8')).hexdigest()
+
+
+def archive_members(archive: Path) -> List[ArchiveMember]:
+    """List the data files in an archive.
+
+    Args:
+        archive: .zip bundle, or a .csv.gz / .csv.zst file
+
+    Returns:
+        Members in archive order (empty if the archive holds no data files
+        or cannot be read)
+    """
+    archive = Path(archive)
+    suffix = archive.suffix.lower()
+
+    if suffix in CSV_COMPRESSION:
+        if Path(archive.stem).suffix.lower() != '.csv':
+            return []
+        if CSV_COMPRESSION[suffix] == 'zstd' and zstandard is None:
+            logger.warning(f"zstandard is not installed; skipping {archive.name}")
+            return []
+        return [ArchiveMember(archive, CSV_COMPRESSION[suffix])]
+
+    try:
+        with zipfile.ZipFile(archive) as zf:
+            names = [info.filename for info in zf.infolist() if not info.is_dir()]
+    except (OSError, zipfile.BadZipFile) as e:
+        logger.error(f"Error reading archive {archive}: {e}")
+        return []
+
+    return [
+        ArchiveMember(archive, 'zip', name)
+        for name in names
+        if PurePosixPath(name).suffix.lower() in DATA_SUFFIXES
+        and not name.startswith('__MACOSX/')
+        and not PurePosixPath(name).name.startswith('.')
+    ]
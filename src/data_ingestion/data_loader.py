@@ -1,113 +1,194 @@
 """Main data loader for SEO data files."""
 import pandas as pd
+import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Iterable, Optional, List, NamedTuple, Set, Tuple
 from datetime import datetime
 import logging
+import time
+from src.data_ingestion.workbook_session import WorkbookSession
+from src.data_ingestion.frame_cache import FrameCache
+from src.data_ingestion.lazy_workbook import LazyWorkbook
+from src.data_ingestion.archives import DataSource, archive_members, source_digest, source_size
+from src.data_ingestion.manifest import DataManifest, source_id
+from src.data_ingestion.detectors import detect_tool
+from src.data_ingestion.registry import DEFAULT_KIND, SUMMARY_KIND, DataRegistry, report_kind
+from src.data_ingestion.table_store import DEFAULT_TABLE_DIR, DiskTable, Table, TableStore
+from src.data_ingestion.date_index import DateFormatCache, DateIndex, DateRanges, parse_date_columns
+from src.data_ingestion.schemas import TOOL_SCHEMAS, apply_tool_schema, format_memory_report, parse_options
+from src.data_ingestion.streaming import DEFAULT_STREAM_MEMORY_BYTES, StreamColumns, project_columns
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever parsing changes what a loaded frame looks like; invalidates cached frames
+LOADER_VERSION = 10
+# Leading rows sniffed from a further sheet to tell which report it holds
+REPORT_KIND_ROWS = 20
+
+
+class SheetPart(NamedTuple):
+    """A further sheet of a workbook that holds a report of its own."""
+    name: str
+    kind: str
+    df: pd.DataFrame
+    date_ranges: DateRanges = {}
+
+
+class IngestedFile(NamedTuple):
+    """Result of detecting and loading one data file."""
+    tool_type: str
+    df: pd.DataFrame
+    timings: Dict[str, float]
+    sheet_names: List[str]
+    content_digest: Optional[str] = None
+    memory: Dict[str, int] = {}
+    date_ranges: DateRanges = {}
+    table: Optional[DiskTable] = None
+    sheets: List[SheetPart] = []
+
 
 class DataLoader:
     """Loads and validates data from various SEO tool exports."""
 
-    def __init__(self, data_dir: Path):
+    def __init__(self, data_dir: Path, jobs: int = 1, cache_dir: Optional[Path] = None,
+                 stream_memory_bytes: int = DEFAULT_STREAM_MEMORY_BYTES,
+                 stream_columns: Optional[StreamColumns] = None,
+                 excel_engine: Optional[str] = None,
+                 table_backend: Optional[str] = None,
+                 table_dir: Path = DEFAULT_TABLE_DIR):
         """Initialize data loader.
 
         Args:
             data_dir: Directory containing SEO data files
+            jobs: Number of worker processes used to parse files
+            cache_dir: Directory for the parsed frame cache (caching disabled if None)
+            stream_memory_bytes: CSV files larger than this are streamed in chunks
+                                 sized to fit within it
+            stream_columns: Per-tool columns the analyzers declare they need
+                            from streamed files and how to aggregate them (see
+                            ``Phase1Orchestrator.stream_columns``); CSVs of tools
+                            not listed are read whole
+            excel_engine: Excel reader engine ('calamine', 'openpyxl', 'xlrd');
+                          None or 'auto' picks the fastest installed one
+            table_backend: Load CSVs larger than ``stream_memory_bytes`` into an
+                           on-disk table ('duckdb', 'sqlite' or 'auto') instead
+                           of memory; None keeps every file in memory
+            table_dir: Directory of the on-disk table database
         """
         self.data_dir = Path(data_dir)
+        self.jobs = max(1, jobs)
+        self.stream_memory_bytes = stream_memory_bytes
+        self.stream_columns = stream_columns if stream_columns is not None else {}
+        self.excel_engine = excel_engine
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.cache = FrameCache(self.cache_dir, version=str(LOADER_VERSION)) if cache_dir is not None else None
         self.loaded_data: Dict[str, pd.DataFrame] = {}
         self.tools_detected: List[str] = []
-
-    def detect_file_type(self, file_path: Path) -> Optional[str]:
+        self.parse_timings: Dict[str, Dict[str, float]] = {}
+        self.workbooks: Dict[str, LazyWorkbook] = {}
+        # Registry key of a further report sheet -> (key of its file, sheet name)
+        self.sheet_parts: Dict[str, Tuple[str, str]] = {}
+        self.memory_usage: Dict[str, Dict[str, int]] = {}
+        self.registry = DataRegistry()
+        self.date_index = DateIndex()
+        self.date_formats = DateFormatCache()
+        self.table_store = TableStore(table_dir, table_backend, stream_memory_bytes,
+                                      TableStore.name_for(self.data_dir)) \
+            if table_backend is not None else None
+        self.tables: Dict[str, DiskTable] = {}
+        # (tool, kind) lookups already warned about reaching table-store data
+        self._table_warnings: Set[tuple] = set()
+        # Source ids (see manifest.source_id) of files left out of the analysis
+        self.excluded: Set[str] = set()
+        self.manifest = DataManifest(
+            DataManifest.path_for(self.cache_dir, self.data_dir) if self.cache_dir is not None else None
+        )
+
+    def detect_file_type(self, file_path: DataSource,
+                         session: Optional[WorkbookSession] = None) -> Optional[str]:
         """Detect the type of SEO tool from file structure.
 
         Args:
             file_path: Path to the data file
+            session: Open session to reuse (a temporary one is opened if omitted)
 
         Returns:
             Tool name or None if not recognized
         """
-        try:
-            # Try to read first few rows to detect tool type
-            if file_path.suffix.lower() in ['.xlsx', '.xls']:
-                # Check for multiple sheets (could be GA4, Ahrefs, etc.)
-                xl_file = pd.ExcelFile(file_path)
-                sheet_names = xl_file.sheet_names
-
-                # GA4 detection
-                if any('ga4' in name.lower() for name in sheet_names):
-                    return 'GA4'
+        if session is None:
+            with WorkbookSession(file_path, self.excel_engine) as temp_session:
+                return self.detect_file_type(file_path, temp_session)
 
-                # Ahrefs detection
-                if any(name in sheet_names for name in ['Backlinks', 'Referring domains', 'Anchors']):
-                    return 'Ahrefs'
-
-                # Read first sheet to detect other tools
-                df = pd.read_excel(file_path, sheet_name=0, nrows=5)
-
-            elif file_path.suffix.lower() == '.csv':
-                df = pd.read_csv(file_path, nrows=5)
+        try:
+            suffix = file_path.suffix.lower()
+            if suffix in ['.xlsx', '.xls']:
+                sheet_names = session.sheet_names
+                # Only the header row of the first sheet is needed
+                df = session.read_header(sheet_name=0, nrows=0)
+            elif suffix == '.csv':
+                sheet_names = []
+                df = session.read_header(nrows=0)
             else:
                 return None
 
-            columns = [str(col).lower() for col in df.columns]
-
-            # SEMrush detection
-            if any('semrush' in col for col in columns) or \
-               any(col in ['url', 'issue type', 'issue category'] for col in columns):
-                return 'SEMrush'
-
-            # Google Search Console detection
-            if all(col in columns for col in ['queries', 'clicks', 'impressions', 'ctr', 'position']):
-                return 'GSC'
-            if all(col in columns for col in ['top queries', 'clicks', 'impressions']):
-                return 'GSC'
-
-            # Screaming Frog detection
-            if 'address' in columns and 'status code' in columns and 'title 1' in columns:
-                return 'Screaming Frog'
-
-            # PageSpeed detection
-            if any(col in columns for col in ['largest contentful paint', 'first input delay', 'cumulative layout shift']):
-                return 'PageSpeed'
+            detection = detect_tool(df.columns, sheet_names)
+            if detection.ambiguous:
+                logger.warning(f"Ambiguous tool type for {file_path.name}: {detection.describe()}; "
+                               f"skipping it (register a more specific detector)")
+                return None
+            if detection.tool_type is None:
+                logger.warning(f"Could not detect tool type for {file_path.name}")
+                return None
 
-            logger.warning(f"Could not detect tool type for {file_path.name}")
-            return None
+            logger.debug(f"Detected {file_path.name} as {detection.describe()}")
+            return detection.tool_type
 
         except Exception as e:
             logger.error(f"Error detecting file type for {file_path}: {e}")
             return None
 
-    def load_file(self, file_path: Path, tool_type: Optional[str] = None) -> Optional[pd.DataFrame]:
+    def load_file(self, file_path: DataSource, tool_type: Optional[str] = None,
+                  session: Optional[WorkbookSession] = None) -> Optional[pd.DataFrame]:
         """Load a data file.
 
         Args:
             file_path: Path to the data file
             tool_type: Optional tool type (auto-detected if not provided)
+            session: Open session to reuse (a temporary one is opened if omitted)
 
         Returns:
             DataFrame or None if loading failed
         """
+        if session is None:
+            with WorkbookSession(file_path, self.excel_engine) as temp_session:
+                return self.load_file(file_path, tool_type, temp_session)
+
         try:
             if tool_type is None:
-                tool_type = self.detect_file_type(file_path)
+                tool_type = self.detect_file_type(file_path, session)
 
             if tool_type is None:
                 logger.warning(f"Skipping unrecognized file: {file_path.name}")
                 return None
 
             # Load based on file extension
-            if file_path.suffix.lower() in ['.xlsx', '.xls']:
-                df = pd.read_excel(file_path)
-            elif file_path.suffix.lower() == '.csv':
-                df = pd.read_csv(file_path)
+            if self._should_stream(file_path, tool_type):
+                return self._stream_file(file_path, tool_type, session)
+            elif file_path.suffix.lower() in ['.xlsx', '.xls', '.csv']:
+                header = session.read_header(nrows=0).columns
+                df = session.read_sheet(0, **parse_options(TOOL_SCHEMAS.get(tool_type), header))
             else:
                 logger.warning(f"Unsupported file format: {file_path.suffix}")
                 return None
 
+            key = self._make_key(tool_type, file_path)
+            df, date_ranges = parse_date_columns(df, tool_type, self.date_formats)
+            self.date_index.add(key, date_ranges)
+            df, memory = apply_tool_schema(df, tool_type)
+            self.memory_usage[key] = memory
+
             logger.info(f"Loaded {tool_type} data from {file_path.name} ({len(df)} rows)")
 
             if tool_type not in self.tools_detected:
@@ -119,9 +200,378 @@ class DataLoader:
             logger.error(f"Error loading file {file_path}: {e}")
             return None
 
+    @staticmethod
+    def _make_key(tool_type: str, file_path: DataSource, kind: Optional[str] = None) -> str:
+        """Key of a file's frame in ``loaded_data``.
+
+        Built from the source id, so members of the same name in different
+        bundles (e.g. Queries.csv in two monthly GSC zips) get their own keys.
+        Streamed summaries get a key of their own, so a summary is never
+        taken for the export it was folded from.
+        """
+        key = f"{tool_type}_{source_id(file_path)}"
+        return f"{key}#{SUMMARY_KIND}" if kind == SUMMARY_KIND else key
+
+    @staticmethod
+    def _sheet_key(key: str, sheet_name: str) -> str:
+        """Registry key of a further report sheet of the file under ``key``."""
+        return f"{key}:{sheet_name}"
+
+    def _report_sheets(self, tool_type: str, session: WorkbookSession) -> List[SheetPart]:
+        """Parse the sheets after the first that hold a recognized report.
+
+        Multi-sheet exports (GSC Queries / Pages / Countries, SEMrush
+        Domain Overview / Organic Keyword / Keyword Gap) carry one report
+        per sheet. Each sheet's kind is told from its sniffed leading rows;
+        sheets of a known kind are typed and date-indexed like the first
+        sheet, the rest stay lazy (see ``get_sheet``).
+        """
+        sheets = []
+        schema = TOOL_SCHEMAS.get(tool_type)
+        for name in session.sheet_names[1:]:
+            header = session.read_header(sheet_name=name, nrows=REPORT_KIND_ROWS)
+            kind = report_kind(tool_type, header)
+            if kind in (DEFAULT_KIND, SUMMARY_KIND):
+                continue
+
+            df = session.read_sheet(name, **parse_options(schema, header.columns))
+            df, date_ranges = parse_date_columns(df, tool_type, self.date_formats)
+            df, _ = apply_tool_schema(df, tool_type)
+            sheets.append(SheetPart(name, kind, df, date_ranges))
+            logger.debug(f"Loaded {tool_type} '{kind}' report from sheet '{name}' ({len(df)} rows)")
+        return sheets
+
+    def _should_stream(self, file_path: DataSource, tool_type: str) -> bool:
+        """Whether a file is a CSV large enough (uncompressed) to be streamed instead of read whole."""
+        return (
+            file_path.suffix.lower() == '.csv'
+            and tool_type in self.stream_columns
+            and source_size(file_path) > self.stream_memory_bytes
+        )
+
+    def _stream_file(self, file_path: DataSource, tool_type: str,
+                     session: WorkbookSession) -> Optional[pd.DataFrame]:
+        """Stream a large CSV into an aggregate summary frame.
+
+        Only the columns declared in ``stream_columns`` are parsed, chunk by
+        chunk, so peak memory stays near ``stream_memory_bytes`` regardless
+        of row count.
+
+        Returns:
+            Tidy (column, kind, key, value) summary frame, registered as
+            the tool's ``SUMMARY_KIND`` report rather than its usual one
+        """
+        header = session.read_header(nrows=0).columns
+        columns = project_columns(header, self.stream_columns[tool_type])
+        if not columns:
+            logger.warning(f"None of the declared {tool_type} columns found in {file_path.name}; "
+                           f"reading it whole")
+            return session.read_sheet(0)
+
+        aggregator = session.stream(columns, self.stream_memory_bytes)
+        logger.info(f"Streamed {tool_type} data from {file_path.name} "
+                    f"({aggregator.rows:,} rows, {len(columns)} columns)")
+
+        if tool_type not in self.tools_detected:
+            self.tools_detected.append(tool_type)
+
+        return aggregator.to_frame()
+
+    def _cache_part(self, file_path: DataSource) -> str:
+        """Cache part for a file's primary frame; streamed summaries depend on the declared columns."""
+        if file_path.suffix.lower() == '.csv' and source_size(file_path) > self.stream_memory_bytes:
+            declared = json.dumps(self.stream_columns, sort_keys=True).encode('utf-8')
+            return f"stream:{hashlib.sha256(declared).hexdigest()[:16]}"
+        return '0'
+
+    def _worker_options(self) -> Dict:
+        """Constructor options a worker process needs to ingest like this loader."""
+        return {
+            'cache_dir': self.cache_dir,
+            'stream_memory_bytes': self.stream_memory_bytes,
+            'stream_columns': self.stream_columns,
+            'excel_engine': self.excel_engine,
+        }
+
+    def _discover_files(self) -> List[DataSource]:
+        """Data files of the data directory that are not excluded (see ``discover_sources``)."""
+        return [file_path for file_path in discover_sources(self.data_dir)
+                if source_id(file_path) not in self.excluded]
+
+    def _uses_table(self, file_path: DataSource) -> bool:
+        """Whether a file is a CSV too large for memory that goes to the table store."""
+        return (
+            self.table_store is not None
+            and file_path.suffix.lower() == '.csv'
+            and source_size(file_path) > self.stream_memory_bytes
+        )
+
+    def _ingest_table(self, file_path: DataSource,
+                      content_digest: Optional[str] = None) -> Optional[IngestedFile]:
+        """Detect a large CSV and load it into the table store.
+
+        Tables are named by content digest, so a file loaded on an earlier
+        run is not loaded again.
+
+        Returns:
+            Ingestion result holding the table handle and a header-only frame,
+            or None if the file was skipped
+        """
+        start = time.perf_counter()
+        with WorkbookSession(file_path, self.excel_engine) as session:
+            tool_type = self.detect_file_type(file_path, session)
+            if tool_type is None:
+                logger.warning(f"Skipping unrecognized file: {file_path.name}")
+                return None
+            header = session.read_header(nrows=0)
+            timings = dict(session.timings)
+
+        name = f"t_{(content_digest or source_digest(file_path))[:32]}"
+        table = self.table_store.table(name)
+        reused = table is not None
+        if table is None:
+            table = self.table_store.load_csv(name, file_path)
+        timings['table'] = time.perf_counter() - start - sum(timings.values())
+
+        logger.info(f"Loaded {tool_type} data from {file_path.name} into {self.table_store.backend} table "
+                    f"{name} ({len(table):,} rows{', existing' if reused else ''})")
+        return IngestedFile(tool_type, header, timings, [], content_digest, table=table)
+
+    def _ingest_file(self, file_path: DataSource,
+                     content_digest: Optional[str] = None) -> Optional[IngestedFile]:
+        """Detect and load one file through a single workbook session.
+
+        Only the first sheet is parsed here; other sheets are served lazily
+        through ``workbooks``.
+
+        Args:
+            file_path: Path to the data file
+
+        Returns:
+            Ingestion result or None if the file was skipped
+        """
+        cache_key = None
+        if self.cache is not None and self.cache.enabled:
+            start = time.perf_counter()
+            if content_digest is None:
+                content_digest = source_digest(file_path)
+            cache_key = self.cache.make_key(content_digest, self._cache_part(file_path))
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                df, metadata = cached
+                tool_type = metadata.get('tool_type')
+                if not tool_type:
+                    logger.debug(f"Skipping unrecognized file (cached): {file_path.name}")
+                    return None
+
+                sheets = self._cached_sheets(content_digest, metadata.get('sheets', []))
+                if sheets is not None:
+                    timings = {'cache': time.perf_counter() - start}
+                    logger.info(f"Loaded {tool_type} data from {file_path.name} ({len(df)} rows, cached)")
+                    return IngestedFile(tool_type, df, timings, metadata.get('sheet_names', []),
+                                        content_digest, metadata.get('memory', {}),
+                                        metadata.get('date_ranges', {}), sheets=sheets)
+
+        result = None
+
+        # One session per file: the workbook is parsed once for detection and loading
+        with WorkbookSession(file_path, self.excel_engine) as session:
+            tool_type = self.detect_file_type(file_path, session)
+            if tool_type:
+                df = self.load_file(file_path, tool_type, session)
+                if df is not None:
+                    key = self._make_key(tool_type, file_path)
+                    sheets = self._report_sheets(tool_type, session)
+                    result = IngestedFile(tool_type, df, dict(session.timings),
+                                          session.sheet_names, content_digest,
+                                          self.memory_usage.get(key, {}),
+                                          self.date_index.ranges(key), sheets=sheets)
+
+        engine = f" with {session.engine}" if session.engine else ""
+        logger.info(f"Parsed {file_path.name}{engine} in {session.timing_summary()}")
+
+        if cache_key is not None:
+            if result is None:
+                # Remember unrecognized files too, so warm runs never reopen them
+                self.cache.put(cache_key, pd.DataFrame(), {'tool_type': ''})
+            else:
+                for sheet in result.sheets:
+                    self.cache.put(self.cache.make_key(content_digest, f"report:{sheet.name}"), sheet.df, {})
+                self.cache.put(cache_key, result.df, {
+                    'tool_type': result.tool_type,
+                    'sheet_names': result.sheet_names,
+                    'memory': result.memory,
+                    'date_ranges': result.date_ranges,
+                    'sheets': [{'name': sheet.name, 'kind': sheet.kind, 'date_ranges': sheet.date_ranges}
+                               for sheet in result.sheets]
+                })
+
+        return result
+
+    def _cached_sheets(self, content_digest: str, entries: List[Dict]) -> Optional[List[SheetPart]]:
+        """Further report sheets of a cached file, or None if any has left the cache."""
+        sheets = []
+        for entry in entries:
+            cached = self.cache.get(self.cache.make_key(content_digest, f"report:{entry['name']}"))
+            if cached is None:
+                return None
+            sheets.append(SheetPart(entry['name'], entry['kind'], cached[0], entry.get('date_ranges', {})))
+        return sheets
+
+    def _ingest_parallel(self, data_files: List[DataSource],
+                         digests: List[Optional[str]]) -> List[Optional[IngestedFile]]:
+        """Ingest files on a process pool, returning results in input order.
+
+        Args:
+            data_files: Files to ingest
+            digests: Known content digest of each file (None to compute it)
+
+        Returns:
+            One ingestion result (or None) per input file
+        """
+        workers = min(self.jobs, len(data_files))
+        logger.info(f"Ingesting {len(data_files)} files with {workers} worker processes")
+
+        results = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_ingest_in_worker, self.data_dir, path, self._worker_options(), digest)
+                for path, digest in zip(data_files, digests)
+            ]
+
+            for file_path, future in zip(data_files, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    logger.error(f"Error loading file {file_path} in worker: {e}")
+                    results.append(None)
+
+        return results
+
+    def _ingest_files(self, data_files: List[DataSource]) -> List[Optional[IngestedFile]]:
+        """Ingest files, on a process pool when ``jobs`` > 1, in input order.
+
+        Digests recorded in the manifest are reused for files whose mtime
+        and size have not changed, so they are not hashed again.
+        """
+        digests = [self.manifest.known_digest(file_path) for file_path in data_files]
+        results: List[Optional[IngestedFile]] = [None] * len(data_files)
+
+        # The table store has a single writer; large CSVs are loaded here, not in workers
+        in_memory = []
+        for i, (file_path, digest) in enumerate(zip(data_files, digests)):
+            if self._uses_table(file_path):
+                results[i] = self._ingest_table(file_path, digest)
+            else:
+                in_memory.append(i)
+
+        files = [data_files[i] for i in in_memory]
+        if self.jobs > 1 and len(files) > 1:
+            ingested = self._ingest_parallel(files, [digests[i] for i in in_memory])
+        else:
+            ingested = [self._ingest_file(data_files[i], digests[i]) for i in in_memory]
+        for i, result in zip(in_memory, ingested):
+            results[i] = result
+        return results
+
+    def _store(self, file_path: DataSource, result: Optional[IngestedFile]):
+        """Register one ingestion result and record the file in the manifest."""
+        if result is None:
+            self.manifest.record(file_path, None, None, None)
+            return
+
+        tool_type = result.tool_type
+        kind = report_kind(tool_type, result.df)
+
+        # Store with tool type as key
+        key = self._make_key(tool_type, file_path, kind)
+        if result.table is not None:
+            self.tables[key] = result.table
+            self.registry.add_table(tool_type, kind, key, result.table)
+            self.parse_timings[key] = result.timings
+            if tool_type not in self.tools_detected:
+                self.tools_detected.append(tool_type)
+            self.manifest.record(file_path, result.content_digest, tool_type, key)
+            return
+
+        self.loaded_data[key] = result.df
+        self.registry.add(tool_type, kind, key, result.df)
+        self.parse_timings[key] = result.timings
+        self.date_index.add(key, result.date_ranges)
+        if result.memory:
+            self.memory_usage[key] = result.memory
+            logger.info(f"Memory {format_memory_report(key, result.memory)}")
+
+        if result.sheet_names:
+            workbook = LazyWorkbook(file_path, result.sheet_names, self.cache,
+                                    result.content_digest, TOOL_SCHEMAS.get(tool_type),
+                                    self.excel_engine)
+            workbook.prime(result.sheet_names[0], result.df)
+            self.workbooks[key] = workbook
+
+        # Further sheets holding reports of their own are served by kind like first sheets
+        for sheet in result.sheets:
+            sheet_key = self._sheet_key(key, sheet.name)
+            self.registry.add(tool_type, sheet.kind, sheet_key, sheet.df)
+            self.date_index.add(sheet_key, sheet.date_ranges)
+            self.sheet_parts[sheet_key] = (key, sheet.name)
+            if key in self.workbooks:
+                self.workbooks[key].prime(sheet.name, sheet.df)
+
+        if tool_type not in self.tools_detected:
+            self.tools_detected.append(tool_type)
+
+        self.manifest.record(file_path, result.content_digest, tool_type, key)
+
+    def _evict(self, sid: str) -> Optional[str]:
+        """Drop everything held for one ingested file.
+
+        Args:
+            sid: Source id of the file (see ``manifest.source_id``)
+
+        Returns:
+            Tool of the evicted file, or None if nothing was loaded from it
+        """
+        entry = self.manifest.entries.get(sid)
+        if entry is None or entry.key is None:
+            return None
+
+        # Keys are built from the source id, so only this file's frame goes
+        key = entry.key
+        self.loaded_data.pop(key, None)
+        self.tables.pop(key, None)
+        self.registry.remove(key)
+        self.date_index.remove(key)
+        for sheet_key, (file_key, _) in list(self.sheet_parts.items()):
+            if file_key == key:
+                self.registry.remove(sheet_key)
+                self.date_index.remove(sheet_key)
+                del self.sheet_parts[sheet_key]
+        self.parse_timings.pop(key, None)
+        self.memory_usage.pop(key, None)
+        workbook = self.workbooks.pop(key, None)
+        if workbook is not None:
+            workbook.close()
+        if entry.tool_type not in self.registry and entry.tool_type in self.tools_detected:
+            self.tools_detected.remove(entry.tool_type)
+        return entry.tool_type
+
+    def _check_loaded(self):
+        """Log files the manifest records as loaded whose frame is no longer held."""
+        missing = [
+            sid for sid, entry in self.manifest.entries.items()
+            if entry.key is not None and entry.key not in self.loaded_data and entry.key not in self.tables
+        ]
+        if missing:
+            logger.error(f"Loaded data lost for {len(missing)} unchanged files: {', '.join(missing)}")
+
     def load_all_files(self) -> Dict[str, pd.DataFrame]:
         """Load all data files from the data directory.
 
+        Files are parsed on a process pool when ``jobs`` > 1. Keys of
+        ``loaded_data`` and the order of ``tools_detected`` follow file
+        discovery order either way.
+
         Returns:
             Dictionary mapping tool types to DataFrames
         """
@@ -129,54 +579,142 @@ class DataLoader:
             logger.error(f"Data directory does not exist: {self.data_dir}")
             return {}
 
-        data_files = list(self.data_dir.glob('*.csv')) + \
-                     list(self.data_dir.glob('*.xlsx')) + \
-                     list(self.data_dir.glob('*.xls'))
+        data_files = self._discover_files()
 
         logger.info(f"Found {len(data_files)} data files in {self.data_dir}")
 
-        for file_path in data_files:
-            tool_type = self.detect_file_type(file_path)
-            if tool_type:
-                df = self.load_file(file_path, tool_type)
-                if df is not None:
-                    # Store with tool type as key
-                    key = f"{tool_type}_{file_path.stem}"
-                    self.loaded_data[key] = df
+        results = self._ingest_files(data_files)
+        for file_path, result in zip(data_files, results):
+            self._store(file_path, result)
+
+        self.registry.build()
 
-        logger.info(f"Successfully loaded data from {len(self.loaded_data)} files")
+        # Files that were in the manifest but are gone now
+        for sid in self.manifest.diff(data_files).removed:
+            self.manifest.forget(sid)
+        self.manifest.save()
+
+        if self.cache is not None:
+            hits = sum(1 for timings in self.parse_timings.values() if 'cache' in timings)
+            logger.info(f"Parsed data cache: {hits} hits, {len(self.parse_timings) - hits} misses"
+                        f"{f', {self.cache.pickled} stored as pickle' if self.cache.pickled else ''}")
+
+        logger.info(f"Successfully loaded data from {len(self.loaded_data) + len(self.tables)} files"
+                    f"{f' ({len(self.tables)} as on-disk tables)' if self.tables else ''}")
         logger.info(f"Detected tools: {', '.join(self.tools_detected)}")
 
         return self.loaded_data
 
+    def refresh(self) -> Set[str]:
+        """Re-ingest only the data files added or changed since the last load.
+
+        Files removed from the data directory are evicted; unchanged files
+        keep their parsed frames and are not read at all. Call after
+        ``load_all_files``.
+
+        Returns:
+            Tools whose data changed (empty if nothing did)
+        """
+        if not self.data_dir.exists():
+            logger.error(f"Data directory does not exist: {self.data_dir}")
+            return set()
+
+        changes = self.manifest.diff(self._discover_files())
+        if not changes:
+            # Files touched without content changes get their new mtime recorded
+            self.manifest.save()
+            return set()
+
+        changed_tools: Set[str] = set()
+        for sid in changes.removed + [source_id(file_path) for file_path in changes.changed]:
+            tool_type = self._evict(sid)
+            if sid in changes.removed:
+                self.manifest.forget(sid)
+            if tool_type is not None:
+                changed_tools.add(tool_type)
+
+        data_files = changes.added + changes.changed
+        for file_path, result in zip(data_files, self._ingest_files(data_files)):
+            self._store(file_path, result)
+            if result is not None:
+                changed_tools.add(result.tool_type)
+
+        self.registry.build()
+        self.manifest.save()
+        self._check_loaded()
+
+        logger.info(f"Refreshed {self.data_dir}: {len(changes.added)} added, {len(changes.changed)} changed, "
+                    f"{len(changes.removed)} removed")
+        if changed_tools:
+            logger.info(f"Tools with changed data: {', '.join(sorted(changed_tools))}")
+
+        return changed_tools
+
+    @property
+    def loaded_files(self) -> Dict[str, Optional[str]]:
+        """Source id -> detected tool of every file ingested (None if unrecognized)."""
+        return {sid: entry.tool_type for sid, entry in self.manifest.entries.items()}
+
+    def set_excluded(self, file_ids: Iterable[str]) -> Set[str]:
+        """Leave data files out of the analysis.
+
+        Newly excluded files are evicted and files no longer excluded are
+        ingested again (from the parsed frame cache when enabled), as is
+        anything else that changed in the data directory.
+
+        Args:
+            file_ids: Source ids of the files to exclude (see ``loaded_files``)
+
+        Returns:
+            Tools whose data changed
+        """
+        self.excluded = set(file_ids)
+        return self.refresh()
+
+    def get_sheet(self, tool_type: str, sheet_name: Optional[str] = None,
+                  header: Optional[int] = 0, kind: Optional[str] = None) -> Optional[pd.DataFrame]:
+        """Get one sheet of a tool's workbook, parsing it on first access.
+
+        Args:
+            tool_type: Tool name (e.g. 'GSC', 'SEMrush')
+            sheet_name: Sheet name; case-insensitive, prefixes allowed
+                        (e.g. 'Domain Overview'). None for the first sheet.
+            header: Header row (None to get raw rows for multi-header layouts)
+            kind: Only look in workbooks of this report kind (e.g. 'countries')
+
+        Returns:
+            DataFrame or None if no loaded workbook of that tool has the sheet
+        """
+        for key in self.registry.keys(tool_type, kind):
+            # Report sheets after the first are registered under keys of their own
+            file_key, report_sheet = self.sheet_parts.get(key, (key, None))
+            workbook = self.workbooks.get(file_key)
+            if workbook is not None:
+                name = sheet_name or report_sheet or workbook.sheet_names[0]
+                df = workbook.get_sheet(name, header=header)
+                if df is not None:
+                    return df
+        return None
+
+    def close(self):
+        """Close workbook handles held open for lazy sheet access and the table store."""
+        for workbook in self.workbooks.values():
+            workbook.close()
+        if self.table_store is not None:
+            self.table_store.close()
+
     def get_date_range(self) -> tuple[str, str]:
         """Calculate the date range across all loaded data.
 
+        Reads the date index filled while loading; no frame is rescanned.
+
         Returns:
             Tuple of (start_date, end_date) as formatted strings
         """
-        min_date = None
-        max_date = None
-
-        for key, df in self.loaded_data.items():
-            # Look for date columns
-            date_cols = [col for col in df.columns if 'date' in str(col).lower()]
+        date_range = self.date_index.overall()
 
-            for col in date_cols:
-                try:
-                    dates = pd.to_datetime(df[col], errors='coerce').dropna()
-                    if len(dates) > 0:
-                        col_min = dates.min()
-                        col_max = dates.max()
-
-                        if min_date is None or col_min < min_date:
-                            min_date = col_min
-                        if max_date is None or col_max > max_date:
-                            max_date = col_max
-                except:
-                    continue
-
-        if min_date and max_date:
+        if date_range is not None:
+            min_date, max_date = date_range
             return (
                 min_date.strftime('%d/%m/%Y'),
                 max_date.strftime('%d/%m/%Y')
@@ -190,44 +728,102 @@ class DataLoader:
                 end.strftime('%d/%m/%Y')
             )
 
-    def get_ga4_data(self) -> Optional[pd.DataFrame]:
+    def get_data(self, tool_type: str, kind: Optional[str] = None) -> Optional[pd.DataFrame]:
+        """Get a tool's data, combined across files of the same report.
+
+        Args:
+            tool_type: Tool name (e.g. 'GA4', 'GSC')
+            kind: Report kind (e.g. 'countries'); the tool's default report
+                  (``registry.DEFAULT_KINDS``) if omitted. See ``registry.REPORT_KINDS``.
+
+        Returns:
+            DataFrame or None if not loaded. Files held in the table store
+            are not included (a warning says so); see ``get_table``.
+        """
+        if self.registry.on_disk(tool_type, kind) and (tool_type, kind) not in self._table_warnings:
+            self._table_warnings.add((tool_type, kind))
+            report = f"{tool_type} '{kind}'" if kind is not None else tool_type
+            logger.warning(f"{report} files loaded into the on-disk table store are left out of "
+                           f"get_data(); read them with get_table()")
+        return self.registry.get(tool_type, kind)
+
+    def get_table(self, tool_type: str, kind: Optional[str] = None) -> Optional[Table]:
+        """Get a tool's data as a queryable table.
+
+        Files loaded into the table store come back as a ``DiskTable`` whose
+        filters and aggregations run on disk; data held in memory is wrapped
+        in a ``FrameTable`` with the same methods, so analyzers need not care
+        where it lives.
+
+        Args:
+            tool_type: Tool name (e.g. 'Ahrefs')
+            kind: Report kind (e.g. 'backlinks')
+
+        Returns:
+            DiskTable or FrameTable, or None if not loaded
+        """
+        return self.registry.table(tool_type, kind)
+
+    def get_ga4_data(self, kind: str = 'channels') -> Optional[pd.DataFrame]:
         """Get GA4 data if available."""
-        for key, df in self.loaded_data.items():
-            if 'GA4' in key:
-                return df
-        return None
+        return self.get_data('GA4', kind)
 
-    def get_gsc_data(self) -> Optional[pd.DataFrame]:
+    def get_gsc_data(self, kind: str = 'queries') -> Optional[pd.DataFrame]:
         """Get Google Search Console data if available."""
-        for key, df in self.loaded_data.items():
-            if 'GSC' in key:
-                return df
-        return None
+        return self.get_data('GSC', kind)
 
-    def get_semrush_data(self) -> Optional[pd.DataFrame]:
+    def get_semrush_data(self, kind: str = 'organic_keywords') -> Optional[pd.DataFrame]:
         """Get SEMrush data if available."""
-        for key, df in self.loaded_data.items():
-            if 'SEMrush' in key:
-                return df
-        return None
+        return self.get_data('SEMrush', kind)
 
-    def get_ahrefs_data(self) -> Optional[pd.DataFrame]:
+    def get_ahrefs_data(self, kind: str = 'backlinks') -> Optional[pd.DataFrame]:
         """Get Ahrefs data if available."""
-        for key, df in self.loaded_data.items():
-            if 'Ahrefs' in key:
-                return df
-        return None
+        return self.get_data('Ahrefs', kind)
 
-    def get_screaming_frog_data(self) -> Optional[pd.DataFrame]:
+    def get_screaming_frog_data(self, kind: str = 'internal') -> Optional[pd.DataFrame]:
         """Get Screaming Frog data if available."""
-        for key, df in self.loaded_data.items():
-            if 'Screaming Frog' in key:
-                return df
-        return None
+        return self.get_data('Screaming Frog', kind)
 
-    def get_pagespeed_data(self) -> Optional[pd.DataFrame]:
+    def get_pagespeed_data(self, kind: str = 'pages') -> Optional[pd.DataFrame]:
         """Get PageSpeed data if available."""
-        for key, df in self.loaded_data.items():
-            if 'PageSpeed' in key:
-                return df
-        return None
+        return self.get_data('PageSpeed', kind)
+
+    def get_moz_data(self, kind: str = 'top_pages') -> Optional[pd.DataFrame]:
+        """Get Moz data if available."""
+        return self.get_data('Moz', kind)
+
+    def get_bing_webmaster_data(self, kind: str = 'keywords') -> Optional[pd.DataFrame]:
+        """Get Bing Webmaster Tools data if available."""
+        return self.get_data('Bing Webmaster', kind)
+
+    def get_sitebulb_data(self, kind: str = 'urls') -> Optional[pd.DataFrame]:
+        """Get Sitebulb data if available."""
+        return self.get_data('Sitebulb', kind)
+
+
+def discover_sources(data_dir: Path) -> List[DataSource]:
+    """List data files in a stable order (by extension, then name).
+
+    Members of .zip bundles and .csv.gz / .csv.zst files follow the plain
+    files, in archive order; they are read without unpacking to disk.
+    """
+    data_dir = Path(data_dir)
+    files: List[DataSource] = sorted(data_dir.glob('*.csv')) + \
+        sorted(data_dir.glob('*.xlsx')) + \
+        sorted(data_dir.glob('*.xls'))
+    archives = sorted(data_dir.glob('*.zip')) + \
+        sorted(data_dir.glob('*.csv.gz')) + \
+        sorted(data_dir.glob('*.csv.zst'))
+    for archive in archives:
+        files.extend(archive_members(archive))
+    return files
+
+
+def _ingest_in_worker(data_dir: Path, file_path: DataSource, options: Dict,
+                      content_digest: Optional[str] = None) -> Optional[IngestedFile]:
+    """Process-pool entry point for DataLoader._ingest_file.
+
+    The result is returned as is and pickled once by the pool on its way
+    to the parent.
+    """
+    return DataLoader(data_dir, **options)._ingest_file(file_path, content_digest)
@@ -0,0 +1,184 @@
+"""Date column parsing and per-frame date-range index built at load time."""
+import logging
+import warnings
+from typing import Dict, Optional, Tuple
+import pandas as pd
+from pandas.tseries.api import guess_datetime_format
+
+logger = logging.getLogger(__name__)
+
+# Values sampled per column when guessing its format
+FORMAT_SAMPLE = 20
+# Share of non-empty values that must parse for a column to become datetimes;
+# the rest (trailer rows like 'Total') are coerced to NaT
+DATE_PARSE_MIN_SHARE = 0.95
+
+DateRanges = Dict[str, Tuple[str, str]]
+
+
+def is_date_column(name) -> bool:
+    """Whether a column holds dates, judged by its name."""
+    return 'date' in str(name).lower()
+
+
+class DateFormatCache:
+    """Inferred ``strftime`` formats per (tool, column).
+
+    Exports of one tool repeat the same date layout file after file, so the
+    format is guessed once from a few values and reused, letting
+    ``pd.to_datetime`` take its fast fixed-format path.
+    """
+
+    def __init__(self):
+        """Initialize empty cache."""
+        self._formats: Dict[Tuple[str, str], Optional[str]] = {}
+
+    def infer(self, tool_type: str, column: str, series: pd.Series, refresh: bool = False) -> Optional[str]:
+        """Return the column's date format, guessing it on first sight.
+
+        Args:
+            tool_type: Tool name
+            column: Column name
+            series: Column values
+            refresh: Guess again from ``series`` even if a format is cached
+                     (for a file whose layout differs from earlier ones)
+
+        Returns:
+            Format string or None if no single format fits
+        """
+        key = (tool_type, str(column))
+        if refresh or key not in self._formats:
+            sample = series.dropna().astype(str).head(FORMAT_SAMPLE)
+            self._formats[key] = self._guess(sample)
+            logger.debug(f"Date format for {tool_type} '{column}': {self._formats[key]}")
+        return self._formats[key]
+
+    @staticmethod
+    def _guess(sample: pd.Series) -> Optional[str]:
+        """Candidate format parsing the most sampled values (month-first preferred on ties).
+
+        Values no candidate parses, such as a 'Total' trailer row, do not
+        rule a format out.
+        """
+        candidates = []
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)
+            for dayfirst in (False, True):
+                for value in sample:
+                    fmt = guess_datetime_format(value, dayfirst=dayfirst)
+                    if fmt is not None and fmt not in candidates:
+                        candidates.append(fmt)
+
+        best, best_parsed = None, 0
+        for fmt in candidates:
+            parsed = int(pd.to_datetime(sample, format=fmt, errors='coerce').notna().sum())
+            if parsed > best_parsed:
+                best, best_parsed = fmt, parsed
+        return best
+
+
+def _to_datetime(series: pd.Series, fmt: Optional[str]) -> pd.Series:
+    with warnings.catch_warnings():
+        # Without a format pandas warns that it falls back to per-value parsing
+        warnings.simplefilter('ignore', UserWarning)
+        return pd.to_datetime(series, format=fmt, errors='coerce')
+
+
+def parse_date_columns(df: pd.DataFrame, tool_type: str,
+                       formats: DateFormatCache) -> Tuple[pd.DataFrame, DateRanges]:
+    """Parse date columns once and record their ranges.
+
+    The format cached for a column is tried first; when it does not parse
+    every non-empty value (a file laid out differently from earlier ones)
+    the format is guessed again from this file. A column's range is
+    recorded from whatever values parse, so trailer rows like 'Total' do
+    not hide it. The column itself is converted to datetimes only when at
+    least ``DATE_PARSE_MIN_SHARE`` of its non-empty values parse; otherwise
+    it is left as loaded.
+
+    Args:
+        df: Frame as loaded
+        tool_type: Tool name
+        formats: Format cache shared across files
+
+    Returns:
+        Tuple of (frame, {column: (min ISO date, max ISO date)})
+    """
+    ranges: DateRanges = {}
+    converted = {}
+
+    for col in df.columns:
+        if not is_date_column(col):
+            continue
+
+        series = df[col]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            dates = series
+        else:
+            expected = series.notna().sum()
+            dates = _to_datetime(series, formats.infer(tool_type, col, series))
+            if dates.notna().sum() != expected:
+                retried = _to_datetime(series, formats.infer(tool_type, col, series, refresh=True))
+                if retried.notna().sum() > dates.notna().sum():
+                    dates = retried
+            parsed = dates.notna().sum()
+            if parsed >= expected * DATE_PARSE_MIN_SHARE:
+                converted[col] = dates
+            else:
+                logger.debug(f"Leaving {tool_type} '{col}' unparsed; only {parsed} of {expected} "
+                             f"values are dates")
+
+        dates = dates.dropna()
+        if len(dates) > 0:
+            ranges[str(col)] = (dates.min().isoformat(), dates.max().isoformat())
+
+    if converted:
+        df = df.copy(deep=False)
+        for col, dates in converted.items():
+            df[col] = dates
+
+    return df, ranges
+
+
+class DateIndex:
+    """Min/max dates per loaded frame, so date-range queries never rescan data."""
+
+    def __init__(self):
+        """Initialize empty index."""
+        self._ranges: Dict[str, DateRanges] = {}
+
+    def add(self, key: str, ranges: DateRanges):
+        """Record the date ranges of one frame.
+
+        Args:
+            key: Key of the frame in ``DataLoader.loaded_data``
+            ranges: Column to (min ISO date, max ISO date)
+        """
+        self._ranges[key] = dict(ranges)
+
+    def remove(self, key: str):
+        """Drop the ranges of one frame."""
+        self._ranges.pop(key, None)
+
+    def ranges(self, key: str) -> DateRanges:
+        """Per-column ranges of one frame, as ISO dates."""
+        return dict(self._ranges.get(key, {}))
+
+    def frame_range(self, key: str) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """Date range across the date columns of one frame, if any."""
+        ranges = self._ranges.get(key)
+        if not ranges:
+            return None
+        return (min(pd.Timestamp(start) for start, _ in ranges.values()),
+                max(pd.Timestamp(end) for _, end in ranges.values()))
+
+    def overall(self) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """Date range across every indexed frame, if any."""
+        ranges = [r for r in (self.frame_range(key) for key in self._ranges) if r is not None]
+        if not ranges:
+            return None
+        return min(start for start, _ in ranges), max(end for _, end in ranges)
+
+    def clear(self):
+        """Drop every indexed range."""
+        self._ranges.clear()
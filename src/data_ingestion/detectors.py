@@ -0,0 +1,327 @@
+"""Tool detection from the header signature of a data file."""
+import re
+import logging
+from collections import defaultdict
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Evidence weights: a required token counts double an optional one, so a
+# file carrying a signature's required columns scores well even when it
+# has only a few of the optional ones
+REQUIRED_WEIGHT = 2
+OPTIONAL_WEIGHT = 1
+# Matches from different tools closer than this are reported as ambiguous
+AMBIGUITY_MARGIN = 0.1
+
+# A leading '#' header cell: GA4 exports open with a comment block
+COMMENT_BLOCK = 'layout:comment-block'
+
+_WORD = re.compile(r'[a-z0-9]+')
+
+
+def _normalize(label) -> str:
+    return str(label).strip().lower()
+
+
+def columns(*names: str) -> FrozenSet[str]:
+    """Tokens for exact column labels (case-insensitive)."""
+    return frozenset(f"column:{_normalize(name)}" for name in names)
+
+
+def sheets(*names: str) -> FrozenSet[str]:
+    """Tokens for exact sheet names (case-insensitive)."""
+    return frozenset(f"sheet:{_normalize(name)}" for name in names)
+
+
+def column_words(*words: str) -> FrozenSet[str]:
+    """Tokens for a word appearing anywhere in a column label."""
+    return frozenset(f"column-word:{_normalize(word)}" for word in words)
+
+
+def sheet_words(*words: str) -> FrozenSet[str]:
+    """Tokens for a word appearing anywhere in a sheet name."""
+    return frozenset(f"sheet-word:{_normalize(word)}" for word in words)
+
+
+def header_tokens(column_labels: Iterable, sheet_names: Iterable[str] = ()) -> Set[str]:
+    """Compile a file's header row and sheet names into signature tokens.
+
+    Args:
+        column_labels: Column labels of the first sheet (or the CSV)
+        sheet_names: Sheet names (empty for CSV)
+
+    Returns:
+        Set of tokens to look up in a ``DetectorRegistry``
+    """
+    tokens = set()
+    for i, label in enumerate(column_labels):
+        label = _normalize(label)
+        if i == 0 and label.startswith('#'):
+            tokens.add(COMMENT_BLOCK)
+        if not label or label.startswith('unnamed:'):
+            continue
+        tokens.add(f"column:{label}")
+        tokens.update(f"column-word:{word}" for word in _WORD.findall(label))
+    for name in sheet_names:
+        name = _normalize(name)
+        tokens.add(f"sheet:{name}")
+        tokens.update(f"sheet-word:{word}" for word in _WORD.findall(name))
+    return tokens
+
+
+class Detector(NamedTuple):
+    """Header signature of one report from one tool.
+
+    A file matches when it carries every ``required`` token and, if
+    ``any_of`` is set, at least one of those. ``optional`` tokens only
+    raise the confidence of a match.
+    """
+    tool_type: str
+    name: str
+    required: FrozenSet[str] = frozenset()
+    any_of: FrozenSet[str] = frozenset()
+    optional: FrozenSet[str] = frozenset()
+
+    @property
+    def weight(self) -> int:
+        """Score of a file carrying the whole signature."""
+        return (REQUIRED_WEIGHT * (len(self.required) + bool(self.any_of))
+                + OPTIONAL_WEIGHT * len(self.optional))
+
+    def score(self, hits: Set[str]) -> Optional[float]:
+        """Confidence (0-1] of a match on the given tokens, or None if it does not match."""
+        if not self.required <= hits or (self.any_of and not self.any_of & hits):
+            return None
+        matched = (REQUIRED_WEIGHT * (len(self.required) + bool(self.any_of))
+                   + OPTIONAL_WEIGHT * len(self.optional & hits))
+        return matched / self.weight
+
+
+class Match(NamedTuple):
+    """Best-scoring detector of one tool."""
+    tool_type: str
+    detector: str
+    confidence: float
+
+
+class Detection(NamedTuple):
+    """Outcome of detecting a file's tool."""
+    matches: List[Match]
+
+    @property
+    def ambiguous(self) -> bool:
+        """True if two tools match about equally well."""
+        return (len(self.matches) > 1
+                and self.matches[0].confidence - self.matches[1].confidence < AMBIGUITY_MARGIN)
+
+    @property
+    def tool_type(self) -> Optional[str]:
+        """Detected tool (None if nothing matched or the match is ambiguous)."""
+        if not self.matches or self.ambiguous:
+            return None
+        return self.matches[0].tool_type
+
+    @property
+    def confidence(self) -> float:
+        """Confidence of the best match (0 if nothing matched)."""
+        return self.matches[0].confidence if self.matches else 0.0
+
+    def describe(self) -> str:
+        """One-line summary of the candidate matches, for logging."""
+        return ', '.join(f"{m.tool_type} ({m.detector}, {m.confidence:.2f})" for m in self.matches)
+
+
+class DetectorRegistry:
+    """Detectors indexed by the tokens of their signatures.
+
+    Detection looks each of a file's header tokens up in the index once,
+    then scores only the detectors that were hit, so its cost does not
+    grow with the number of registered tools.
+    """
+
+    def __init__(self, detectors: Iterable[Detector] = ()):
+        """Initialize registry.
+
+        Args:
+            detectors: Detectors to register
+        """
+        self._detectors: List[Detector] = []
+        self._index: Dict[str, List[int]] = defaultdict(list)
+        for detector in detectors:
+            self.register(detector)
+
+    def __len__(self) -> int:
+        return len(self._detectors)
+
+    @property
+    def tools(self) -> List[str]:
+        """Registered tool names, in registration order."""
+        return list(dict.fromkeys(detector.tool_type for detector in self._detectors))
+
+    def register(self, detector: Detector):
+        """Add a detector.
+
+        Args:
+            detector: Detector to add; it must have required or any_of tokens
+
+        Raises:
+            ValueError: If the detector would match every file
+        """
+        if not detector.required and not detector.any_of:
+            raise ValueError(f"Detector {detector.name} needs required or any_of tokens")
+        position = len(self._detectors)
+        self._detectors.append(detector)
+        for token in detector.required | detector.any_of | detector.optional:
+            self._index[token].append(position)
+
+    def detect(self, tokens: Set[str]) -> Detection:
+        """Score every detector hit by a file's header tokens.
+
+        Args:
+            tokens: Tokens from ``header_tokens``
+
+        Returns:
+            Detection with the best match per tool, best first
+        """
+        hits: Dict[int, Set[str]] = defaultdict(set)
+        for token in tokens:
+            for position in self._index.get(token, ()):
+                hits[position].add(token)
+
+        best: Dict[str, Match] = {}
+        for position, detector_hits in hits.items():
+            detector = self._detectors[position]
+            confidence = detector.score(detector_hits)
+            if confidence is None:
+                continue
+            current = best.get(detector.tool_type)
+            if current is None or confidence > current.confidence:
+                best[detector.tool_type] = Match(detector.tool_type, detector.name, confidence)
+
+        return Detection(sorted(best.values(), key=lambda m: (-m.confidence, m.tool_type)))
+
+
+BUILTIN_DETECTORS = [
+    # schema/ga4_schema.md: '#' comment block, one sheet per dimension
+    Detector('GA4', 'ga4-report',
+             any_of=sheets('Session Default Channel Group') | sheet_words('ga4') | {COMMENT_BLOCK}),
+    Detector('GA4', 'ga4-table',
+             required=columns('sessions'),
+             any_of=columns('sessionDefaultChannelGroup', 'session default channel group',
+                            'country', 'date', 'landing page'),
+             optional=columns('engaged sessions', 'engagement rate', 'average session duration',
+                              'totalUsers', 'total users', 'new users', 'key events')),
+
+    # schema/gsc_schema.md
+    Detector('GSC', 'gsc-performance',
+             required=columns('clicks', 'impressions'),
+             any_of=columns('queries', 'top queries', 'pages', 'top pages', 'country',
+                            'device', 'search appearance', 'date'),
+             optional=columns('ctr', 'position')),
+    Detector('GSC', 'gsc-workbook',
+             required=sheets('Queries', 'Pages'),
+             optional=sheets('Countries', 'Devices', 'Search appearance', 'Dates', 'Filters')),
+
+    # schema/semrush_schema.md
+    Detector('SEMrush', 'semrush-workbook',
+             any_of=sheets('Domain Overview', 'Domain Overview Structure', 'Organic Keyword',
+                           'Organic Keywords', 'Keyword Gap')),
+    Detector('SEMrush', 'semrush-domain-overview',
+             required=columns('domain', 'authority score'),
+             optional=columns('org. traffic', 'org. keywords', 'backlinks', 'ref. domains')),
+    Detector('SEMrush', 'semrush-organic-keywords',
+             required=columns('keyword', 'position', 'search volume'),
+             optional=columns('url', 'previous position', 'traffic', 'competition', 'trends',
+                              'keyword difficulty', 'cpc')),
+    Detector('SEMrush', 'semrush-keyword-gap',
+             required=columns('keyword', 'search volume'),
+             any_of=columns('gap type', 'best competitor domain'),
+             optional=columns('best competitor position', 'best competitor url')),
+    Detector('SEMrush', 'semrush-site-audit',
+             required=columns('issue type', 'issue category')),
+    Detector('SEMrush', 'semrush-labelled',
+             any_of=column_words('semrush') | sheet_words('semrush')),
+
+    # schema/ahrefs_schema.md
+    Detector('Ahrefs', 'ahrefs-workbook',
+             any_of=sheets('Backlinks', 'Referring domains', 'Anchors',
+                           'Organic Benchmarking', 'Organic Position Rank')),
+    Detector('Ahrefs', 'ahrefs-backlinks',
+             required=columns('referring page url', 'target url'),
+             optional=columns('domain rating', 'ur', 'anchor', 'referring page title',
+                              'external links', 'first seen', 'last seen')),
+    Detector('Ahrefs', 'ahrefs-referring-domains',
+             required=columns('domain', 'domain rating'),
+             optional=columns('dofollow ref. domains', 'dofollow linked domains',
+                              'links to target', 'first seen')),
+
+    # schema/screaming_frog.md
+    Detector('Screaming Frog', 'sf-internal',
+             required=columns('address', 'status code'),
+             optional=columns('title 1', 'content type', 'indexability', 'meta description 1',
+                              'h1-1', 'word count', 'crawl depth', 'inlinks')),
+    Detector('Screaming Frog', 'sf-issues',
+             required=columns('issue name', 'issue type', 'issue priority'),
+             optional=columns('urls', '% of total') | sheets('Website Issue', 'Issue Category')),
+    Detector('Screaming Frog', 'sf-inlinks',
+             required=columns('type', 'source', 'destination'),
+             optional=columns('anchor', 'alt text', 'follow', 'status code', 'link position')),
+
+    # schema/pagespeed_schema.md
+    Detector('PageSpeed', 'pagespeed',
+             any_of=columns('largest contentful paint', 'first input delay', 'cumulative layout shift'),
+             optional=columns('url', 'performance score', 'first contentful paint',
+                              'total blocking time', 'speed index', 'interaction to next paint')),
+
+    # Moz Link Explorer and Keyword Explorer exports
+    Detector('Moz', 'moz-linking-domains',
+             required=columns('root domain', 'domain authority'),
+             optional=columns('spam score', 'linking domains to root domain', 'linked root domains')),
+    Detector('Moz', 'moz-top-pages',
+             required=columns('url', 'page authority'),
+             optional=columns('title', 'status code', 'linking domains to page', 'inbound links',
+                              'domain authority')),
+    Detector('Moz', 'moz-keywords',
+             required=columns('keyword', 'monthly volume', 'difficulty'),
+             optional=columns('organic ctr', 'priority')),
+
+    # Bing Webmaster Tools search performance and backlinks exports
+    Detector('Bing Webmaster', 'bing-search-performance',
+             required=columns('clicks', 'impressions'),
+             any_of=columns('keyword', 'page'),
+             optional=columns('ctr', 'avg. position', 'avg. click position', 'avg. impression position')),
+    Detector('Bing Webmaster', 'bing-backlinks',
+             required=columns('source url', 'target url'),
+             optional=columns('anchor text', 'source domain')),
+
+    # Sitebulb crawl exports
+    Detector('Sitebulb', 'sitebulb-urls',
+             required=columns('url', 'http status code'),
+             any_of=columns('indexable', 'indexable status'),
+             optional=columns('crawl depth', 'title', 'meta description', 'h1',
+                              'no. internal links in', 'content type')),
+    Detector('Sitebulb', 'sitebulb-hints',
+             required=columns('hint', 'importance'),
+             optional=columns('category', 'type', 'urls')),
+]
+
+DETECTORS = DetectorRegistry(BUILTIN_DETECTORS)
+
+
+def register_detector(detector: Detector):
+    """Teach detection a new tool or report (see ``DetectorRegistry.register``)."""
+    DETECTORS.register(detector)
+
+
+def detect_tool(column_labels: Iterable, sheet_names: Iterable[str] = ()) -> Detection:
+    """Detect a file's tool from its header row and sheet names.
+
+    Args:
+        column_labels: Column labels of the first sheet (or the CSV)
+        sheet_names: Sheet names (empty for CSV)
+
+    Returns:
+        Detection against the registered detectors
+    """
+    return DETECTORS.detect(header_tokens(column_labels, sheet_names))
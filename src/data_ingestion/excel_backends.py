@@ -0,0 +1,67 @@
+"""Excel reader backend selection for ``pd.ExcelFile``."""
+import logging
+from importlib.util import find_spec
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+AUTO_ENGINE = 'auto'
+
+# Module that must be importable for each pandas engine
+ENGINE_MODULES: Dict[str, str] = {
+    'calamine': 'python_calamine',
+    'openpyxl': 'openpyxl',
+    'xlrd': 'xlrd',
+}
+
+# Engines per file type, fastest first. calamine (Rust) reads both formats.
+ENGINE_PREFERENCE: Dict[str, List[str]] = {
+    '.xlsx': ['calamine', 'openpyxl'],
+    '.xlsm': ['calamine', 'openpyxl'],
+    '.xls': ['calamine', 'xlrd'],
+}
+
+ENGINE_CHOICES = [AUTO_ENGINE] + list(ENGINE_MODULES)
+
+_available: Dict[str, bool] = {}
+
+
+def is_available(engine: str) -> bool:
+    """Whether an engine's reader package is installed."""
+    if engine not in _available:
+        module = ENGINE_MODULES.get(engine)
+        _available[engine] = module is not None and find_spec(module) is not None
+    return _available[engine]
+
+
+def available_engines(suffix: Optional[str] = None) -> List[str]:
+    """Installed engines, fastest first, optionally only those that read a file type."""
+    if suffix is None:
+        candidates = list(ENGINE_MODULES)
+    else:
+        candidates = ENGINE_PREFERENCE.get(suffix.lower(), [])
+    return [engine for engine in candidates if is_available(engine)]
+
+
+def engine_candidates(suffix: str, requested: Optional[str] = None) -> List[str]:
+    """Engines to try for a file, in order.
+
+    A requested engine goes first when installed and able to read the file
+    type; the remaining installed engines follow as fallbacks.
+
+    Args:
+        suffix: File extension (e.g. '.xlsx')
+        requested: Engine name, or None / 'auto' for the fastest available
+
+    Returns:
+        Engine names (empty if no installed engine reads the file type)
+    """
+    engines = available_engines(suffix)
+    if requested and requested != AUTO_ENGINE:
+        if requested in engines:
+            engines.remove(requested)
+            engines.insert(0, requested)
+        else:
+            logger.warning(f"Excel engine '{requested}' is not installed or cannot read {suffix} "
+                           f"files; using {engines[0] if engines else 'pandas default'}")
+    return engines
@@ -0,0 +1,247 @@
+"""Content-addressed Arrow IPC cache for parsed data frames."""
+import os
+import json
+import pickle
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    ipc = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path('.cache') / 'data_loader'
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+METADATA_KEY = b'seo_audit'
+HASH_CHUNK_BYTES = 1024 * 1024
+# Inferred types of object columns Arrow stores natively; other object
+# columns (a GSC query "2024" read as a number among strings) are pickled
+NATIVE_OBJECT_TYPES = {'string', 'empty'}
+# Entry metadata listing column positions to restore
+LAYOUT_KEY = '_layout'
+
+
+def arrow_ready(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, list]]:
+    """Frame Arrow can store without changing any value, and how to restore it.
+
+    Object columns of strings are stored as Arrow strings and turned back
+    into object columns on read. Object columns mixing value types are
+    stored with every value pickled, so ints stay ints and strings stay
+    strings. Warm frames are thereby identical to cold ones.
+
+    Args:
+        df: Frame to store
+
+    Returns:
+        Tuple of (frame to convert, {'object': positions, 'pickled': positions})
+    """
+    layout: Dict[str, list] = {'object': [], 'pickled': []}
+    encoded = None
+    for i, dtype in enumerate(df.dtypes):
+        if dtype != object:
+            continue
+        series = df.iloc[:, i]
+        if pd.api.types.infer_dtype(series, skipna=True) in NATIVE_OBJECT_TYPES:
+            layout['object'].append(i)
+            continue
+        if encoded is None:
+            encoded = df.copy(deep=False)
+        encoded.isetitem(i, series.map(lambda value: pickle.dumps(value, protocol=5)))
+        layout['pickled'].append(i)
+    return (encoded if encoded is not None else df), layout
+
+
+def restore_frame(df: pd.DataFrame, layout: Dict[str, list]) -> pd.DataFrame:
+    """Undo ``arrow_ready`` on a frame read back from Arrow."""
+    for i in layout.get('object', []):
+        df.isetitem(i, df.iloc[:, i].astype(object))
+    for i in layout.get('pickled', []):
+        df.isetitem(i, df.iloc[:, i].map(pickle.loads).astype(object))
+    return df
+
+
+class FrameCache:
+    """Caches parsed DataFrames as Arrow IPC files keyed by content hash.
+
+    Entries are named after a digest of the source file contents, the
+    loader version and the part of the file they hold (e.g. a sheet), so
+    an edited export or a parser change never hits a stale entry. Reads
+    memory-map the cached file. Frames come back exactly as stored,
+    dtypes included (see ``arrow_ready``). Frames Arrow
+    still cannot represent fall back to a pickle entry; ``pickled`` counts
+    them. The directory is kept under ``max_bytes``
+    by evicting least recently used entries; a hit refreshes the entry's
+    mtime, which serves as its last-access time.
+    """
+
+    def __init__(self, cache_dir: Path, version: str,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (created if missing)
+            version: Loader version mixed into every key
+            max_bytes: Size bound for the cache directory
+        """
+        self.cache_dir = Path(cache_dir)
+        self.version = str(version)
+        self.max_bytes = max_bytes
+        self.enabled = pa is not None
+        # Entries written as pickle because Arrow could not represent the frame
+        self.pickled = 0
+
+        if not self.enabled:
+            logger.warning("pyarrow is not installed; parsed data cache is disabled")
+            return
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def file_digest(file_path: Path) -> str:
+        """Compute the SHA-256 digest of a file's contents.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Hex digest
+        """
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def make_key(self, content_digest: str, part: str = '0') -> str:
+        """Build a cache key for one part of a source file.
+
+        Args:
+            content_digest: Digest of the source file contents
+            part: Identifier of the cached part within the file
+
+        Returns:
+            Cache key
+        """
+        raw = f"{self.version}:{content_digest}:{part}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str, suffix: str = '.arrow') -> Path:
+        return self.cache_dir / f"{key}{suffix}"
+
+    def _entries(self):
+        return [path for pattern in ('*.arrow', '*.pkl') for path in self.cache_dir.glob(pattern)]
+
+    def get(self, key: str) -> Optional[Tuple[pd.DataFrame, Dict[str, str]]]:
+        """Read an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (DataFrame, metadata) or None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        path = self._entry_path(key)
+        if not path.exists():
+            path = self._entry_path(key, '.pkl')
+            if not path.exists():
+                return None
+
+        try:
+            if path.suffix == '.arrow':
+                source = pa.memory_map(str(path), 'r')
+                table = ipc.open_file(source).read_all()
+                metadata = json.loads(table.schema.metadata.get(METADATA_KEY, b'{}'))
+                df = restore_frame(table.to_pandas(), metadata.pop(LAYOUT_KEY, {}))
+            else:
+                with open(path, 'rb') as f:
+                    df, metadata = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        # Refresh last-access time for LRU eviction
+        os.utime(path)
+        return df, metadata
+
+    def put(self, key: str, df: pd.DataFrame, metadata: Dict[str, str]) -> bool:
+        """Write an entry and evict old entries if over the size bound.
+
+        Args:
+            key: Cache key
+            df: Frame to store
+            metadata: String metadata stored alongside the frame
+
+        Returns:
+            True if the entry was written
+        """
+        if not self.enabled:
+            return False
+
+        try:
+            encoded, layout = arrow_ready(df)
+            table = pa.Table.from_pandas(encoded)
+        except (pa.ArrowException, ValueError, TypeError) as e:
+            self.pickled += 1
+            logger.info(f"Caching frame for {metadata} as pickle: {e}")
+            table = None
+
+        if table is not None:
+            schema_metadata = dict(table.schema.metadata or {})
+            schema_metadata[METADATA_KEY] = json.dumps({**metadata, LAYOUT_KEY: layout}).encode('utf-8')
+            table = table.replace_schema_metadata(schema_metadata)
+
+        path = self._entry_path(key, '.arrow' if table is not None else '.pkl')
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            if table is not None:
+                with pa.OSFile(str(tmp_path), 'wb') as sink:
+                    with ipc.new_file(sink, table.schema) as writer:
+                        writer.write_table(table)
+            else:
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump((df, metadata), f, protocol=5)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry {path.name}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return False
+
+        self._evict()
+        return True
+
+    def _evict(self):
+        """Remove least recently used entries until the cache fits its bound."""
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+
+        for _, size, path in sorted(entries):
+            path.unlink(missing_ok=True)
+            total -= size
+            logger.debug(f"Evicted cache entry {path.name}")
+            if total <= self.max_bytes:
+                break
+
+    def clear(self):
+        """Remove every entry."""
+        for path in self._entries():
+            path.unlink(missing_ok=True)
@@ -0,0 +1,194 @@
+"""Parser for GA4 multi-header exports (channel and countries reports).
+
+Both reports share one layout (see ``schema/ga4_schema.md``)::
+
+    Rows 0-4: '#' comment block (property, report name, YYYYMMDD-YYYYMMDD)
+    Row 6:    group label | group  | group  | ... | Totals | ...
+    Row 7:    row label   | metric | metric | ... | metric | ...
+    Row 8:    (blank)     | grand total row
+    Row 9+:   row label   | values
+
+The channel report has months as groups and channels as rows; the
+countries report has countries as groups and months as rows. Either way
+the result is a (label, month, metric) array.
+"""
+import re
+import logging
+from typing import List, NamedTuple, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+TOTALS_LABEL = 'totals'
+SESSIONS = 'Sessions'
+ENGAGEMENT_RATE = 'Engagement rate'
+ENGAGED_SESSIONS = 'Engaged sessions'
+AVG_SESSION_DURATION = 'Average session duration'
+ORGANIC_SEARCH = 'Organic Search'
+
+_PERIOD = re.compile(r'(\d{8})\s*-\s*(\d{8})')
+
+
+class GA4Cube(NamedTuple):
+    """GA4 report as arrays over (label, month, metric).
+
+    ``labels`` are channels or countries; ``months`` are calendar month
+    numbers in chronological order. NaN marks cells the export left empty.
+    """
+    dimension: str
+    labels: List[str]
+    months: List[int]
+    metrics: List[str]
+    values: np.ndarray
+    totals: np.ndarray
+    monthly_totals: np.ndarray
+    grand_total: np.ndarray
+    period: Optional[Tuple[pd.Timestamp, pd.Timestamp]]
+
+    def metric(self, name: str) -> int:
+        """Index of a metric on the last axis (case-insensitive)."""
+        wanted = name.lower()
+        for i, metric in enumerate(self.metrics):
+            if metric.lower() == wanted:
+                return i
+        raise KeyError(name)
+
+    def label(self, name: str) -> Optional[int]:
+        """Index of a channel or country, or None if absent."""
+        wanted = name.lower()
+        for i, label in enumerate(self.labels):
+            if label.lower() == wanted:
+                return i
+        return None
+
+    def month_start(self, month: int) -> Optional[pd.Timestamp]:
+        """First day of a month within the report period, if the period is known."""
+        if self.period is None:
+            return None
+        start = self.period[0]
+        year = start.year if month >= start.month else start.year + 1
+        return pd.Timestamp(year=year, month=month, day=1)
+
+
+def _parse_period(comments: pd.Series) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+    for comment in comments:
+        match = _PERIOD.search(str(comment))
+        if match:
+            start, end = (pd.to_datetime(part, format='%Y%m%d', errors='coerce') for part in match.groups())
+            if pd.notna(start) and pd.notna(end):
+                return start, end
+    return None
+
+
+def _month_number(value) -> Optional[int]:
+    number = pd.to_numeric(value, errors='coerce')
+    if pd.notna(number) and 1 <= number <= 12 and number == int(number):
+        return int(number)
+    return None
+
+
+def parse_ga4_report(raw: Optional[pd.DataFrame]) -> Optional[GA4Cube]:
+    """Reshape a GA4 channel or countries export into arrays.
+
+    Every cell is tagged with its label, month and metric by broadcasting
+    the header rows and row labels over the value block; the arrays are
+    then filled with one scatter per aggregate level.
+
+    Args:
+        raw: First sheet read with ``header=None``
+
+    Returns:
+        GA4Cube or None if the sheet does not have the expected layout
+    """
+    if raw is None or raw.shape[1] < 2:
+        return None
+
+    first = raw.iloc[:, 0]
+    is_comment = first.astype(str).str.lstrip().str.startswith('#') & first.notna()
+    header_rows = np.flatnonzero((first.notna() & ~is_comment).to_numpy())
+    if len(header_rows) < 2 or header_rows[1] != header_rows[0] + 1:
+        logger.warning("GA4 sheet does not match the multi-header layout")
+        return None
+
+    group_row, metric_row = header_rows[0], header_rows[0] + 1
+    group_label = str(raw.iat[group_row, 0]).strip().lower()
+    row_label = str(raw.iat[metric_row, 0]).strip().lower()
+    if group_label == 'month':
+        dimension = 'channel' if 'channel' in row_label else row_label
+        months_in_rows = False
+    elif row_label == 'month':
+        dimension = group_label
+        months_in_rows = True
+    else:
+        logger.warning(f"GA4 sheet has no month axis ('{group_label}' / '{row_label}')")
+        return None
+
+    groups = raw.iloc[group_row, 1:]
+    metrics = raw.iloc[metric_row, 1:]
+    columns = (groups.notna() & metrics.notna()).to_numpy()
+    groups = groups[columns].astype(str).str.strip().to_numpy()
+    metrics = metrics[columns].astype(str).str.strip().to_numpy()
+
+    body = raw.iloc[metric_row + 1:]
+    body = body[body.iloc[:, 1:].notna().to_numpy().any(axis=1)]
+    row_keys = body.iloc[:, 0].to_numpy()
+    block = pd.to_numeric(pd.Series(body.iloc[:, 1:].to_numpy()[:, columns].ravel()),
+                          errors='coerce').to_numpy().reshape(len(body), -1)
+
+    # Tag every cell; None stands for "all" (Totals group or grand-total row)
+    group_keys = np.array([None if g.lower() == TOTALS_LABEL else g for g in groups], dtype=object)
+    row_keys = np.array([None if pd.isna(k) else k for k in row_keys], dtype=object)
+    if months_in_rows:
+        cell_label = np.broadcast_to(group_keys, block.shape)
+        cell_month = np.broadcast_to(
+            np.array([_month_number(k) if k is not None else None for k in row_keys], dtype=object)[:, None],
+            block.shape)
+    else:
+        cell_label = np.broadcast_to(
+            np.array([str(k).strip() if k is not None else None for k in row_keys], dtype=object)[:, None],
+            block.shape)
+        cell_month = np.broadcast_to(
+            np.array([_month_number(g) if g is not None else None for g in group_keys], dtype=object),
+            block.shape)
+    cell_metric = np.broadcast_to(metrics, block.shape)
+
+    label_all = pd.isna(cell_label.ravel().astype(object))
+    month_all = pd.isna(cell_month.ravel().astype(object))
+    flat_values = block.ravel()
+
+    labels = list(pd.unique(cell_label.ravel()[~label_all]))
+    period = _parse_period(first[is_comment])
+    months = sorted({int(m) for m in cell_month.ravel()[~month_all]})
+    if period is not None:
+        # Chronological order within the report period, across a year boundary
+        months.sort(key=lambda m: (m < period[0].month, m))
+    metric_names = list(pd.unique(metrics))
+
+    label_codes = pd.Index(labels).get_indexer(np.where(label_all, None, cell_label.ravel()))
+    month_codes = pd.Index(months).get_indexer(np.where(month_all, -1, cell_month.ravel()).astype(int))
+    metric_codes = pd.Index(metric_names).get_indexer(cell_metric.ravel())
+
+    n_labels, n_months, n_metrics = len(labels), len(months), len(metric_names)
+    values = np.full((n_labels, n_months, n_metrics), np.nan)
+    totals = np.full((n_labels, n_metrics), np.nan)
+    monthly_totals = np.full((n_months, n_metrics), np.nan)
+    grand_total = np.full(n_metrics, np.nan)
+
+    cells = ~label_all & ~month_all
+    values[label_codes[cells], month_codes[cells], metric_codes[cells]] = flat_values[cells]
+    cells = ~label_all & month_all
+    totals[label_codes[cells], metric_codes[cells]] = flat_values[cells]
+    cells = label_all & ~month_all
+    monthly_totals[month_codes[cells], metric_codes[cells]] = flat_values[cells]
+    cells = label_all & month_all
+    grand_total[metric_codes[cells]] = flat_values[cells]
+
+    return GA4Cube(dimension, labels, months, metric_names, values, totals,
+                   monthly_totals, grand_total, period)
+
+
+def format_duration(seconds: float) -> str:
+    """Format seconds as GA4 does on slides ('3m 46s')."""
+    seconds = 0 if pd.isna(seconds) else seconds
+    return f"{int(seconds // 60)}m {int(seconds % 60):02d}s"
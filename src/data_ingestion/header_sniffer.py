@@ -0,0 +1,216 @@
+"""Header-only sniffing of XLSX workbooks straight from the zip container.
+
+Reading a few header cells through ``pd.ExcelFile`` still decompresses and
+indexes the whole shared-strings table. Here only ``xl/workbook.xml`` (for
+the sheet list) and the first rows of the first worksheet are parsed, and
+the shared-strings table is read just far enough to resolve the strings
+those rows reference.
+"""
+import re
+import zipfile
+import logging
+import posixpath
+from pathlib import Path
+from typing import IO, Any, Dict, List, Set, Tuple, Union
+from xml.etree.ElementTree import iterparse
+import xml.etree.ElementTree as ET
+from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format
+from openpyxl.utils.datetime import from_excel
+
+logger = logging.getLogger(__name__)
+
+MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+PKG_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+_CELL_REF = re.compile(r'([A-Z]+)')
+
+
+def _tag(name: str) -> str:
+    return f"{{{MAIN_NS}}}{name}"
+
+
+def _column_index(ref: str) -> int:
+    """Zero-based column index of a cell reference such as 'AB12'."""
+    letters = _CELL_REF.match(ref).group(1)
+    index = 0
+    for letter in letters:
+        index = index * 26 + (ord(letter) - ord('A') + 1)
+    return index - 1
+
+
+def _read_sheets(zf: zipfile.ZipFile) -> List[Tuple[str, str]]:
+    """Return (sheet name, worksheet part path) in workbook order."""
+    targets = {}
+    rels = ET.fromstring(zf.read('xl/_rels/workbook.xml.rels'))
+    for rel in rels.iter(f"{{{PKG_REL_NS}}}Relationship"):
+        target = rel.get('Target')
+        if target.startswith('/'):
+            target = target.lstrip('/')
+        else:
+            target = posixpath.normpath(posixpath.join('xl', target))
+        targets[rel.get('Id')] = target
+
+    workbook = ET.fromstring(zf.read('xl/workbook.xml'))
+    return [
+        (sheet.get('name'), targets.get(sheet.get(f"{{{REL_NS}}}id")))
+        for sheet in workbook.iter(_tag('sheet'))
+    ]
+
+
+def _read_rows(zf: zipfile.ZipFile, part: str, max_rows: int) -> List[List[Tuple[str, Any, int]]]:
+    """Stream the first rows of a worksheet as lists of (cell type, raw value, style)."""
+    rows: List[List[Tuple[str, Any, int]]] = []
+    current: Dict[int, Tuple[str, Any, int]] = {}
+
+    with zf.open(part) as stream:
+        for _, elem in iterparse(stream, events=('end',)):
+            if elem.tag == _tag('c'):
+                cell_type = elem.get('t', 'n')
+                if cell_type == 'inlineStr':
+                    value = ''.join(t.text or '' for t in elem.iter(_tag('t')))
+                else:
+                    v = elem.find(_tag('v'))
+                    value = v.text if v is not None else None
+                if value is not None:
+                    current[_column_index(elem.get('r'))] = (cell_type, value, int(elem.get('s', 0)))
+                elem.clear()
+
+            elif elem.tag == _tag('row'):
+                # Rows without cells are omitted from the XML; keep their place
+                row_number = int(elem.get('r', len(rows) + 1))
+                while len(rows) < min(row_number - 1, max_rows):
+                    rows.append([])
+                if len(rows) >= max_rows:
+                    break
+
+                width = max(current) + 1 if current else 0
+                rows.append([current.get(i, ('n', None, 0)) for i in range(width)])
+                current = {}
+                elem.clear()
+                if len(rows) >= max_rows:
+                    break
+
+    return rows
+
+
+def _read_shared_strings(zf: zipfile.ZipFile, needed: Set[int]) -> Dict[int, str]:
+    """Resolve only the needed shared-string indices, stopping at the largest."""
+    if not needed or 'xl/sharedStrings.xml' not in zf.namelist():
+        return {}
+
+    last = max(needed)
+    strings: Dict[int, str] = {}
+    index = 0
+
+    with zf.open('xl/sharedStrings.xml') as stream:
+        for _, elem in iterparse(stream, events=('end',)):
+            if elem.tag != _tag('si'):
+                continue
+            if index in needed:
+                # Rich-text runs hold several <t>; phonetic runs (<rPh>) are not part of the text
+                strings[index] = ''.join(
+                    t.text or '' for child in elem
+                    if child.tag in (_tag('t'), _tag('r'))
+                    for t in ([child] if child.tag == _tag('t') else child.iter(_tag('t')))
+                )
+            elem.clear()
+            if index >= last:
+                break
+            index += 1
+
+    return strings
+
+
+def _read_date_styles(zf: zipfile.ZipFile) -> Set[int]:
+    """Indices of cell formats (``cellXfs``) that display numbers as dates."""
+    if 'xl/styles.xml' not in zf.namelist():
+        return set()
+
+    styles = ET.fromstring(zf.read('xl/styles.xml'))
+    formats = dict(BUILTIN_FORMATS)
+    for fmt in styles.iter(_tag('numFmt')):
+        formats[int(fmt.get('numFmtId'))] = fmt.get('formatCode')
+
+    cell_xfs = styles.find(_tag('cellXfs'))
+    if cell_xfs is None:
+        return set()
+    return {
+        index for index, xf in enumerate(cell_xfs.iter(_tag('xf')))
+        if is_date_format(formats.get(int(xf.get('numFmtId', 0)), ''))
+    }
+
+
+def _convert(cell_type: str, value: Any, style: int,
+             shared: Dict[int, str], date_styles: Set[int]) -> Any:
+    if value is None:
+        return None
+    if cell_type == 's':
+        value = shared.get(int(value))
+    elif cell_type == 'b':
+        return value == '1'
+    elif cell_type in ('str', 'inlineStr', 'e'):
+        pass
+    elif style in date_styles:
+        return from_excel(float(value))
+    else:
+        number = float(value)
+        return int(number) if number.is_integer() else number
+
+    # Empty strings are read as missing, as pandas does
+    return value if value != '' else None
+
+
+def sniff_xlsx(file_path: Union[Path, IO[bytes]], max_rows: int = 1) -> Tuple[List[str], List[List[Any]]]:
+    """Read the sheet list and the first rows of the first worksheet.
+
+    Args:
+        file_path: Path to an .xlsx workbook, or a seekable file object holding one
+        max_rows: Number of rows to read from the first worksheet
+
+    Returns:
+        Tuple of (sheet names, rows as lists of cell values)
+    """
+    with zipfile.ZipFile(file_path) as zf:
+        sheets = _read_sheets(zf)
+        sheet_names = [name for name, _ in sheets]
+        if not sheets or sheets[0][1] is None:
+            return sheet_names, []
+
+        raw_rows = _read_rows(zf, sheets[0][1], max_rows)
+        needed = {int(value) for row in raw_rows for cell_type, value, _ in row
+                  if cell_type == 's' and value is not None}
+        shared = _read_shared_strings(zf, needed)
+        date_styles = _read_date_styles(zf) if any(
+            cell_type == 'n' and style for row in raw_rows for cell_type, _, style in row
+        ) else set()
+
+    rows = [
+        [_convert(cell_type, value, style, shared, date_styles) for cell_type, value, style in row]
+        for row in raw_rows
+    ]
+    return sheet_names, rows
+
+
+def header_names(first_row: List[Any]) -> List[Any]:
+    """Turn a header row into column labels the way pandas would.
+
+    Empty cells become ``Unnamed: <i>`` and repeated names get ``.1``,
+    ``.2`` suffixes.
+    """
+    names = []
+    seen: Dict[Any, int] = {}
+    for i, value in enumerate(first_row):
+        name = f"Unnamed: {i}" if value is None or value == '' else value
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def is_sniffable(file_path: Path) -> bool:
+    """Whether a file can be sniffed without a full workbook parse."""
+    return Path(file_path).suffix.lower() == '.xlsx' and zipfile.is_zipfile(file_path)
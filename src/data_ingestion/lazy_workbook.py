@@ -0,0 +1,157 @@
+"""Lazy per-sheet access to multi-sheet workbooks."""
+import logging
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+import pandas as pd
+from src.data_ingestion.workbook_session import WorkbookSession
+from src.data_ingestion.frame_cache import FrameCache
+from src.data_ingestion.archives import ArchiveMember, DataSource, source_digest
+from src.data_ingestion.schemas import apply_schema, parse_options
+
+logger = logging.getLogger(__name__)
+
+
+class LazyWorkbook(Mapping):
+    """Mapping of sheet name to DataFrame that parses each sheet on first access.
+
+    The workbook is only reopened when a sheet that has not been parsed yet
+    is requested; parsed sheets are kept in memory and, when a cache is
+    available, written to it so later runs skip the parse as well. Safe to
+    share between threads: a sheet is parsed once however many ask for it.
+    """
+
+    def __init__(self, file_path: DataSource, sheet_names: List[str],
+                 cache: Optional[FrameCache] = None,
+                 content_digest: Optional[str] = None,
+                 schema: Optional[Dict[str, str]] = None,
+                 engine: Optional[str] = None):
+        """Initialize lazy workbook.
+
+        Args:
+            file_path: Path to the workbook, or a member of a compressed bundle
+            sheet_names: Sheet names in workbook order
+            cache: Parsed frame cache (optional)
+            content_digest: Digest of the workbook contents, if already known
+            schema: Tool column schema applied to sheets read with a header row
+            engine: Excel reader engine (None for the fastest installed one)
+        """
+        self.file_path = file_path if isinstance(file_path, ArchiveMember) else Path(file_path)
+        self.sheet_names = list(sheet_names)
+        self.cache = cache if cache is not None and cache.enabled else None
+        self._content_digest = content_digest
+        self.schema = schema
+        self.engine = engine
+        self._session: Optional[WorkbookSession] = None
+        self._frames: Dict[Tuple[str, Optional[int]], pd.DataFrame] = {}
+        # Serializes parsing on the shared session
+        self._lock = threading.RLock()
+
+    def __getitem__(self, sheet_name: str) -> pd.DataFrame:
+        if sheet_name not in self.sheet_names:
+            raise KeyError(sheet_name)
+        return self.get_sheet(sheet_name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.sheet_names)
+
+    def __len__(self) -> int:
+        return len(self.sheet_names)
+
+    @property
+    def loaded_sheets(self) -> List[str]:
+        """Names of sheets parsed so far."""
+        return sorted({sheet for sheet, _ in self._frames})
+
+    def resolve(self, sheet_name: str) -> Optional[str]:
+        """Resolve a sheet name, tolerating case and export-specific suffixes.
+
+        ``"Domain Overview"`` resolves to ``"Domain Overview Structure"``.
+
+        Args:
+            sheet_name: Requested sheet name
+
+        Returns:
+            Actual sheet name or None if the workbook has no such sheet
+        """
+        if sheet_name in self.sheet_names:
+            return sheet_name
+
+        wanted = sheet_name.lower()
+        for name in self.sheet_names:
+            if name.lower() == wanted:
+                return name
+        for name in self.sheet_names:
+            if name.lower().startswith(wanted):
+                return name
+        return None
+
+    def prime(self, sheet_name: str, df: pd.DataFrame, header: Optional[int] = 0):
+        """Register a sheet that has already been parsed elsewhere.
+
+        Args:
+            sheet_name: Sheet name
+            df: Parsed frame
+            header: Header row the frame was parsed with
+        """
+        self._frames[(sheet_name, header)] = df
+
+    def _cache_key(self, sheet_name: str, header: Optional[int]) -> Optional[str]:
+        if self.cache is None:
+            return None
+        if self._content_digest is None:
+            self._content_digest = source_digest(self.file_path)
+        return self.cache.make_key(self._content_digest, f"sheet:{sheet_name}:header={header}")
+
+    def get_sheet(self, sheet_name: str, header: Optional[int] = 0) -> Optional[pd.DataFrame]:
+        """Return a sheet, parsing it on first access.
+
+        Args:
+            sheet_name: Sheet name (resolved via ``resolve``)
+            header: Header row passed to the parser (None for raw rows)
+
+        Returns:
+            Parsed DataFrame or None if the sheet does not exist
+        """
+        name = self.resolve(sheet_name)
+        if name is None:
+            return None
+
+        frame_key = (name, header)
+        if frame_key in self._frames:
+            return self._frames[frame_key]
+
+        with self._lock:
+            if frame_key in self._frames:
+                return self._frames[frame_key]
+
+            cache_key = self._cache_key(name, header)
+            if cache_key is not None:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    self._frames[frame_key] = cached[0]
+                    logger.debug(f"Loaded sheet '{name}' of {self.file_path.name} from cache")
+                    return cached[0]
+
+            if self._session is None:
+                self._session = WorkbookSession(self.file_path, engine=self.engine)
+
+            options = parse_options(self.schema) if header is not None else {}
+            df = self._session.read_sheet(name, header=header, **options)
+            if self.schema and header is not None:
+                df = apply_schema(df, self.schema)
+            self._frames[frame_key] = df
+            logger.info(f"Parsed sheet '{name}' of {self.file_path.name} ({len(df)} rows)")
+
+            if cache_key is not None:
+                self.cache.put(cache_key, df, {'sheet': name})
+
+            return df
+
+    def close(self):
+        """Close the underlying workbook handle, keeping parsed sheets."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
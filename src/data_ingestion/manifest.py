@@ -0,0 +1,175 @@
+"""Record of ingested data files, for change-only re-ingestion."""
+import os
+import json
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from src.data_ingestion.archives import ArchiveMember, DataSource, source_digest
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+
+class ManifestEntry(NamedTuple):
+    """What was ingested from one data file."""
+    mtime_ns: int
+    size: int
+    digest: Optional[str]
+    tool_type: Optional[str]
+    key: Optional[str]
+
+
+class ManifestChanges(NamedTuple):
+    """Difference between the data directory and the manifest."""
+    added: List[DataSource]
+    changed: List[DataSource]
+    removed: List[str]
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+def source_id(source: DataSource) -> str:
+    """Identify a data file within its data directory ('bundle.zip/member.csv' for members)."""
+    if isinstance(source, ArchiveMember):
+        return f"{source.archive.name}/{source.member}" if source.member is not None else source.archive.name
+    return source.name
+
+
+def _fingerprint(source: DataSource) -> Tuple[int, int]:
+    """(mtime_ns, size) of the file on disk; the archive's for archive members."""
+    stat = (source.archive if isinstance(source, ArchiveMember) else source).stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+class DataManifest:
+    """mtime, size and content digest of every data file last ingested.
+
+    A file whose mtime and size match its entry is taken as unchanged
+    without reading it. When they differ the file is hashed, so a file
+    that was only touched or copied over with identical contents is not
+    re-ingested. With a path the manifest persists between runs and the
+    recorded digests spare unchanged files from being hashed again.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """Initialize manifest.
+
+        Args:
+            path: JSON file the manifest is kept in (in memory only if None)
+        """
+        self.path = Path(path) if path is not None else None
+        self.entries: Dict[str, ManifestEntry] = {}
+        # Digests taken while diffing, reused when the file is ingested
+        self._fresh: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        self._dirty = False
+        self._load()
+
+    @staticmethod
+    def path_for(cache_dir: Path, data_dir: Path) -> Path:
+        """Manifest file of a data directory inside the cache directory."""
+        name = hashlib.sha256(str(Path(data_dir).resolve()).encode('utf-8')).hexdigest()[:16]
+        return Path(cache_dir) / f"manifest-{name}.json"
+
+    def _load(self):
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                raw = json.load(f)
+            if raw.get('version') != MANIFEST_VERSION:
+                return
+            self.entries = {sid: ManifestEntry(**entry) for sid, entry in raw['files'].items()}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable manifest {self.path}: {e}")
+            self.entries = {}
+
+    def save(self):
+        """Write the manifest to disk if it changed (no-op for an in-memory manifest)."""
+        if self.path is None or not self._dirty:
+            return
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'version': MANIFEST_VERSION,
+                    'files': {sid: entry._asdict() for sid, entry in self.entries.items()}
+                }, f, indent=2)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Could not write manifest {self.path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def known_digest(self, source: DataSource) -> Optional[str]:
+        """Content digest of a file if it is known for its current mtime and size."""
+        sid = source_id(source)
+        fingerprint = _fingerprint(source)
+        entry = self.entries.get(sid)
+        if entry is not None and entry.digest and (entry.mtime_ns, entry.size) == fingerprint:
+            return entry.digest
+        fresh = self._fresh.get(sid)
+        if fresh is not None and fresh[0] == fingerprint:
+            return fresh[1]
+        return None
+
+    def diff(self, sources: List[DataSource]) -> ManifestChanges:
+        """Compare discovered files with the manifest.
+
+        Args:
+            sources: Data files currently in the data directory
+
+        Returns:
+            Added and changed files, and ids of files no longer present
+        """
+        added, changed = [], []
+        for source in sources:
+            sid = source_id(source)
+            entry = self.entries.get(sid)
+            if entry is None:
+                added.append(source)
+                continue
+
+            fingerprint = _fingerprint(source)
+            if (entry.mtime_ns, entry.size) == fingerprint:
+                continue
+
+            digest = source_digest(source)
+            self._fresh[sid] = (fingerprint, digest)
+            if digest == entry.digest:
+                # Touched or rewritten with identical contents
+                self.entries[sid] = entry._replace(mtime_ns=fingerprint[0], size=fingerprint[1])
+                self._dirty = True
+            else:
+                changed.append(source)
+
+        present = {source_id(source) for source in sources}
+        removed = [sid for sid in self.entries if sid not in present]
+        return ManifestChanges(added, changed, removed)
+
+    def record(self, source: DataSource, digest: Optional[str],
+               tool_type: Optional[str], key: Optional[str]):
+        """Record a file as ingested.
+
+        Args:
+            source: Data file
+            digest: Content digest (None if it was not computed)
+            tool_type: Detected tool (None for unrecognized files)
+            key: Key of the file's frame in ``DataLoader.loaded_data``
+        """
+        sid = source_id(source)
+        mtime_ns, size = _fingerprint(source)
+        if digest is None:
+            digest = self.known_digest(source)
+        self.entries[sid] = ManifestEntry(mtime_ns, size, digest, tool_type, key)
+        self._fresh.pop(sid, None)
+        self._dirty = True
+
+    def forget(self, sid: str) -> Optional[ManifestEntry]:
+        """Drop a file's entry, returning it."""
+        self._fresh.pop(sid, None)
+        self._dirty = True
+        return self.entries.pop(sid, None)
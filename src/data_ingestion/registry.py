@@ -0,0 +1,304 @@
+"""Index of loaded frames keyed by tool and report kind."""
+import logging
+from typing import Dict, List, Optional, Tuple
+import pandas as pd
+from src.data_ingestion.table_store import DiskTable, FrameTable, Table
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_KIND = 'default'
+SUMMARY_KIND = 'summary'
+SUMMARY_COLUMNS = ['column', 'kind', 'key', 'value']
+
+# Report kind by the label of a frame's leading column, per tool
+REPORT_KINDS: Dict[str, Dict[str, str]] = {
+    'GSC': {
+        'top queries': 'queries',
+        'queries': 'queries',
+        'top pages': 'pages',
+        'pages': 'pages',
+        'country': 'countries',
+        'device': 'devices',
+        'search appearance': 'search_appearance',
+        'date': 'dates',
+    },
+    'SEMrush': {
+        'domain': 'domain_overview',
+        'url': 'organic_keywords',
+        'keyword': 'keyword_gap',
+    },
+    'Screaming Frog': {
+        'issue name': 'issues',
+        'address': 'internal',
+        'type': 'inlinks',
+    },
+    'Ahrefs': {
+        'referring page url': 'backlinks',
+    },
+    # GA4 exports open with a '#' comment block; the kind is the dimension
+    # label found under it (row 6: 'Country' for the countries report)
+    'GA4': {
+        'country': 'countries',
+        'session default channel group': 'channels',
+    },
+    'PageSpeed': {
+        'url': 'pages',
+    },
+    'Moz': {
+        'root domain': 'linking_domains',
+        'url': 'top_pages',
+        'keyword': 'keywords',
+    },
+    'Bing Webmaster': {
+        'keyword': 'keywords',
+        'page': 'pages',
+        'source url': 'backlinks',
+    },
+    'Sitebulb': {
+        'url': 'urls',
+        'hint': 'hints',
+    },
+}
+
+
+# Report served when a tool's data is asked for without a kind
+DEFAULT_KINDS: Dict[str, str] = {
+    'GSC': 'queries',
+    'SEMrush': 'organic_keywords',
+    'Screaming Frog': 'internal',
+    'Ahrefs': 'backlinks',
+    'GA4': 'channels',
+    'PageSpeed': 'pages',
+    'Moz': 'top_pages',
+    'Bing Webmaster': 'keywords',
+    'Sitebulb': 'urls',
+}
+
+# Columns identifying a row of a report across files. Rows repeating a key
+# (a page in two overlapping crawls) are kept once, from the last file
+# loaded. Reports not listed are per-period exports whose rows are all
+# kept: the same query with the same clicks in two monthly exports is two
+# rows, not a duplicate.
+DEDUP_KEYS: Dict[Tuple[str, str], List[str]] = {
+    ('GSC', 'dates'): ['Date'],
+    ('Screaming Frog', 'internal'): ['Address'],
+    ('Ahrefs', 'backlinks'): ['Referring page URL', 'Target URL'],
+    ('Sitebulb', 'urls'): ['URL'],
+}
+
+
+def report_kind(tool_type: str, df: pd.DataFrame) -> str:
+    """Work out which report of a tool a frame holds.
+
+    Args:
+        tool_type: Tool name
+        df: First-sheet frame as loaded
+
+    Returns:
+        Report kind (``DEFAULT_KIND`` if not recognized)
+    """
+    if list(df.columns) == SUMMARY_COLUMNS:
+        return SUMMARY_KIND
+
+    kinds = REPORT_KINDS.get(tool_type, {})
+    if df.columns.empty or not kinds:
+        return DEFAULT_KIND
+
+    leading = str(df.columns[0]).strip()
+    if leading.startswith('#'):
+        # Labels below the comment block, in order
+        labels = [str(value).strip() for value in df.iloc[:, 0].dropna().head(20)]
+        labels = [label for label in labels if label and not label.startswith('#')]
+    else:
+        labels = [leading]
+
+    for label in labels:
+        kind = kinds.get(label.lower())
+        if kind is not None:
+            return kind
+    return DEFAULT_KIND
+
+
+def combine_frames(frames: List[pd.DataFrame], keys: Optional[List[str]] = None) -> pd.DataFrame:
+    """Concatenate frames of one report.
+
+    Args:
+        frames: Frames in load order
+        keys: Columns identifying a row (see ``DEDUP_KEYS``); rows repeating
+              them are kept once, from the last frame. None keeps every row.
+
+    Returns:
+        Combined frame
+    """
+    if len(frames) == 1:
+        return frames[0]
+
+    combined = pd.concat(frames, ignore_index=True, sort=False)
+    if keys and all(key in combined.columns for key in keys):
+        combined = combined.drop_duplicates(subset=keys, keep='last', ignore_index=True)
+    return combined
+
+
+class DataRegistry:
+    """Frames indexed by (tool, report kind).
+
+    Files of the same report (e.g. monthly GSC query exports) are combined
+    once in ``build`` and then served by direct lookup. The per-file frames
+    stay available through ``parts`` for parsers that need file boundaries.
+    Exports loaded into the table store are registered as ``DiskTable``
+    handles and served through ``table``.
+    """
+
+    def __init__(self):
+        """Initialize empty registry."""
+        self._parts: Dict[Tuple[str, str], List[Tuple[str, pd.DataFrame]]] = {}
+        self._frames: Dict[Tuple[str, str], pd.DataFrame] = {}
+        self._tables: Dict[Tuple[str, str], List[Tuple[str, DiskTable]]] = {}
+        self._kinds: Dict[str, List[str]] = {}
+
+    def __contains__(self, tool_type: str) -> bool:
+        return tool_type in self._kinds
+
+    def add(self, tool_type: str, kind: str, key: str, df: pd.DataFrame):
+        """Register one file's frame.
+
+        Args:
+            tool_type: Tool name
+            kind: Report kind (see ``report_kind``)
+            key: Key of the frame in ``DataLoader.loaded_data``
+            df: Frame
+        """
+        self._parts.setdefault((tool_type, kind), []).append((key, df))
+        self._frames.pop((tool_type, kind), None)
+
+        kinds = self._kinds.setdefault(tool_type, [])
+        if kind not in kinds:
+            kinds.append(kind)
+
+    def add_table(self, tool_type: str, kind: str, key: str, table: DiskTable):
+        """Register one file loaded into the table store.
+
+        Args:
+            tool_type: Tool name
+            kind: Report kind
+            key: Key of the file in ``DataLoader.tables``
+            table: Table handle
+        """
+        self._tables.setdefault((tool_type, kind), []).append((key, table))
+
+        kinds = self._kinds.setdefault(tool_type, [])
+        if kind not in kinds:
+            kinds.append(kind)
+
+    def _key(self, tool_type: str, kind: Optional[str]) -> Optional[Tuple[str, str]]:
+        """(tool, kind) of a lookup, or None if the tool is not loaded."""
+        if tool_type not in self._kinds:
+            return None
+        return tool_type, kind if kind is not None else DEFAULT_KINDS.get(tool_type, DEFAULT_KIND)
+
+    def on_disk(self, tool_type: str, kind: Optional[str] = None) -> bool:
+        """Whether a tool's report has files loaded into the table store."""
+        return self._key(tool_type, kind) in self._tables
+
+    def table(self, tool_type: str, kind: Optional[str] = None) -> Optional[Table]:
+        """Get a tool's report as a queryable table.
+
+        Disk-backed files of the report are read as one table; a report
+        held in memory is wrapped in a ``FrameTable``.
+
+        Args:
+            tool_type: Tool name
+            kind: Report kind (the tool's ``DEFAULT_KINDS`` report if omitted)
+
+        Returns:
+            DiskTable or FrameTable, or None if not loaded
+        """
+        key = self._key(tool_type, kind)
+        if key is None:
+            return None
+
+        tables = [table for _, table in self._tables.get(key, [])]
+        if tables:
+            combined = tables[0]
+            for table in tables[1:]:
+                combined = combined.union(table)
+            return combined
+
+        df = self.get(*key)
+        return FrameTable(df) if df is not None else None
+
+    def build(self):
+        """Combine multi-file reports so later lookups are free."""
+        for (tool_type, kind), parts in self._parts.items():
+            if (tool_type, kind) in self._frames:
+                continue
+
+            frames = [df for _, df in parts]
+            combined = combine_frames(frames, DEDUP_KEYS.get((tool_type, kind)))
+            self._frames[(tool_type, kind)] = combined
+
+            if len(frames) > 1:
+                total = sum(len(df) for df in frames)
+                logger.info(f"Combined {len(frames)} {tool_type} '{kind}' files into "
+                            f"{len(combined)} rows ({total - len(combined)} duplicates dropped)")
+
+    def get(self, tool_type: str, kind: Optional[str] = None) -> Optional[pd.DataFrame]:
+        """Get a tool's frame for one report kind.
+
+        Args:
+            tool_type: Tool name
+            kind: Report kind (the tool's ``DEFAULT_KINDS`` report if omitted)
+
+        Returns:
+            DataFrame or None if not loaded
+        """
+        key = self._key(tool_type, kind)
+        if key not in self._parts:
+            return None
+        if key not in self._frames:
+            self._frames[key] = combine_frames([df for _, df in self._parts[key]], DEDUP_KEYS.get(key))
+        return self._frames[key]
+
+    def parts(self, tool_type: str, kind: Optional[str] = None) -> List[Tuple[str, pd.DataFrame]]:
+        """Per-file (key, frame) pairs of a tool, optionally for one kind."""
+        kinds = [kind] if kind is not None else self._kinds.get(tool_type, [])
+        return [part for k in kinds for part in self._parts.get((tool_type, k), [])]
+
+    def kinds(self, tool_type: str) -> List[str]:
+        """Report kinds loaded for a tool, in load order."""
+        return list(self._kinds.get(tool_type, []))
+
+    def keys(self, tool_type: str, kind: Optional[str] = None) -> List[str]:
+        """``loaded_data`` keys of a tool's files, by report kind then load order."""
+        return [key for key, _ in self.parts(tool_type, kind)]
+
+    def remove(self, key: str):
+        """Unregister one file's frame or table; combined frames are rebuilt on next access.
+
+        Args:
+            key: Key of the file in ``DataLoader.loaded_data`` or ``DataLoader.tables``
+        """
+        for store in (self._parts, self._tables):
+            for (tool_type, kind), parts in list(store.items()):
+                remaining = [part for part in parts if part[0] != key]
+                if len(remaining) == len(parts):
+                    continue
+
+                self._frames.pop((tool_type, kind), None)
+                if remaining:
+                    store[(tool_type, kind)] = remaining
+                else:
+                    del store[(tool_type, kind)]
+
+        for tool_type, kinds in list(self._kinds.items()):
+            kinds[:] = [kind for kind in kinds
+                        if (tool_type, kind) in self._parts or (tool_type, kind) in self._tables]
+            if not kinds:
+                del self._kinds[tool_type]
+
+    def clear(self):
+        """Drop every registered frame."""
+        self._parts.clear()
+        self._frames.clear()
+        self._tables.clear()
+        self._kinds.clear()
@@ -0,0 +1,246 @@
+"""Typed column schemas per SEO tool, derived from ``schema/*.md``."""
+import logging
+from functools import partial
+from typing import Any, Dict, Iterable, Optional, Tuple
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Columns become categorical only when values repeat enough to pay off;
+# on a frame of a few rows the categories cost more than they save
+CATEGORY_MAX_RATIO = 0.5
+# Integer counts are not narrowed below int32: column arithmetic such as
+# summing rank buckets must not overflow
+MIN_INT_DTYPE = 'int32'
+
+# Column kinds:
+#   category - small fixed vocabularies, parsed straight into a categorical;
+#              kept categorical if cardinality ratio <= CATEGORY_MAX_RATIO
+#   text     - categorical if cardinality ratio <= CATEGORY_MAX_RATIO
+#   int      - narrowest integer type (floored at MIN_INT_DTYPE)
+#   float    - float32
+#   skip     - not read at all (bulky columns no analysis uses)
+TOOL_SCHEMAS: Dict[str, Dict[str, str]] = {
+    # schema/gsc_schema.md: Queries, Pages, Countries, Devices, Search appearance, Dates
+    'GSC': {
+        'Top queries': 'text',
+        'Top pages': 'text',
+        'Country': 'category',
+        'Device': 'category',
+        'Search Appearance': 'category',
+        'Clicks': 'int',
+        'Impressions': 'int',
+        'CTR': 'float',
+        'Position': 'float',
+    },
+    # schema/semrush_schema.md: Domain Overview, Organic Keyword, Keyword Gap
+    'SEMrush': {
+        'Domain': 'category',
+        'Authority score': 'int',
+        'Org. Traffic': 'int',
+        'Org. Keywords': 'int',
+        'Backlinks': 'int',
+        'Ref. Domains': 'int',
+        'Url': 'text',
+        'Keyword': 'text',
+        'Position': 'int',
+        'Previous Position': 'int',
+        'Position Diff': 'int',
+        'Search Volume': 'int',
+        'Traffic': 'float',
+        'Traffic Cost': 'float',
+        'Competition': 'float',
+        'Number of Results': 'int',
+        # 12 comma-separated monthly values per keyword
+        'Trends': 'skip',
+        'Gap Type': 'category',
+        'Best Competitor Domain': 'category',
+        'Best Competitor Position': 'int',
+        'Best Competitor URL': 'text',
+        'Best Competitor Traffic': 'float',
+        'Best Competitor Traffic Cost': 'float',
+        'Issue Type': 'category',
+        'Issue Category': 'category',
+    },
+    # schema/screaming_frog.md: Website Issue
+    'Screaming Frog': {
+        'Issue Name': 'category',
+        'Issue Type': 'category',
+        'Issue Priority': 'category',
+        'URLs': 'int',
+        '% of Total': 'float',
+        'Address': 'text',
+        'Status Code': 'int',
+        'Content Type': 'category',
+        'Indexability': 'category',
+        'Indexability Status': 'category',
+    },
+    # schema/ga4_schema.md: Channel and Countries reports
+    'GA4': {
+        'Session Default Channel Group': 'category',
+        'Country': 'category',
+        'Sessions': 'int',
+        'Active users': 'int',
+        'Engagement rate': 'float',
+        'Engaged sessions': 'int',
+        'Average session duration': 'float',
+    },
+    # schema/pagespeed_schema.md
+    'PageSpeed': {
+        'URL': 'text',
+        'Largest Contentful Paint': 'float',
+        'First Input Delay': 'float',
+        'Cumulative Layout Shift': 'float',
+    },
+}
+
+
+def _to_number(series: pd.Series, kind: str) -> pd.Series:
+    """Downcast a column, leaving it untouched if any value is not numeric."""
+    values = pd.to_numeric(series, errors='coerce')
+    if values.isna().sum() > series.isna().sum():
+        return series
+
+    if kind == 'float':
+        return values.astype('float32')
+
+    if values.isna().any() or (values % 1 != 0).any():
+        return values.astype('float32')
+
+    values = pd.to_numeric(values, downcast='integer')
+    if values.dtype.itemsize < pd.api.types.pandas_dtype(MIN_INT_DTYPE).itemsize:
+        values = values.astype(MIN_INT_DTYPE)
+    return values
+
+
+def _is_read(skipped: frozenset, col) -> bool:
+    return str(col).strip().lower() not in skipped
+
+
+def parse_options(schema: Optional[Dict[str, str]], header: Optional[Iterable] = None) -> Dict[str, Any]:
+    """``read_csv`` / ``read_excel`` options applying a schema while parsing.
+
+    Category columns are parsed straight into categoricals, so the
+    object-dtype column is never built, and skipped columns are not read.
+    Numeric conversion stays in ``apply_schema``: exports format numbers
+    in ways a typed parse would reject (a CTR of "3.2%").
+
+    Args:
+        schema: Column name to kind (no options if None)
+        header: Column names of the file, matched case-insensitively; the
+                declared names are used as they are if omitted
+
+    Returns:
+        Keyword arguments for the reader (empty if nothing applies)
+    """
+    if not schema:
+        return {}
+
+    kinds = {name.lower(): kind for name, kind in schema.items()}
+    names = header if header is not None else schema
+    categories = {col: 'category' for col in names if kinds.get(str(col).strip().lower()) == 'category'}
+    skipped = frozenset(name for name, kind in kinds.items() if kind == 'skip')
+
+    options: Dict[str, Any] = {}
+    if categories:
+        options['dtype'] = categories
+    if skipped:
+        options['usecols'] = partial(_is_read, skipped)
+    return options
+
+
+def _pays_off(series: pd.Series) -> bool:
+    """Whether values repeat enough for a categorical to save memory."""
+    return bool(len(series)) and series.nunique(dropna=True) / len(series) <= CATEGORY_MAX_RATIO
+
+
+def apply_schema(df: pd.DataFrame, schema: Dict[str, str]) -> pd.DataFrame:
+    """Convert columns of a frame to the dtypes declared in a tool schema.
+
+    Column names match case-insensitively. Columns not in the schema, and
+    declared numeric columns holding non-numeric values, are left as parsed.
+    Categorical columns whose values barely repeat are turned back into
+    plain columns.
+
+    Args:
+        df: Frame as parsed
+        schema: Column name to kind
+
+    Returns:
+        Frame with typed columns
+    """
+    kinds = {name.lower(): kind for name, kind in schema.items()}
+    converted = {}
+
+    for col in df.columns:
+        kind = kinds.get(str(col).strip().lower())
+        if kind is None:
+            continue
+
+        series = df[col]
+        if kind in ('int', 'float'):
+            if pd.api.types.is_numeric_dtype(series) or series.dtype == object:
+                converted[col] = _to_number(series, kind)
+        elif kind in ('category', 'text'):
+            categorical = isinstance(series.dtype, pd.CategoricalDtype)
+            if _pays_off(series):
+                if not categorical:
+                    converted[col] = series.astype('category')
+                else:
+                    # Parsers store categories less compactly than astype does; rebuild them
+                    converted[col] = series.cat.rename_categories(pd.Index(series.cat.categories.tolist()))
+            elif categorical:
+                # Parsed as categorical (see parse_options) but too few repeats
+                converted[col] = series.astype(series.cat.categories.dtype)
+
+    if not converted:
+        return df
+
+    typed = df.copy(deep=False)
+    for col, series in converted.items():
+        typed[col] = series
+    return typed
+
+
+def frame_memory(df: pd.DataFrame) -> int:
+    """Deep memory footprint of a frame in bytes."""
+    return int(df.memory_usage(deep=True, index=True).sum())
+
+
+def untyped_memory(df: pd.DataFrame) -> int:
+    """Deep memory footprint of a frame as parsed without a schema.
+
+    Columns parsed straight into categoricals (see ``parse_options``) are
+    measured as their decoded values, one column at a time, so the
+    baseline is what an untyped parse would have built.
+    """
+    total = int(df.index.memory_usage(deep=True))
+    for _, series in df.items():
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            series = series.astype(series.cat.categories.dtype)
+        total += int(series.memory_usage(deep=True, index=False))
+    return total
+
+
+def apply_tool_schema(df: pd.DataFrame, tool_type: str) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """Apply a tool's schema and measure the memory saving.
+
+    Args:
+        df: Frame as parsed
+        tool_type: Tool name
+
+    Returns:
+        Tuple of (typed frame, {'raw': untyped bytes, 'typed': bytes})
+    """
+    raw_bytes = untyped_memory(df)
+    schema = TOOL_SCHEMAS.get(tool_type)
+    typed = apply_schema(df, schema) if schema else df
+    return typed, {'raw': raw_bytes, 'typed': frame_memory(typed)}
+
+
+def format_memory_report(key: str, memory: Dict[str, int]) -> str:
+    """Format a per-frame memory line for logging."""
+    raw = memory.get('raw', 0)
+    typed = memory.get('typed', 0)
+    ratio = raw / typed if typed else 0
+    return f"{key}: {raw / 1024:,.1f} KB -> {typed / 1024:,.1f} KB ({ratio:.1f}x)"
@@ -0,0 +1,191 @@
+"""Chunked streaming ingestion for very large CSV exports."""
+import logging
+from typing import Dict, Iterable, Optional
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STREAM_MEMORY_BYTES = 512 * 1024 ** 2
+SAMPLE_ROWS = 1000
+MIN_CHUNK_ROWS = 1000
+# Headroom for the parser's own buffers on top of the materialized chunk
+PARSER_OVERHEAD = 3
+# Distinct values tracked per category column before lumping the rest together
+MAX_CATEGORIES = 10000
+OTHER_CATEGORY = '__other__'
+ROWS_COLUMN = '__rows__'
+
+# Stream column declarations map tool -> column -> how the column is folded:
+#   category - value counts
+#   numeric  - count / sum / min / max
+#   presence - present / missing counts (empty strings count as missing)
+# Each consumer of streamed summaries declares the columns it reads (e.g.
+# ``MetaTagsAnalyzer.STREAM_COLUMNS``); see ``merge_stream_columns``.
+StreamColumns = Dict[str, Dict[str, str]]
+
+
+def merge_stream_columns(*declarations: StreamColumns) -> StreamColumns:
+    """Combine the stream columns declared by several consumers.
+
+    Args:
+        declarations: Tool -> column -> aggregate kind, one per consumer
+
+    Returns:
+        Tool -> column -> aggregate kind covering every consumer
+
+    Raises:
+        ValueError: If two consumers fold the same column differently
+    """
+    merged: StreamColumns = {}
+    for declaration in declarations:
+        for tool_type, columns in declaration.items():
+            tool_columns = merged.setdefault(tool_type, {})
+            for col, kind in columns.items():
+                if tool_columns.setdefault(col, kind) != kind:
+                    raise ValueError(f"{tool_type} column '{col}' is declared both as "
+                                     f"'{tool_columns[col]}' and '{kind}'")
+    return merged
+
+
+class StreamingAggregator:
+    """Folds CSV chunks into running per-column aggregates.
+
+    Memory use is independent of row count: category columns keep at most
+    ``MAX_CATEGORIES`` counters, numeric and presence columns a handful of
+    scalars.
+    """
+
+    def __init__(self, columns: Dict[str, str]):
+        """Initialize aggregator.
+
+        Args:
+            columns: Mapping of column name to aggregate kind
+        """
+        self.columns = columns
+        self.rows = 0
+        self.categories: Dict[str, Dict[str, int]] = {}
+        self.numerics: Dict[str, Dict[str, float]] = {}
+        self.presence: Dict[str, Dict[str, int]] = {}
+
+    def update(self, chunk: pd.DataFrame):
+        """Fold one chunk into the aggregates.
+
+        Args:
+            chunk: Projected chunk of the export
+        """
+        self.rows += len(chunk)
+
+        for col in chunk.columns:
+            kind = self.columns.get(col)
+            series = chunk[col]
+
+            if kind == 'category':
+                counts = self.categories.setdefault(col, {})
+                for value, count in series.astype('string').fillna('').value_counts().items():
+                    if value not in counts and len(counts) >= MAX_CATEGORIES:
+                        value = OTHER_CATEGORY
+                    counts[value] = counts.get(value, 0) + int(count)
+
+            elif kind == 'numeric':
+                values = pd.to_numeric(series, errors='coerce').dropna()
+                if values.empty:
+                    continue
+                stats = self.numerics.setdefault(
+                    col, {'count': 0, 'sum': 0.0, 'min': float('inf'), 'max': float('-inf')}
+                )
+                stats['count'] += len(values)
+                stats['sum'] += float(values.sum())
+                stats['min'] = min(stats['min'], float(values.min()))
+                stats['max'] = max(stats['max'], float(values.max()))
+
+            elif kind == 'presence':
+                missing = int((series.isna() | (series.astype('string').str.strip() == '')).sum())
+                stats = self.presence.setdefault(col, {'present': 0, 'missing': 0})
+                stats['missing'] += missing
+                stats['present'] += len(series) - missing
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the aggregates as a tidy (column, kind, key, value) frame."""
+        records = [(ROWS_COLUMN, 'rows', 'count', float(self.rows))]
+
+        for col, counts in self.categories.items():
+            for value, count in sorted(counts.items(), key=lambda item: -item[1]):
+                records.append((col, 'category', value, float(count)))
+
+        for col, stats in self.numerics.items():
+            for stat, value in stats.items():
+                records.append((col, 'numeric', stat, value))
+            records.append((col, 'numeric', 'mean', stats['sum'] / stats['count']))
+
+        for col, stats in self.presence.items():
+            for stat, value in stats.items():
+                records.append((col, 'presence', stat, float(value)))
+
+        return pd.DataFrame(records, columns=['column', 'kind', 'key', 'value'])
+
+
+def project_columns(header: Iterable, declared: Dict[str, str]) -> Dict[str, str]:
+    """Match declared columns against an export header, ignoring case and padding.
+
+    Args:
+        header: Column names found in the export
+        declared: Declared column name to aggregate kind
+
+    Returns:
+        Mapping of actual header name to aggregate kind
+    """
+    wanted = {name.strip().lower(): kind for name, kind in declared.items()}
+    return {
+        col: wanted[str(col).strip().lower()]
+        for col in header
+        if str(col).strip().lower() in wanted
+    }
+
+
+def estimate_chunk_rows(sample: pd.DataFrame, memory_bytes: int) -> int:
+    """Size chunks so one parsed chunk stays within the memory budget.
+
+    Args:
+        sample: Leading rows of the projected export
+        memory_bytes: Memory budget for a chunk
+
+    Returns:
+        Rows per chunk
+    """
+    if sample.empty:
+        return MIN_CHUNK_ROWS
+
+    bytes_per_row = max(1, int(sample.memory_usage(deep=True, index=False).sum() / len(sample)))
+    return max(MIN_CHUNK_ROWS, memory_bytes // (bytes_per_row * PARSER_OVERHEAD))
+
+
+def stream_csv(source, columns: Dict[str, str],
+               memory_bytes: int = DEFAULT_STREAM_MEMORY_BYTES,
+               chunk_rows: Optional[int] = None) -> StreamingAggregator:
+    """Stream a CSV export into running aggregates.
+
+    Args:
+        source: Path or file object of the CSV export
+        columns: Actual header name to aggregate kind (see ``project_columns``)
+        memory_bytes: Memory budget for one parsed chunk
+        chunk_rows: Rows per chunk (derived from ``memory_bytes`` if omitted)
+
+    Returns:
+        Aggregator holding the folded results
+    """
+    usecols = list(columns)
+
+    if chunk_rows is None:
+        sample = pd.read_csv(source, usecols=usecols, nrows=SAMPLE_ROWS)
+        chunk_rows = estimate_chunk_rows(sample, memory_bytes)
+        if hasattr(source, 'seek'):
+            source.seek(0)
+
+    logger.info(f"Streaming {len(usecols)} columns in chunks of {chunk_rows:,} rows")
+
+    aggregator = StreamingAggregator(columns)
+    with pd.read_csv(source, usecols=usecols, chunksize=chunk_rows, low_memory=True) as reader:
+        for chunk in reader:
+            aggregator.update(chunk)
+
+    return aggregator
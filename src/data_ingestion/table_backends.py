@@ -0,0 +1,4 @@
+"""Names of the on-disk table backends, importable without pandas for the CLI."""
+
+AUTO_BACKEND = 'auto'
+TABLE_BACKENDS = ['duckdb', 'sqlite']
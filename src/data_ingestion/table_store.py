@@ -0,0 +1,433 @@
+"""Disk-backed tables for exports too large to hold in memory."""
+import os
+import hashlib
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+import pandas as pd
+
+try:
+    import duckdb
+except ImportError:  # pragma: no cover - optional dependency
+    duckdb = None
+
+from src.data_ingestion.archives import ArchiveMember, DataSource, open_source
+from src.data_ingestion.streaming import DEFAULT_STREAM_MEMORY_BYTES, SAMPLE_ROWS, estimate_chunk_rows
+from src.data_ingestion.table_backends import AUTO_BACKEND
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TABLE_DIR = Path('.cache') / 'tables'
+DEFAULT_STORE_NAME = 'tables'
+# Row counts of loaded tables, so opening a table never scans it
+CATALOG_TABLE = '_catalog'
+# DuckDB's CSV reader needs a ~32 MB buffer per thread; smaller limits fail to load
+DUCKDB_MIN_MEMORY_BYTES = 64 * 1024 ** 2
+
+# Aggregate name -> SQL over a quoted column, and the pandas equivalent
+AGGREGATES: Dict[str, Tuple[str, str]] = {
+    'count': ('COUNT({})', 'count'),
+    'sum': ('SUM({})', 'sum'),
+    'mean': ('AVG({})', 'mean'),
+    'min': ('MIN({})', 'min'),
+    'max': ('MAX({})', 'max'),
+    'nunique': ('COUNT(DISTINCT {})', 'nunique'),
+}
+OPERATORS = ['=', '!=', '<', '<=', '>', '>=']
+
+# Filters map a column to a value (equality), a list or set of values (IN),
+# an (operator, value) tuple, or None (missing)
+Where = Optional[Dict[str, Any]]
+# Output column -> (source column or '*', aggregate name)
+Metrics = Dict[str, Tuple[str, str]]
+
+
+def resolve_backend(requested: str = AUTO_BACKEND) -> str:
+    """Pick a table backend; DuckDB when installed, else SQLite."""
+    if requested == 'duckdb' and duckdb is None:
+        logger.warning("duckdb is not installed; using the sqlite table backend")
+        return 'sqlite'
+    if requested == AUTO_BACKEND:
+        return 'duckdb' if duckdb is not None else 'sqlite'
+    return requested
+
+
+def _quote(identifier: str) -> str:
+    return '"' + str(identifier).replace('"', '""') + '"'
+
+
+def _where_sql(where: Where) -> Tuple[str, List[Any]]:
+    """Render a filter as a parameterized WHERE clause."""
+    if not where:
+        return '', []
+
+    clauses, params = [], []
+    for column, condition in where.items():
+        col = _quote(column)
+        if condition is None:
+            clauses.append(f"{col} IS NULL")
+        elif isinstance(condition, tuple) and len(condition) == 2 and condition[0] in OPERATORS:
+            clauses.append(f"{col} {condition[0]} ?")
+            params.append(condition[1])
+        elif isinstance(condition, (list, set, frozenset)):
+            values = list(condition)
+            clauses.append(f"{col} IN ({', '.join('?' * len(values))})" if values else '1 = 0')
+            params.extend(values)
+        else:
+            clauses.append(f"{col} = ?")
+            params.append(condition)
+    return ' WHERE ' + ' AND '.join(clauses), params
+
+
+def _where_mask(df: pd.DataFrame, where: Where) -> pd.Series:
+    """Evaluate a filter against a frame."""
+    mask = pd.Series(True, index=df.index)
+    for column, condition in (where or {}).items():
+        series = df[column]
+        if condition is None:
+            mask &= series.isna()
+        elif isinstance(condition, tuple) and len(condition) == 2 and condition[0] in OPERATORS:
+            op, value = condition
+            compare = {'=': series.eq, '!=': series.ne, '<': series.lt,
+                       '<=': series.le, '>': series.gt, '>=': series.ge}[op]
+            mask &= compare(value).fillna(False).astype(bool)
+        elif isinstance(condition, (list, set, frozenset)):
+            mask &= series.isin(list(condition))
+        else:
+            mask &= series.eq(condition).fillna(False).astype(bool)
+    return mask
+
+
+class DiskTable:
+    """Read-only handle on one or more same-shaped tables in a TableStore.
+
+    Filters and aggregations are pushed down to the database, so only
+    their results are brought into memory.
+    """
+
+    def __init__(self, store: 'TableStore', names: List[str], columns: List[str], rows: int):
+        """Initialize handle.
+
+        Args:
+            store: Store holding the tables
+            names: Table names; several are read as one (UNION ALL)
+            columns: Column names, in order
+            rows: Total row count
+        """
+        self.store = store
+        self.names = list(names)
+        self._columns = list(columns)
+        self._rows = rows
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def __repr__(self) -> str:
+        return f"DiskTable({self.store.backend}, {self.names}, {self._rows:,} rows)"
+
+    @property
+    def columns(self) -> List[str]:
+        """Column names."""
+        return list(self._columns)
+
+    def _from(self) -> str:
+        if len(self.names) == 1:
+            return _quote(self.names[0])
+        cols = ', '.join(_quote(col) for col in self._columns)
+        union = ' UNION ALL '.join(f"SELECT {cols} FROM {_quote(name)}" for name in self.names)
+        return f"({union}) AS combined"
+
+    def union(self, other: 'DiskTable') -> 'DiskTable':
+        """Read this table and another as one, over their shared columns."""
+        columns = [col for col in self._columns if col in other.columns]
+        return DiskTable(self.store, self.names + other.names, columns, self._rows + len(other))
+
+    def select(self, columns: Optional[Sequence[str]] = None, where: Where = None,
+               limit: Optional[int] = None) -> pd.DataFrame:
+        """Fetch rows matching a filter.
+
+        Args:
+            columns: Columns to fetch (all if None)
+            where: Filter (see ``Where``)
+            limit: Maximum rows to fetch; keep it bounded on large tables
+
+        Returns:
+            DataFrame of matching rows
+        """
+        cols = ', '.join(_quote(col) for col in columns) if columns else '*'
+        clause, params = _where_sql(where)
+        sql = f"SELECT {cols} FROM {self._from()}{clause}"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return self.store.query(sql, params)
+
+    def head(self, n: int = 5) -> pd.DataFrame:
+        """First ``n`` rows."""
+        return self.select(limit=n)
+
+    def count(self, where: Where = None) -> int:
+        """Number of rows matching a filter."""
+        if not where:
+            return self._rows
+        clause, params = _where_sql(where)
+        return int(self.store.query(f"SELECT COUNT(*) AS n FROM {self._from()}{clause}", params)['n'].iloc[0])
+
+    def aggregate(self, by: Sequence[str], metrics: Metrics, where: Where = None,
+                  order_by: Optional[str] = None, descending: bool = True,
+                  limit: Optional[int] = None) -> pd.DataFrame:
+        """Group, aggregate and rank inside the database.
+
+        Args:
+            by: Group-by columns (empty for a single total row)
+            metrics: Output column -> (source column or '*', aggregate), with
+                     aggregates from ``AGGREGATES``
+            where: Filter applied before grouping
+            order_by: Output column to sort by
+            descending: Sort direction
+            limit: Maximum groups to return
+
+        Returns:
+            One row per group, with the group-by columns and the metrics
+        """
+        selects = [_quote(col) for col in by]
+        for name, (column, func) in metrics.items():
+            target = '*' if column == '*' else _quote(column)
+            selects.append(f"{AGGREGATES[func][0].format(target)} AS {_quote(name)}")
+
+        clause, params = _where_sql(where)
+        sql = f"SELECT {', '.join(selects)} FROM {self._from()}{clause}"
+        if by:
+            sql += f" GROUP BY {', '.join(_quote(col) for col in by)}"
+        if order_by is not None:
+            sql += f" ORDER BY {_quote(order_by)} {'DESC' if descending else 'ASC'}"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return self.store.query(sql, params)
+
+    def value_counts(self, column: str, where: Where = None,
+                     limit: Optional[int] = None) -> pd.Series:
+        """Rows per distinct value of a column, most frequent first."""
+        counts = self.aggregate([column], {'count': ('*', 'count')}, where=where,
+                                order_by='count', limit=limit)
+        return counts.set_index(column)['count']
+
+
+class FrameTable:
+    """In-memory frame behind the ``DiskTable`` query interface.
+
+    Lets analyzers query a tool's data the same way whether it was loaded
+    into memory or into the table store.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        """Initialize wrapper.
+
+        Args:
+            df: Frame to query
+        """
+        self.df = df
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    @property
+    def columns(self) -> List[str]:
+        """Column names."""
+        return list(self.df.columns)
+
+    def select(self, columns: Optional[Sequence[str]] = None, where: Where = None,
+               limit: Optional[int] = None) -> pd.DataFrame:
+        """Fetch rows matching a filter (see ``DiskTable.select``)."""
+        df = self.df[_where_mask(self.df, where)] if where else self.df
+        if columns:
+            df = df[list(columns)]
+        return (df.head(limit) if limit is not None else df).reset_index(drop=True)
+
+    def head(self, n: int = 5) -> pd.DataFrame:
+        """First ``n`` rows."""
+        return self.select(limit=n)
+
+    def count(self, where: Where = None) -> int:
+        """Number of rows matching a filter."""
+        return int(_where_mask(self.df, where).sum()) if where else len(self.df)
+
+    def aggregate(self, by: Sequence[str], metrics: Metrics, where: Where = None,
+                  order_by: Optional[str] = None, descending: bool = True,
+                  limit: Optional[int] = None) -> pd.DataFrame:
+        """Group, aggregate and rank (see ``DiskTable.aggregate``)."""
+        df = self.df[_where_mask(self.df, where)] if where else self.df
+        by = list(by)
+
+        def apply(frame: pd.DataFrame) -> Dict[str, Any]:
+            row = {}
+            for name, (column, func) in metrics.items():
+                row[name] = len(frame) if column == '*' else getattr(frame[column], AGGREGATES[func][1])()
+            return row
+
+        if by:
+            # SQL GROUP BY keeps NULL groups
+            rows = [{**dict(zip(by, key if isinstance(key, tuple) else (key,))), **apply(group)}
+                    for key, group in df.groupby(by, dropna=False, sort=False)]
+            result = pd.DataFrame(rows, columns=by + list(metrics))
+        else:
+            result = pd.DataFrame([apply(df)], columns=list(metrics))
+
+        if order_by is not None:
+            result = result.sort_values(order_by, ascending=not descending, kind='stable')
+        if limit is not None:
+            result = result.head(limit)
+        return result.reset_index(drop=True)
+
+    def value_counts(self, column: str, where: Where = None,
+                     limit: Optional[int] = None) -> pd.Series:
+        """Rows per distinct value of a column, most frequent first."""
+        counts = self.aggregate([column], {'count': ('*', 'count')}, where=where,
+                                order_by='count', limit=limit)
+        return counts.set_index(column)['count']
+
+
+Table = Union[DiskTable, FrameTable]
+
+
+class TableStore:
+    """Embedded database holding exports too large for memory.
+
+    CSVs are loaded chunk by chunk (or by DuckDB's own CSV reader), so
+    neither loading nor querying needs the table to fit in memory. Tables
+    are named after the content digest of their source, so a rerun reuses
+    a table loaded earlier. A table only becomes visible once it is fully
+    loaded.
+    """
+
+    def __init__(self, table_dir: Path = DEFAULT_TABLE_DIR, backend: str = AUTO_BACKEND,
+                 memory_bytes: int = DEFAULT_STREAM_MEMORY_BYTES, name: str = DEFAULT_STORE_NAME):
+        """Initialize store.
+
+        A DuckDB file can only be open in one process at a time; when
+        another process holds it, this store opens a private file for the
+        process instead and removes it on ``close``.
+
+        Args:
+            table_dir: Directory of the database file (created if missing)
+            backend: 'duckdb', 'sqlite' or 'auto'
+            memory_bytes: Memory budget for loading chunks and query working memory
+            name: Database file name, without suffix (one per data directory
+                  keeps concurrent batch and service jobs apart)
+        """
+        self.backend = resolve_backend(backend)
+        self.memory_bytes = memory_bytes
+        self.table_dir = Path(table_dir)
+        self.table_dir.mkdir(parents=True, exist_ok=True)
+        self.path = self.table_dir / f"{name}.{self.backend}"
+        self.private = False
+        self._lock = threading.Lock()
+
+        if self.backend == 'duckdb':
+            try:
+                self._con = duckdb.connect(str(self.path))
+            except duckdb.IOException as e:
+                logger.info(f"Table store {self.path.name} is in use by another process ({e}); "
+                            f"using a private store")
+                self.path = self.table_dir / f"{name}-{os.getpid()}.{self.backend}"
+                self.private = True
+                self._con = duckdb.connect(str(self.path))
+            threads = self._con.execute("SELECT current_setting('threads')").fetchone()[0]
+            limit = max(memory_bytes, DUCKDB_MIN_MEMORY_BYTES * int(threads))
+            self._con.execute(f"SET memory_limit = '{limit // 1024 ** 2}MB'")
+            self._con.execute(f"SET temp_directory = '{self.table_dir / 'spill'}'")
+        else:
+            # SQLite locks per write; wait out other processes' writes instead of failing
+            self._con = sqlite3.connect(str(self.path), timeout=60, check_same_thread=False)
+            self._con.execute(f"PRAGMA cache_size = -{max(1024, memory_bytes // 1024 // 4)}")
+            self._con.execute("PRAGMA temp_store = FILE")
+        self._con.execute(f"CREATE TABLE IF NOT EXISTS {_quote(CATALOG_TABLE)} "
+                          f"(name VARCHAR PRIMARY KEY, rows BIGINT)")
+
+    @staticmethod
+    def name_for(data_dir: Path) -> str:
+        """Database file name of a data directory's tables."""
+        digest = hashlib.sha256(str(Path(data_dir).resolve()).encode('utf-8')).hexdigest()[:16]
+        return f"{DEFAULT_STORE_NAME}-{digest}"
+
+    def _execute(self, sql: str, params: Sequence[Any] = ()):
+        cursor = self._con.execute(sql, list(params))
+        if self.backend == 'sqlite':
+            self._con.commit()
+        return cursor
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> pd.DataFrame:
+        """Run a query and return its result as a frame."""
+        with self._lock:
+            if self.backend == 'duckdb':
+                return self._con.execute(sql, list(params)).df()
+            return pd.read_sql_query(sql, self._con, params=list(params))
+
+    def table(self, name: str) -> Optional[DiskTable]:
+        """Handle on a fully loaded table, or None if it is not in the store."""
+        with self._lock:
+            row = self._con.execute(f"SELECT rows FROM {_quote(CATALOG_TABLE)} WHERE name = ?",
+                                    [name]).fetchone()
+            if row is None:
+                return None
+            cursor = self._con.execute(f"SELECT * FROM {_quote(name)} LIMIT 0")
+            columns = [description[0] for description in cursor.description]
+        return DiskTable(self, [name], columns, int(row[0]))
+
+    def load_csv(self, name: str, source: DataSource) -> DiskTable:
+        """Load a CSV export into a table.
+
+        Args:
+            name: Table name
+            source: CSV file or archive member
+
+        Returns:
+            Handle on the loaded table
+        """
+        # Per process, so two processes loading the same export do not clash
+        loading = f"{name}_loading_{os.getpid()}"
+        with self._lock:
+            self._execute(f"DROP TABLE IF EXISTS {_quote(loading)}")
+            in_zip = isinstance(source, ArchiveMember) and source.member is not None
+            if self.backend == 'duckdb' and not in_zip:
+                # DuckDB reads plain, .gz and .zst CSVs itself, in parallel and out of core
+                path = source.archive if isinstance(source, ArchiveMember) else source
+                self._execute(f"CREATE TABLE {_quote(loading)} AS SELECT * FROM read_csv_auto(?)", [str(path)])
+            else:
+                self._load_chunks(loading, source)
+
+            rows = self._con.execute(f"SELECT COUNT(*) FROM {_quote(loading)}").fetchone()[0]
+            self._execute(f"DROP TABLE IF EXISTS {_quote(name)}")
+            self._execute(f"ALTER TABLE {_quote(loading)} RENAME TO {_quote(name)}")
+            self._execute(f"DELETE FROM {_quote(CATALOG_TABLE)} WHERE name = ?", [name])
+            self._execute(f"INSERT INTO {_quote(CATALOG_TABLE)} VALUES (?, ?)", [name, int(rows)])
+
+        return self.table(name)
+
+    def _load_chunks(self, table: str, source: DataSource):
+        """Append a CSV to a table in chunks sized to the memory budget."""
+        with open_source(source) as stream:
+            sample = pd.read_csv(stream, nrows=SAMPLE_ROWS)
+        chunk_rows = estimate_chunk_rows(sample, self.memory_bytes)
+
+        with open_source(source) as stream, \
+                pd.read_csv(stream, chunksize=chunk_rows, low_memory=True) as reader:
+            for i, chunk in enumerate(reader):
+                if self.backend == 'sqlite':
+                    chunk.to_sql(table, self._con, if_exists='append', index=False)
+                    self._con.commit()
+                else:
+                    self._con.register('_chunk', chunk)
+                    statement = 'CREATE TABLE {} AS SELECT * FROM _chunk' if i == 0 \
+                        else 'INSERT INTO {} SELECT * FROM _chunk'
+                    self._con.execute(statement.format(_quote(table)))
+                    self._con.unregister('_chunk')
+
+    def close(self):
+        """Close the database connection, removing a private store."""
+        with self._lock:
+            self._con.close()
+        if self.private:
+            self.path.unlink(missing_ok=True)
+            self.path.with_name(f"{self.path.name}.wal").unlink(missing_ok=True)
@@ -0,0 +1,270 @@
+"""Single-handle access to a data file for detection and loading."""
+import io
+import time
+import logging
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+import pandas as pd
+from src.data_ingestion.streaming import StreamingAggregator, stream_csv
+from src.data_ingestion.header_sniffer import header_names, is_sniffable, sniff_xlsx
+from src.data_ingestion.excel_backends import engine_candidates
+from src.data_ingestion.archives import ArchiveMember, DataSource, open_source
+
+logger = logging.getLogger(__name__)
+
+EXCEL_SUFFIXES = ['.xlsx', '.xls']
+CSV_SUFFIXES = ['.csv']
+
+
+class WorkbookSession:
+    """Opens a data file once and serves every read from that handle.
+
+    For .xlsx files, sheet names and header rows of the first sheet are
+    sniffed straight from the zip container without building a workbook,
+    so an unrecognized file is never fully opened. Full reads parse the
+    zip container and shared-strings table a single time through
+    ``pd.ExcelFile`` and reuse it for every sheet. Time spent in each stage
+    is accumulated in ``timings`` so callers can report per-file parse cost.
+
+    The workbook is read with the fastest installed engine (see
+    ``excel_backends``); if that engine fails on the file, the next one is
+    tried. Files inside compressed bundles are decompressed as they are
+    read (see ``archives``).
+    """
+
+    def __init__(self, file_path: DataSource, engine: Optional[str] = None):
+        """Initialize session.
+
+        Args:
+            file_path: Path to the data file, or a member of a compressed bundle
+            engine: Excel reader engine ('calamine', 'openpyxl', 'xlrd'), or
+                    None / 'auto' for the fastest installed one
+        """
+        self.file_path = file_path if isinstance(file_path, ArchiveMember) else Path(file_path)
+        self.suffix = self.file_path.suffix.lower()
+        self._engines = engine_candidates(self.suffix, engine) if self.is_excel else []
+        self.timings: Dict[str, float] = {'open': 0.0, 'sniff': 0.0, 'read': 0.0}
+        self._excel_file: Optional[pd.ExcelFile] = None
+        self._frames: Dict[tuple, pd.DataFrame] = {}
+        self._sniffed: Optional[Tuple[List[str], List[List]]] = None
+        self._member_bytes: Optional[bytes] = None
+        # Bundled workbooks are checked when sniffed; a bad one falls back to a full parse
+        self._sniffable = self.suffix == '.xlsx' and (
+            isinstance(self.file_path, ArchiveMember) or is_sniffable(self.file_path))
+
+    def __enter__(self) -> 'WorkbookSession':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def is_excel(self) -> bool:
+        """Whether the file is an Excel workbook."""
+        return self.suffix in EXCEL_SUFFIXES
+
+    @property
+    def is_csv(self) -> bool:
+        """Whether the file is a CSV export."""
+        return self.suffix in CSV_SUFFIXES
+
+    @property
+    def total_seconds(self) -> float:
+        """Total time spent opening and parsing the file."""
+        return sum(self.timings.values())
+
+    def _record(self, stage: str, start: float):
+        self.timings[stage] += time.perf_counter() - start
+
+    @property
+    def engine(self) -> Optional[str]:
+        """Excel engine in use (None for CSV files or the pandas default)."""
+        return self._engines[0] if self._engines else None
+
+    def _fall_back(self, error: Exception) -> bool:
+        """Drop the current engine after a failure; return whether another is left."""
+        if len(self._engines) < 2:
+            return False
+        failed = self._engines.pop(0)
+        logger.warning(f"Excel engine '{failed}' failed on {self.file_path.name} ({error}); "
+                       f"retrying with '{self.engine}'")
+        if self._excel_file is not None:
+            self._excel_file.close()
+            self._excel_file = None
+        return True
+
+    def _excel_input(self) -> Union[Path, io.BytesIO]:
+        """Workbook path, or its bytes when the workbook sits inside a bundle."""
+        if not isinstance(self.file_path, ArchiveMember):
+            return self.file_path
+        if self._member_bytes is None:
+            # Workbooks need random access; the member is decompressed into memory once
+            self._member_bytes = self.file_path.read_bytes()
+        return io.BytesIO(self._member_bytes)
+
+    def _workbook(self) -> pd.ExcelFile:
+        """Return the open workbook handle, opening it on first use."""
+        while self._excel_file is None:
+            start = time.perf_counter()
+            try:
+                self._excel_file = pd.ExcelFile(self._excel_input(), engine=self.engine)
+            except Exception as e:
+                if not self._fall_back(e):
+                    raise
+            finally:
+                self._record('open', start)
+        return self._excel_file
+
+    def _parse(self, sheet_name: Union[str, int], **kwargs) -> pd.DataFrame:
+        """Parse a sheet, falling back to the next engine if the current one fails."""
+        while True:
+            workbook = self._workbook()
+            if isinstance(sheet_name, str) and sheet_name not in workbook.sheet_names:
+                # Not an engine problem; no point trying another one
+                raise ValueError(f"Worksheet named '{sheet_name}' not found")
+            try:
+                return workbook.parse(sheet_name, **kwargs)
+            except Exception as e:
+                if not self._fall_back(e):
+                    raise
+
+    def _sniff(self, max_rows: int) -> Optional[Tuple[List[str], List[List]]]:
+        """Sniff sheet names and leading rows from the zip container.
+
+        Returns:
+            Tuple of (sheet names, rows) or None if the file cannot be sniffed
+        """
+        if not self._sniffable or self._excel_file is not None:
+            return None
+
+        if self._sniffed is None or len(self._sniffed[1]) < max_rows:
+            start = time.perf_counter()
+            try:
+                self._sniffed = sniff_xlsx(self._excel_input(), max_rows=max_rows)
+            except Exception as e:
+                logger.debug(f"Falling back to full parse for {self.file_path.name}: {e}")
+                self._sniffable = False
+                return None
+            finally:
+                self._record('sniff', start)
+
+        return self._sniffed
+
+    @property
+    def sheet_names(self) -> List[str]:
+        """Sheet names of the workbook (empty for CSV files)."""
+        if not self.is_excel:
+            return []
+
+        sniffed = self._sniff(max_rows=1)
+        if sniffed is not None:
+            return sniffed[0]
+        return self._workbook().sheet_names
+
+    def _header_from_sniff(self, sheet_name: Union[str, int], nrows: int) -> Optional[pd.DataFrame]:
+        """Build a header frame for the first sheet from sniffed rows."""
+        if not self._sniffable or self._excel_file is not None:
+            return None
+
+        sniffed = self._sniff(max_rows=nrows + 1)
+        if sniffed is None or sheet_name not in (0, sniffed[0][0] if sniffed[0] else None):
+            return None
+
+        rows = sniffed[1][:nrows + 1]
+        if not rows:
+            return pd.DataFrame()
+
+        # Trailing empty columns and blank data rows are dropped, as pandas does
+        width = max(len(row) for row in rows)
+        padded = [row + [None] * (width - len(row)) for row in rows]
+        data = [row for row in padded[1:] if any(value is not None for value in row)]
+        width = max((len(row) for row in [rows[0]] + data), default=0)
+        return pd.DataFrame([row[:width] for row in data],
+                            columns=header_names(padded[0][:width]))
+
+    def read_header(self, sheet_name: Union[str, int] = 0, nrows: int = 5) -> pd.DataFrame:
+        """Read the first rows of a sheet for column sniffing.
+
+        Args:
+            sheet_name: Sheet name or index (ignored for CSV)
+            nrows: Number of data rows to read
+
+        Returns:
+            DataFrame with at most ``nrows`` rows
+        """
+        full_key = (sheet_name, 0, (), None)
+        if full_key in self._frames:
+            return self._frames[full_key].head(nrows)
+
+        df = self._header_from_sniff(sheet_name, nrows)
+        if df is not None:
+            return df
+
+        start = time.perf_counter()
+        try:
+            if self.is_excel:
+                return self._parse(sheet_name, nrows=nrows)
+            with open_source(self.file_path) as source:
+                return pd.read_csv(source, nrows=nrows)
+        finally:
+            self._record('sniff', start)
+
+    def read_sheet(self, sheet_name: Union[str, int] = 0, header: Optional[int] = 0,
+                   dtype: Optional[Dict[str, str]] = None,
+                   usecols: Optional[Callable[[str], bool]] = None) -> pd.DataFrame:
+        """Read a full sheet, caching it for the lifetime of the session.
+
+        Args:
+            sheet_name: Sheet name or index (ignored for CSV)
+            header: Header row (None to keep every row as data)
+            dtype: Column name to dtype, applied while parsing
+            usecols: Predicate on column names selecting the columns to read
+                     (see ``schemas.parse_options``)
+
+        Returns:
+            Parsed DataFrame
+        """
+        frame_key = (sheet_name, header, tuple(sorted((dtype or {}).items())), usecols)
+        if frame_key not in self._frames:
+            start = time.perf_counter()
+            try:
+                if self.is_excel:
+                    df = self._parse(sheet_name, header=header, dtype=dtype, usecols=usecols)
+                else:
+                    with open_source(self.file_path) as source:
+                        df = pd.read_csv(source, header=header, dtype=dtype, usecols=usecols)
+            finally:
+                self._record('read', start)
+            self._frames[frame_key] = df
+
+        return self._frames[frame_key]
+
+    def stream(self, columns: Dict[str, str], memory_bytes: int) -> StreamingAggregator:
+        """Stream a CSV file into running aggregates instead of reading it whole.
+
+        Args:
+            columns: Actual header name to aggregate kind
+            memory_bytes: Memory budget for one parsed chunk
+
+        Returns:
+            Aggregator holding the folded results
+        """
+        start = time.perf_counter()
+        try:
+            with open_source(self.file_path) as source:
+                return stream_csv(source, columns, memory_bytes)
+        finally:
+            self._record('read', start)
+
+    def close(self):
+        """Release the workbook handle and cached frames."""
+        if self._excel_file is not None:
+            self._excel_file.close()
+            self._excel_file = None
+        self._member_bytes = None
+        self._frames.clear()
+
+    def timing_summary(self) -> str:
+        """Format stage timings for logging."""
+        stages = ', '.join(f"{stage} {seconds:.3f}s" for stage, seconds in self.timings.items())
+        return f"{self.total_seconds:.3f}s ({stages})"
@@ -1,10 +1,27 @@
 """Phase 2: Narrative & Storyline Architecture Generator."""
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from src.models.audit_data import ExecutiveSummary, FindingsSummary, FindingsPillar
 
 logger = logging.getLogger(__name__)
 
+# Phase 1 insights each narrative piece is written from
+NARRATIVE_INPUTS: Dict[str, Tuple[str, ...]] = {
+    'exec_summary': ('section_summary_organic', 'section_summary_content',
+                     'section_summary_technical', 'section_summary_authority'),
+    'findings_summary': ('section_summary_technical', 'section_summary_content',
+                         'section_summary_authority', 'organic_traffic'),
+}
+
+
+def _field(data: Any, name: str, default: Any = None) -> Any:
+    """Read a field from an insight model or a plain dictionary."""
+    if data is None:
+        return default
+    if isinstance(data, dict):
+        return data.get(name, default)
+    return getattr(data, name, default)
+
 
 class Phase2Generator:
     """Generates Phase 2: Narrative & Storyline Architecture."""
@@ -16,25 +33,48 @@ class Phase2Generator:
             phase1_insights: Dictionary of insights from Phase 1
         """
         self.insights = phase1_insights
-
-    def execute(self) -> Dict[str, Any]:
+        self.narrative: Dict[str, Any] = {}
+        # Insight objects each piece was last written from
+        self._sources: Dict[str, Tuple[Any, ...]] = {}
+
+    def _piece(self, key: str, message: str, generate) -> Any:
+        """Write one narrative piece, or keep it if its Phase 1 insights are unchanged."""
+        sources = tuple(self.insights.get(name) for name in NARRATIVE_INPUTS[key])
+        previous = self._sources.get(key)
+        if key in self.narrative and previous is not None and \
+                all(a is b for a, b in zip(previous, sources)):
+            logger.debug(f"Keeping {key}; its insights are unchanged")
+            return self.narrative[key]
+
+        logger.info(message)
+        self._sources[key] = sources
+        return generate()
+
+    def execute(self, phase1_insights: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Execute Phase 2 narrative generation.
 
+        Args:
+            phase1_insights: Updated Phase 1 insights; only the pieces whose
+                             insights changed are rewritten
+
         Returns:
             Dictionary with executive summary and findings summary
         """
         logger.info("=== Starting Phase 2: Narrative & Storyline Architecture ===")
+        if phase1_insights is not None:
+            self.insights = phase1_insights
 
         narrative = {}
 
         # Generate Executive Summary (Slide 5)
-        logger.info("Crafting executive summary...")
-        narrative['exec_summary'] = self._generate_executive_summary()
+        narrative['exec_summary'] = self._piece(
+            'exec_summary', "Crafting executive summary...", self._generate_executive_summary)
 
         # Generate Findings Summary (Slide 24)
-        logger.info("Consolidating findings summary...")
-        narrative['findings_summary'] = self._generate_findings_summary()
+        narrative['findings_summary'] = self._piece(
+            'findings_summary', "Consolidating findings summary...", self._generate_findings_summary)
 
+        self.narrative = narrative
         logger.info("=== Phase 2 Complete ===")
         return narrative
 
@@ -44,10 +84,10 @@ class Phase2Generator:
         CRITICAL: Must ONLY pull from section summaries (Slides 11, 16, 19, 22)
         """
         # Extract key highlights from each section summary
-        general = self.insights.get('section_summary_organic', {})
-        content = self.insights.get('section_summary_content', {})
-        technical = self.insights.get('section_summary_technical', {})
-        authority = self.insights.get('section_summary_authority', {})
+        general = self.insights.get('section_summary_organic')
+        content = self.insights.get('section_summary_content')
+        technical = self.insights.get('section_summary_technical')
+        authority = self.insights.get('section_summary_authority')
 
         return ExecutiveSummary(
             general=self._craft_exec_summary_text(general, "General Overview"),
@@ -56,11 +96,11 @@ class Phase2Generator:
             authority=self._craft_exec_summary_text(authority, "Domain Authority")
         )
 
-    def _craft_exec_summary_text(self, section_data: Dict, pillar_name: str) -> str:
+    def _craft_exec_summary_text(self, section_data: Any, pillar_name: str) -> str:
         """Craft executive summary text for a pillar.
 
         Args:
-            section_data: Section summary data
+            section_data: Section summary (model or dictionary)
             pillar_name: Name of the pillar
 
         Returns:
@@ -70,8 +110,8 @@ class Phase2Generator:
             return f"{pillar_name}: Analysis pending."
 
         # Get the top issue and impact
-        issues = section_data.get('issues', [])
-        impacts = section_data.get('impacts', [])
+        issues = _field(section_data, 'issues', [])
+        impacts = _field(section_data, 'impacts', [])
 
         if issues and impacts:
             # Combine top issue with impact in strategic language
@@ -79,49 +119,41 @@ class Phase2Generator:
             top_impact = impacts[0]
 
             return f"{top_issue}. {top_impact}"
-        elif 'key_highlight' in section_data:
-            return section_data['key_highlight']
+        elif _field(section_data, 'key_highlight'):
+            return _field(section_data, 'key_highlight')
         else:
             return f"{pillar_name}: Optimization opportunities identified."
 
     def _generate_findings_summary(self) -> FindingsSummary:
         """Generate consolidated findings summary across all pillars."""
-        # Determine dominant theme
-        priorities = [
-            self.insights.get('section_summary_technical', {}).get('priority', 'M'),
-            self.insights.get('section_summary_content', {}).get('priority', 'M'),
-            self.insights.get('section_summary_authority', {}).get('priority', 'M')
-        ]
-
         # Generate unified key message
         key_message = self._generate_unified_key_message()
 
         # Get primary traffic issue
-        organic_data = self.insights.get('organic_traffic', {})
-        subtitle = organic_data.get('key_message', '') if organic_data else ""
+        subtitle = _field(self.insights.get('organic_traffic'), 'key_message', '')
 
         # Extract technical pillar findings
-        technical_summary = self.insights.get('section_summary_technical', {})
+        technical_summary = self.insights.get('section_summary_technical')
         technical_pillar = FindingsPillar(
-            priority=technical_summary.get('priority', 'M'),
-            issues=technical_summary.get('issues', [])[:3],
-            actions=technical_summary.get('actions', [])[:3]
+            priority=_field(technical_summary, 'priority', 'M'),
+            issues=_field(technical_summary, 'issues', [])[:3],
+            actions=_field(technical_summary, 'actions', [])[:3]
         )
 
         # Extract content pillar findings
-        content_summary = self.insights.get('section_summary_content', {})
+        content_summary = self.insights.get('section_summary_content')
         content_pillar = FindingsPillar(
-            priority=content_summary.get('priority', 'M'),
-            issues=content_summary.get('issues', [])[:3],
-            actions=content_summary.get('actions', [])[:3]
+            priority=_field(content_summary, 'priority', 'M'),
+            issues=_field(content_summary, 'issues', [])[:3],
+            actions=_field(content_summary, 'actions', [])[:3]
         )
 
         # Extract authority pillar findings
-        authority_summary = self.insights.get('section_summary_authority', {})
+        authority_summary = self.insights.get('section_summary_authority')
         authority_pillar = FindingsPillar(
-            priority=authority_summary.get('priority', 'M'),
-            issues=authority_summary.get('issues', [])[:3],
-            actions=authority_summary.get('actions', [])[:3]
+            priority=_field(authority_summary, 'priority', 'M'),
+            issues=_field(authority_summary, 'issues', [])[:3],
+            actions=_field(authority_summary, 'actions', [])[:3]
         )
 
         return FindingsSummary(
@@ -136,9 +168,9 @@ class Phase2Generator:
         """Generate unified key message across all pillars."""
         # Analyze which pillar is the biggest barrier
         priorities = {
-            'technical': self.insights.get('section_summary_technical', {}).get('priority', 'M'),
-            'content': self.insights.get('section_summary_content', {}).get('priority', 'M'),
-            'authority': self.insights.get('section_summary_authority', {}).get('priority', 'M')
+            'technical': _field(self.insights.get('section_summary_technical'), 'priority', 'M'),
+            'content': _field(self.insights.get('section_summary_content'), 'priority', 'M'),
+            'authority': _field(self.insights.get('section_summary_authority'), 'priority', 'M')
         }
 
         priority_order = {'C': 0, 'H': 1, 'M': 2, 'L': 3}
@@ -1,15 +1,41 @@
 """Phase 3: PowerPoint Report Generator."""
+import io
 import logging
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime
+import pptx
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 
 logger = logging.getLogger(__name__)
 
+# python-pptx's built-in blank template
+DEFAULT_TEMPLATE = Path(pptx.__file__).parent / 'templates' / 'default.pptx'
+
+
+@lru_cache(maxsize=None)
+def _template_bytes(template_path: Path) -> bytes:
+    return template_path.read_bytes()
+
+
+def new_presentation(template_path: Optional[Path] = None):
+    """Open a fresh presentation from a template.
+
+    Each template file is read once per process, so a worker building many
+    decks in a batch does not go back to disk for every client.
+
+    Args:
+        template_path: PowerPoint template (python-pptx's default if None)
+
+    Returns:
+        Presentation with the template's masters and layouts
+    """
+    return Presentation(io.BytesIO(_template_bytes(Path(template_path or DEFAULT_TEMPLATE))))
+
 
 class Phase3Generator:
     """Generates Phase 3: Final PowerPoint Output."""
@@ -80,7 +106,7 @@ class Phase3Generator:
 
     def _generate_basic_ppt(self, output_path: Path) -> Path:
         """Generate a basic PowerPoint presentation."""
-        prs = Presentation()
+        prs = new_presentation(self.template_path)
         prs.slide_width = Inches(10)
         prs.slide_height = Inches(7.5)
 
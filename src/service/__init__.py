@@ -0,0 +1 @@
+"""Long-lived audit service: job queue, worker pool and status endpoint."""
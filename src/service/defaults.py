@@ -0,0 +1,8 @@
+"""Service defaults, importable without the server's dependencies for the CLI."""
+from pathlib import Path
+
+DEFAULT_QUEUE_PATH = Path('output') / 'service' / 'jobs.sqlite3'
+DEFAULT_SERVICE_ARTIFACTS_DIR = Path('output') / 'service' / 'runs'
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_POLL_INTERVAL = 1.0
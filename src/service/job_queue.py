@@ -0,0 +1,170 @@
+"""SQLite-backed queue of audit jobs."""
+import json
+import sqlite3
+import logging
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from src.service.defaults import DEFAULT_QUEUE_PATH
+from src.utils.batch import BatchJob, BatchResult
+
+logger = logging.getLogger(__name__)
+
+QUEUED = 'queued'
+RUNNING = 'running'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    brand_name TEXT NOT NULL,
+    data_dir TEXT NOT NULL,
+    website_type TEXT NOT NULL,
+    config_path TEXT,
+    status TEXT NOT NULL,
+    exit_code INTEGER,
+    submitted_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT,
+    artifacts_dir TEXT,
+    timings TEXT,
+    outputs TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, id);
+"""
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec='seconds')
+
+
+class JobQueue:
+    """Audit jobs in a SQLite table, shared by submitters and the service.
+
+    Other processes (the portal, a cron job) can submit jobs by inserting
+    through this class while the service runs. Every call opens its own
+    connection, so one queue can be used from the service's dispatcher and
+    HTTP threads at once; claiming a job is a single write transaction, so
+    two services on one database never run the same job.
+    """
+
+    def __init__(self, path: Path = DEFAULT_QUEUE_PATH):
+        """Initialize queue.
+
+        Args:
+            path: Database file (created with its parent directory if missing)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as con:
+            con.execute("PRAGMA journal_mode=WAL")
+            con.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        con = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+        con.row_factory = sqlite3.Row
+        try:
+            yield con
+        finally:
+            con.close()
+
+    def submit(self, job: BatchJob) -> int:
+        """Queue a job.
+
+        Returns:
+            Job id
+        """
+        with self._connect() as con:
+            cursor = con.execute(
+                "INSERT INTO jobs (brand_name, data_dir, website_type, config_path, status, submitted_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job.brand_name, str(job.data_dir), job.website_type,
+                 str(job.config_path) if job.config_path is not None else None, QUEUED, _now())
+            )
+            return cursor.lastrowid
+
+    def claim(self) -> Optional[Tuple[int, BatchJob]]:
+        """Take the oldest queued job and mark it running.
+
+        Returns:
+            Tuple of (job id, job whose slug is 'job-<id>'), or None if
+            nothing is queued
+        """
+        with self._connect() as con:
+            con.execute("BEGIN IMMEDIATE")
+            try:
+                row = con.execute(
+                    "SELECT * FROM jobs WHERE status = ? ORDER BY id LIMIT 1", (QUEUED,)
+                ).fetchone()
+                if row is not None:
+                    con.execute("UPDATE jobs SET status = ?, started_at = ? WHERE id = ?",
+                                (RUNNING, _now(), row['id']))
+                con.execute("COMMIT")
+            except sqlite3.Error:
+                con.execute("ROLLBACK")
+                raise
+
+        if row is None:
+            return None
+        return row['id'], BatchJob(
+            brand_name=row['brand_name'],
+            data_dir=Path(row['data_dir']),
+            website_type=row['website_type'],
+            config_path=Path(row['config_path']) if row['config_path'] else None,
+            slug=f"job-{row['id']}",
+        )
+
+    def finish(self, job_id: int, result: BatchResult):
+        """Record a job's outcome."""
+        with self._connect() as con:
+            con.execute(
+                "UPDATE jobs SET status = ?, exit_code = ?, finished_at = ?, artifacts_dir = ?, "
+                "timings = ?, outputs = ?, error = ? WHERE id = ?",
+                (result.status, result.exit_code, _now(), result.artifacts_dir,
+                 json.dumps(result.timings), json.dumps(result.outputs), result.error, job_id)
+            )
+
+    def requeue_running(self) -> int:
+        """Put jobs left running by a service that stopped back in the queue.
+
+        Returns:
+            Number of jobs requeued
+        """
+        with self._connect() as con:
+            cursor = con.execute("UPDATE jobs SET status = ?, started_at = NULL WHERE status = ?",
+                                 (QUEUED, RUNNING))
+            if cursor.rowcount:
+                logger.warning(f"Requeued {cursor.rowcount} interrupted jobs")
+            return cursor.rowcount
+
+    def get(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """One job as a JSON-compatible dict (None if unknown)."""
+        with self._connect() as con:
+            row = con.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row is not None else None
+
+    def jobs(self, status: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """Most recent jobs first, optionally only those with a status."""
+        query, params = "SELECT * FROM jobs", []
+        if status is not None:
+            query += " WHERE status = ?"
+            params.append(status)
+        query += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+        with self._connect() as con:
+            return [self._to_dict(row) for row in con.execute(query, params)]
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs per status."""
+        with self._connect() as con:
+            return {row['status']: row['n'] for row in
+                    con.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status")}
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        job = dict(row)
+        for key in ('timings', 'outputs'):
+            job[key] = json.loads(job[key]) if job[key] else {}
+        return job
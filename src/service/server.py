@@ -0,0 +1,205 @@
+"""Audit worker service: runs queued jobs on a warm process pool."""
+import re
+import json
+import signal
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+from src.service.defaults import DEFAULT_HOST, DEFAULT_POLL_INTERVAL, DEFAULT_PORT, DEFAULT_SERVICE_ARTIFACTS_DIR
+from src.service.job_queue import JobQueue
+from src.utils.batch import BatchJob, BatchResult, client_job
+from src.utils.headless import EXIT_FAILED, RUN_STATUS
+
+logger = logging.getLogger(__name__)
+
+# Runs one job in a worker process: (job, tool options, artifacts root) -> result
+RunJob = Callable[[BatchJob, Dict[str, Any], Path], BatchResult]
+
+_JOB_PATH = re.compile(r'^/jobs/(\d+)$')
+
+
+def _init_service_worker(initializer: Optional[Callable], initargs: Tuple):
+    # Ctrl+C stops the service, which lets running jobs finish; it must not
+    # interrupt the workers themselves
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if initializer is not None:
+        initializer(*initargs)
+
+
+class AuditService:
+    """Pulls jobs from a ``JobQueue`` and runs them on a process pool.
+
+    The pool's workers live as long as the service, so each imports the
+    analysis libraries and loads the slide template once and then runs job
+    after job. A local HTTP endpoint reports job status and accepts new
+    jobs:
+
+        GET  /health      - queue counts and running jobs
+        GET  /jobs        - recent jobs (``?status=`` to filter)
+        GET  /jobs/<id>   - one job, with timings and output paths
+        POST /jobs        - submit {"brand_name", "data_dir", "website_type", "config"}
+    """
+
+    def __init__(self, queue: JobQueue, run_job: RunJob, options: Dict[str, Any],
+                 artifacts_root: Path = DEFAULT_SERVICE_ARTIFACTS_DIR, workers: int = 2,
+                 initializer: Optional[Callable] = None, initargs: Tuple = (),
+                 host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL):
+        """Initialize service.
+
+        Args:
+            queue: Job queue
+            run_job: Module-level function running one job in a worker
+            options: Keyword arguments passed through to ``run_job``
+            artifacts_root: Directory holding one artifacts directory per job
+            workers: Jobs run concurrently
+            initializer: Called once in every worker process
+            initargs: Arguments of ``initializer``
+            host: Address the status endpoint listens on
+            port: Port of the status endpoint (0 picks a free one)
+            poll_interval: Seconds between queue checks when idle
+        """
+        self.queue = queue
+        self.run_job = run_job
+        self.options = options
+        self.artifacts_root = Path(artifacts_root)
+        self.workers = workers
+        self.initializer = initializer
+        self.initargs = initargs
+        self.poll_interval = poll_interval
+        self.running: Dict[int, BatchJob] = {}
+        self._stopping = threading.Event()
+        self._http = ThreadingHTTPServer((host, port), _make_handler(self))
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """Host and port the status endpoint is listening on."""
+        return self._http.server_address[:2]
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_service_worker,
+                                   initargs=(self.initializer, self.initargs))
+
+    def serve_forever(self):
+        """Run jobs until ``stop``, Ctrl+C or SIGTERM; running jobs are finished first."""
+        self.queue.requeue_running()
+        if threading.current_thread() is threading.main_thread():
+            # Service managers stop daemons with SIGTERM
+            signal.signal(signal.SIGTERM, lambda signum, frame: self.stop())
+        http_thread = threading.Thread(target=self._http.serve_forever, name='service-http', daemon=True)
+        http_thread.start()
+        logger.info(f"Audit service listening on http://{self.address[0]}:{self.address[1]} "
+                    f"with {self.workers} workers")
+
+        pool = self._new_pool()
+        futures = {}
+        try:
+            while not self._stopping.is_set():
+                while len(futures) < self.workers and not self._stopping.is_set():
+                    claimed = self.queue.claim()
+                    if claimed is None:
+                        break
+                    job_id, job = claimed
+                    logger.info(f"Starting job {job_id}: {job.brand_name}")
+                    self.running[job_id] = job
+                    futures[pool.submit(self.run_job, job, self.options, self.artifacts_root)] = job_id
+
+                if not futures:
+                    self._stopping.wait(self.poll_interval)
+                    continue
+                finished, _ = wait(futures, timeout=self.poll_interval, return_when=FIRST_COMPLETED)
+                pool = self._collect(finished, futures, pool)
+        except KeyboardInterrupt:
+            logger.info("Stopping audit service; waiting for running jobs")
+        finally:
+            self._stopping.set()
+            pool = self._collect(wait(futures).done, futures, pool)
+            pool.shutdown()
+            self._http.shutdown()
+            self._http.server_close()
+
+    def _collect(self, finished, futures: Dict, pool: ProcessPoolExecutor) -> ProcessPoolExecutor:
+        """Record finished jobs; replaces the pool if a worker process died."""
+        broken = False
+        for future in finished:
+            job_id = futures.pop(future)
+            job = self.running.pop(job_id)
+            try:
+                result = future.result()
+            except Exception as e:
+                broken = broken or isinstance(e, BrokenProcessPool)
+                logger.error(f"Job {job_id} failed: {e}")
+                result = BatchResult(job.brand_name, RUN_STATUS[EXIT_FAILED], EXIT_FAILED, {}, {},
+                                     str(self.artifacts_root / job.slug), str(e) or type(e).__name__)
+            self.queue.finish(job_id, result)
+            logger.info(f"Finished job {job_id}: {job.brand_name} ({result.status})")
+
+        if broken and not self._stopping.is_set():
+            logger.warning("A worker process died; starting a new pool")
+            pool.shutdown(wait=False)
+            return self._new_pool()
+        return pool
+
+    def stop(self):
+        """Ask ``serve_forever`` to return once running jobs have finished."""
+        self._stopping.set()
+
+    def status(self) -> Dict[str, Any]:
+        """Queue counts and running jobs, for /health."""
+        return {
+            'status': 'stopping' if self._stopping.is_set() else 'ok',
+            'workers': self.workers,
+            'jobs': self.queue.counts(),
+            'running': {job_id: job.brand_name for job_id, job in list(self.running.items())},
+        }
+
+
+def _make_handler(service: AuditService):
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, code: int, body: Any):
+            payload = json.dumps(body, default=str).encode('utf-8')
+            self.send_response(code)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            path, _, query = self.path.partition('?')
+            if path == '/health':
+                self._reply(200, service.status())
+            elif path == '/jobs':
+                params = dict(pair.partition('=')[::2] for pair in query.split('&') if pair)
+                self._reply(200, service.queue.jobs(status=params.get('status') or None))
+            elif _JOB_PATH.match(path):
+                job = service.queue.get(int(_JOB_PATH.match(path).group(1)))
+                if job is None:
+                    self._reply(404, {'error': 'unknown job'})
+                else:
+                    self._reply(200, job)
+            else:
+                self._reply(404, {'error': 'not found'})
+
+        def do_POST(self):
+            if self.path != '/jobs':
+                self._reply(404, {'error': 'not found'})
+                return
+            try:
+                length = int(self.headers.get('Content-Length') or 0)
+                entry = json.loads(self.rfile.read(length) or b'{}')
+                if not isinstance(entry, dict):
+                    raise ValueError("Job must be a JSON object")
+                job = client_job(entry, Path.cwd(), 'Job')
+            except ValueError as e:
+                self._reply(400, {'error': str(e)})
+                return
+            self._reply(201, {'id': service.queue.submit(job)})
+
+        def log_message(self, format, *args):
+            logger.debug(f"{self.address_string()} {format % args}")
+
+    return Handler
@@ -0,0 +1,116 @@
+"""Batch (portfolio) runs: the client manifest and per-client results."""
+import re
+import json
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+from src.utils.config import WEBSITE_TYPES
+
+MANIFEST_KEYS = ('brand_name', 'data_dir', 'website_type', 'config')
+
+
+class BatchJob(NamedTuple):
+    """One client of a batch."""
+    brand_name: str
+    data_dir: Path
+    website_type: str = 'ecommerce'
+    config_path: Optional[Path] = None
+    slug: str = ''
+
+
+class BatchResult(NamedTuple):
+    """Outcome of one client's audit."""
+    brand_name: str
+    status: str
+    exit_code: int
+    timings: Dict[str, float]
+    outputs: Dict[str, str]
+    artifacts_dir: str
+    error: Optional[str] = None
+
+
+def _slug(name: str) -> str:
+    return re.sub(r'[^A-Za-z0-9]+', '-', name).strip('-') or 'client'
+
+
+def load_manifest(path: Path) -> List[BatchJob]:
+    """Read a batch manifest.
+
+    The manifest is a JSON list of clients, or an object with a "clients"
+    list and optional "defaults" applied to every client::
+
+        {
+          "defaults": {"website_type": "ecommerce", "config": "config/example_config.json"},
+          "clients": [
+            {"brand_name": "Acme", "data_dir": "clients/acme"},
+            {"brand_name": "Globex", "data_dir": "clients/globex", "website_type": "saas"}
+          ]
+        }
+
+    Relative paths are resolved against the manifest's directory.
+
+    Args:
+        path: Manifest file
+
+    Returns:
+        Jobs in manifest order, each with a unique artifacts slug
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If it is not valid JSON or a client entry is invalid
+    """
+    path = Path(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    defaults: Dict[str, Any] = {}
+    clients = manifest
+    if isinstance(manifest, dict):
+        defaults = manifest.get('defaults') or {}
+        clients = manifest.get('clients')
+    if not isinstance(clients, list) or not clients:
+        raise ValueError("Manifest must list at least one client")
+
+    base = path.resolve().parent
+    jobs, slugs = [], set()
+    for i, client in enumerate(clients):
+        if not isinstance(client, dict):
+            raise ValueError(f"Client #{i + 1} must be an object")
+        job = client_job({**defaults, **client}, base, f"Client #{i + 1}")
+        if job.slug in slugs:
+            job = job._replace(slug=f"{job.slug}-{i + 1}")
+        slugs.add(job.slug)
+        jobs.append(job)
+    return jobs
+
+
+def client_job(entry: Dict[str, Any], base: Path, label: str = 'Client') -> BatchJob:
+    """Validate one client entry (manifest keys, see ``load_manifest``).
+
+    Args:
+        entry: Client entry with defaults applied
+        base: Directory relative paths are resolved against
+        label: How the entry is named in error messages
+
+    Returns:
+        Job for the entry
+
+    Raises:
+        ValueError: If the entry is invalid
+    """
+    unknown = sorted(set(entry) - set(MANIFEST_KEYS))
+    if unknown:
+        raise ValueError(f"{label} has unknown keys {unknown}")
+    if not entry.get('brand_name') or not entry.get('data_dir'):
+        raise ValueError(f"{label} needs brand_name and data_dir")
+    website_type = entry.get('website_type', 'ecommerce')
+    if website_type not in WEBSITE_TYPES:
+        raise ValueError(f"{label} has unknown website_type {website_type!r}")
+
+    config = entry.get('config')
+    return BatchJob(
+        brand_name=str(entry['brand_name']),
+        data_dir=Path(base) / entry['data_dir'],
+        website_type=website_type,
+        config_path=Path(base) / config if config else None,
+        slug=_slug(str(entry['brand_name'])),
+    )
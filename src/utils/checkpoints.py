@@ -0,0 +1,183 @@
+"""Phase checkpoints: approved phase results saved for resuming a run."""
+import os
+import json
+import hashlib
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, NamedTuple, Optional
+from src.analyzers.result_cache import code_version
+from src.data_ingestion.archives import source_digest
+from src.data_ingestion.data_loader import discover_sources
+from src.data_ingestion.manifest import DataManifest, ManifestEntry, source_id
+from src.models import audit_data
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_DIR = Path('.cache') / 'checkpoints'
+# Bump to invalidate every checkpoint when the file format changes
+CHECKPOINT_VERSION = 1
+
+
+class Checkpoint(NamedTuple):
+    """Results of one phase as loaded from its checkpoint."""
+    phase: int
+    results: Dict[str, Any]
+    digest: str
+    created_at: str
+
+
+def _dump_results(results: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        key: {'model': type(value).__name__, 'data': value.model_dump(mode='json')}
+        if hasattr(value, 'model_dump') else {'model': None, 'data': value}
+        for key, value in results.items()
+    }
+
+
+def _load_results(stored: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        key: getattr(audit_data, entry['model']).model_validate(entry['data'])
+        if entry['model'] else entry['data']
+        for key, entry in stored.items()
+    }
+
+
+class PhaseCheckpoints:
+    """Checkpoints of one client's data directory, one JSON file per phase.
+
+    A Phase 1 checkpoint records the insights as serialized models, the
+    mtime, size and content digest of every data file the run read, the
+    options the results depend on and the analysis code version. Loading
+    checks all of them: a checkpoint whose data files were added, removed
+    or edited (touching a file without changing it is fine), whose options
+    differ or that an older tool wrote is deleted instead of used. A Phase 2
+    checkpoint records the digest of the Phase 1 checkpoint it was built
+    from and is only valid alongside it.
+    """
+
+    def __init__(self, data_dir: Path, brand_name: str,
+                 checkpoint_dir: Path = DEFAULT_CHECKPOINT_DIR):
+        """Initialize checkpoints.
+
+        Args:
+            data_dir: Client data directory
+            brand_name: Client brand name
+            checkpoint_dir: Directory holding every client's checkpoints
+        """
+        self.data_dir = Path(data_dir)
+        self.brand_name = brand_name
+        key = hashlib.sha256(f"{self.data_dir.resolve()}\n{brand_name}".encode('utf-8')).hexdigest()[:16]
+        self.directory = Path(checkpoint_dir) / key
+
+    def path(self, phase: int) -> Path:
+        """Checkpoint file of a phase."""
+        return self.directory / f"phase{phase}.json"
+
+    def save(self, phase: int, results: Dict[str, Any], options: Dict[str, Any],
+             inputs: Optional[Dict[str, ManifestEntry]] = None, excluded: Iterable[str] = (),
+             parent: Optional[str] = None) -> Optional[str]:
+        """Write a phase's checkpoint atomically.
+
+        Args:
+            phase: Phase number
+            results: The phase's results
+            options: Options the results depend on
+            inputs: Manifest entries of the data files the run read (Phase 1)
+            excluded: Source ids of data files left out of the analysis (Phase 1)
+            parent: Digest of the Phase 1 checkpoint (Phase 2)
+
+        Returns:
+            Digest of the checkpoint, or None if it could not be written
+        """
+        sources = {source_id(source): source for source in discover_sources(self.data_dir)} if inputs else {}
+        files = {}
+        for sid, entry in (inputs or {}).items():
+            if entry.digest is None and sid in sources:
+                # Recorded without a digest (parsed frame cache off)
+                entry = entry._replace(digest=source_digest(sources[sid]))
+            files[sid] = entry._asdict()
+
+        stored = _dump_results(results)
+        digest = hashlib.sha256(json.dumps(stored, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+        checkpoint = {
+            'version': CHECKPOINT_VERSION,
+            'phase': phase,
+            'code': code_version(),
+            'brand_name': self.brand_name,
+            'data_dir': str(self.data_dir.resolve()),
+            'options': options,
+            'inputs': files,
+            'excluded': sorted(excluded),
+            'parent': parent,
+            'digest': digest,
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'results': stored,
+        }
+
+        path = self.path(phase)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(checkpoint, f, default=str)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write Phase {phase} checkpoint {path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return None
+        logger.info(f"Saved Phase {phase} checkpoint {path}")
+        return digest
+
+    def load(self, phase: int, options: Dict[str, Any], parent: Optional[str] = None) -> Optional[Checkpoint]:
+        """Read a phase's checkpoint if it is still valid, deleting it if not.
+
+        Args:
+            phase: Phase number
+            options: Options of the current run
+            parent: Digest of the Phase 1 checkpoint in use (Phase 2 only)
+
+        Returns:
+            Checkpoint, or None if there is none or it is stale
+        """
+        path = self.path(phase)
+        if not path.exists():
+            logger.warning(f"No Phase {phase} checkpoint for {self.brand_name} in {self.directory}")
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            problem = self._problem(stored, phase, options, parent)
+            if problem is None:
+                return Checkpoint(phase, _load_results(stored['results']), stored['digest'], stored['created_at'])
+        except Exception as e:
+            problem = f"unreadable ({e})"
+
+        logger.warning(f"Discarding Phase {phase} checkpoint: {problem}")
+        path.unlink(missing_ok=True)
+        return None
+
+    def _problem(self, stored: Dict[str, Any], phase: int, options: Dict[str, Any],
+                 parent: Optional[str]) -> Optional[str]:
+        """Why a checkpoint cannot be used (None if it can)."""
+        if stored.get('version') != CHECKPOINT_VERSION or stored.get('phase') != phase:
+            return "written by another version of the tool"
+        if stored.get('code') != code_version():
+            return "the analysis code changed"
+        if stored.get('options') != json.loads(json.dumps(options, default=str)):
+            return "options (website type or thresholds) changed"
+        if parent is not None:
+            if stored.get('parent') != parent:
+                return "the Phase 1 checkpoint it was built from changed"
+            return None
+
+        manifest = DataManifest()
+        manifest.entries = {sid: ManifestEntry(**entry) for sid, entry in stored['inputs'].items()}
+        excluded = set(stored.get('excluded') or ())
+        changes = manifest.diff([source for source in discover_sources(self.data_dir)
+                                 if source_id(source) not in excluded])
+        if changes:
+            return (f"data files changed ({len(changes.added)} added, {len(changes.changed)} changed, "
+                    f"{len(changes.removed)} removed)")
+        return None
@@ -0,0 +1,65 @@
+"""Audit configuration: priority thresholds and their defaults."""
+import copy
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+WEBSITE_TYPES = ['ecommerce', 'saas', 'content', 'local', 'marketplace']
+
+# Section -> priority level -> threshold name -> value. Mirrors
+# "priority_thresholds" in config/example_config.json.
+Thresholds = Dict[str, Dict[str, Dict[str, float]]]
+
+DEFAULT_PRIORITY_THRESHOLDS: Thresholds = {
+    'organic_traffic': {
+        'critical': {'organic_pct_below': 30},
+        'high': {'yoy_decline_above': 15, 'page_2_plus_keywords_above': 50},
+    },
+    'site_health': {
+        'critical': {'health_score_below': 60},
+        'high': {'health_score_below': 75},
+        'medium': {'health_score_below': 85},
+    },
+    'engagement': {
+        'high': {'engagement_rate_drop_above': 10, 'avg_engagement_time_below_seconds': 30},
+    },
+}
+
+
+def load_config(path: Path) -> Dict[str, Any]:
+    """Read a JSON configuration file (see config/example_config.json).
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If it is not valid JSON
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def priority_thresholds(config: Optional[Dict[str, Any]] = None) -> Thresholds:
+    """Default thresholds overridden by a configuration's "priority_thresholds"."""
+    thresholds = copy.deepcopy(DEFAULT_PRIORITY_THRESHOLDS)
+    for section, levels in ((config or {}).get('priority_thresholds') or {}).items():
+        for level, values in (levels or {}).items():
+            thresholds.setdefault(section, {}).setdefault(level, {}).update(values or {})
+    return thresholds
+
+
+def threshold(section_thresholds: Optional[Dict[str, Dict[str, float]]], section: str,
+              level: str, name: str) -> float:
+    """Look up one threshold of a section, falling back to its default.
+
+    Args:
+        section_thresholds: Level -> name -> value for the section (None for defaults)
+        section: Section name (e.g. 'engagement')
+        level: Priority level (e.g. 'high')
+        name: Threshold name (e.g. 'engagement_rate_drop_above')
+
+    Returns:
+        Threshold value
+    """
+    value = ((section_thresholds or {}).get(level) or {}).get(name)
+    if value is None:
+        value = DEFAULT_PRIORITY_THRESHOLDS[section][level][name]
+    return value
@@ -0,0 +1,122 @@
+"""Unattended runs: approval policies, run artifacts and exit codes."""
+import os
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Process exit statuses (2 is left to click for usage errors)
+EXIT_SUCCESS = 0
+EXIT_FAILED = 1
+EXIT_NO_DATA = 3
+EXIT_NOT_APPROVED = 4
+
+# Exit code -> run status reported in run.json
+RUN_STATUS = {
+    EXIT_SUCCESS: 'completed',
+    EXIT_FAILED: 'failed',
+    EXIT_NO_DATA: 'no_data',
+    EXIT_NOT_APPROVED: 'not_approved',
+}
+
+PRIORITY_ORDER = {'C': 0, 'H': 1, 'M': 2, 'L': 3}
+
+# Policy -> priorities that stop the run at a phase gate
+APPROVAL_POLICIES: Dict[str, Tuple[str, ...]] = {
+    'always': (),
+    'no-critical': ('C',),
+    'no-high': ('C', 'H'),
+}
+DEFAULT_APPROVAL_POLICY = 'no-critical'
+
+
+def section_priorities(results: Dict[str, Any]) -> Dict[str, str]:
+    """Priority of every section in a phase's results.
+
+    Sections nested one level down (the pillars of the findings summary)
+    are reported as 'parent.child'.
+
+    Args:
+        results: Phase 1 insights or Phase 2 narrative
+
+    Returns:
+        Section name -> priority
+    """
+    priorities = {}
+    for key, value in results.items():
+        priority = getattr(value, 'priority', None)
+        if priority is not None:
+            priorities[key] = priority
+            continue
+        for field in getattr(type(value), 'model_fields', {}):
+            nested = getattr(getattr(value, field), 'priority', None)
+            if nested is not None:
+                priorities[f"{key}.{field}"] = nested
+    return priorities
+
+
+def apply_policy(policy: str, results: Dict[str, Any]) -> Tuple[bool, List[str]]:
+    """Decide a phase gate without asking.
+
+    Args:
+        policy: Name from ``APPROVAL_POLICIES``
+        results: The phase's results
+
+    Returns:
+        Tuple of (approved, sections that blocked approval)
+    """
+    stop_on = APPROVAL_POLICIES[policy]
+    priorities = section_priorities(results)
+    blocking = sorted((key for key, priority in priorities.items() if priority in stop_on),
+                      key=lambda key: PRIORITY_ORDER[priorities[key]])
+    return not blocking, blocking
+
+
+def to_jsonable(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Phase results with pydantic models dumped to JSON-compatible values."""
+    return {
+        key: value.model_dump(mode='json') if hasattr(value, 'model_dump') else value
+        for key, value in results.items()
+    }
+
+
+class RunArtifacts:
+    """Directory of JSON files describing one unattended run.
+
+    Each phase's results are written as it completes and ``run.json``
+    (status, exit code, gate decisions, timings) when the run ends, so a
+    run that stops early still leaves a record of how far it got.
+    """
+
+    def __init__(self, directory: Path):
+        """Initialize artifacts directory.
+
+        Args:
+            directory: Directory to write to (created if missing)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def write(self, name: str, data: Any) -> Optional[Path]:
+        """Write one JSON artifact atomically.
+
+        Args:
+            name: File stem (e.g. 'phase1')
+            data: JSON-serializable content
+
+        Returns:
+            Path written, or None if it could not be written
+        """
+        path = self.directory / f"{name}.json"
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            os.replace(tmp_path, path)
+            return path
+        except OSError as e:
+            logger.error(f"Could not write run artifact {path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return None